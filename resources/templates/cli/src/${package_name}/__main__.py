@@ -0,0 +1,5 @@
+"""Entry point for running the package as a module."""
+
+from ${package_name}.cli import app
+
+app()
@@ -0,0 +1,14 @@
+"""${project_name} command-line interface."""
+
+import typer
+
+app = typer.Typer()
+
+
+@app.command()
+def hello(name: str = typer.Argument("world", help="Who to greet")) -> None:
+    typer.echo(f"Hello, {name}!")
+
+
+if __name__ == "__main__":
+    app()
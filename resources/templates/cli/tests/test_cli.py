@@ -0,0 +1,11 @@
+"""Tests for the ${project_name} CLI."""
+
+from typer.testing import CliRunner
+
+from ${package_name}.cli import app
+
+
+def test_hello():
+    result = CliRunner().invoke(app, ["tester"])
+    assert result.exit_code == 0
+    assert "Hello, tester!" in result.output
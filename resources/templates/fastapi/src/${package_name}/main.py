@@ -0,0 +1,12 @@
+"""${project_name} application."""
+
+from fastapi import FastAPI
+
+from ${package_name} import __version__
+
+app = FastAPI(title="${project_name}", version=__version__)
+
+
+@app.get("/health")
+def health() -> dict:
+    return {"status": "ok"}
@@ -0,0 +1,11 @@
+"""Tests for the ${project_name} application."""
+
+from fastapi.testclient import TestClient
+
+from ${package_name}.main import app
+
+
+def test_health():
+    response = TestClient(app).get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
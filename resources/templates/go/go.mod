@@ -0,0 +1,3 @@
+module ${package_name}
+
+go 1.21
@@ -0,0 +1,9 @@
+package main
+
+import "testing"
+
+func TestGreet(t *testing.T) {
+	if got := greet("tester"); got != "Hello, tester!" {
+		t.Errorf("greet() = %q", got)
+	}
+}
@@ -0,0 +1,3 @@
+"""${summary}"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,7 @@
+"""Tests for ${package_name}."""
+
+import ${package_name}
+
+
+def test_version():
+    assert ${package_name}.__version__ == "0.1.0"
@@ -0,0 +1,7 @@
+export function greet(name) {
+  return "Hello, " + name + "!";
+}
+
+if (import.meta.url === "file://" + process.argv[1]) {
+  console.log(greet("world"));
+}
@@ -0,0 +1,8 @@
+import assert from "node:assert/strict";
+import { test } from "node:test";
+
+import { greet } from "../src/index.js";
+
+test("greet", () => {
+  assert.equal(greet("tester"), "Hello, tester!");
+});
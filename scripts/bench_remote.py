@@ -0,0 +1,72 @@
+"""Benchmark remote repository creation against the local mock API.
+
+    python scripts/bench_remote.py                     # 32 repos
+    python scripts/bench_remote.py --repos 100 --latency 0.1 --handshake 0.15
+
+Compares one request per fresh connection (no keep-alive), sequential
+requests over one pooled connection, and concurrent requests over the pool.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from project_setup import remote  # noqa: E402
+from project_setup.mock_remote import MockHostingServer  # noqa: E402
+
+
+def run(server: MockHostingServer, prefix: str, repos: int, workers: int, pool: int):
+    client = remote.HostingClient(server.url, token="bench", pool_size=pool)
+    specs = [remote.RepoSpec(f"{prefix}-{i}") for i in range(repos)]
+    start = time.perf_counter()
+    with client:
+        results = remote.create_repositories(client, specs, workers=workers)
+    elapsed = time.perf_counter() - start
+    failed = sum(isinstance(r, remote.RemoteError) for r in results)
+    return elapsed, client.connections_opened, failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument(
+        "--handshake",
+        type=float,
+        default=0.1,
+        help="Simulated TCP+TLS connection setup, in seconds",
+    )
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = MockHostingServer(
+            Path(tmp), latency=args.latency, token="bench", handshake=args.handshake
+        )
+        with server:
+            cases = [
+                ("no keep-alive", 1, 0),
+                ("keep-alive, sequential", 1, 1),
+                (f"keep-alive, {args.workers} workers", args.workers, args.workers),
+            ]
+            print(
+                f"{args.repos} repositories, {args.latency * 1000:.0f} ms latency, "
+                f"{args.handshake * 1000:.0f} ms connection setup"
+            )
+            for i, (label, workers, pool) in enumerate(cases):
+                elapsed, connections, failed = run(
+                    server, f"case{i}", args.repos, workers, pool
+                )
+                print(
+                    f"  {label:<26} {elapsed:7.2f} s  "
+                    f"{args.repos / elapsed:7.1f} repos/s  "
+                    f"{connections:3d} connections  {failed} failed"
+                )
+
+
+if __name__ == "__main__":
+    main()
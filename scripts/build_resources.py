@@ -0,0 +1,37 @@
+"""Build the packaged resources from their sources under ``resources/``.
+
+Run from the repository root after editing a template or gitignore file:
+
+    python scripts/build_resources.py
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from project_setup.gitignore import CATALOG, build_catalog  # noqa: E402
+from project_setup.templates import (  # noqa: E402
+    BUILTIN_TEMPLATE_DIR,
+    TEMPLATE_SUFFIX,
+    pack_template,
+)
+
+
+def build_templates() -> None:
+    for src_dir in sorted((ROOT / "resources" / "templates").iterdir()):
+        if src_dir.is_dir():
+            bundle = BUILTIN_TEMPLATE_DIR / f"{src_dir.name}{TEMPLATE_SUFFIX}"
+            dest = pack_template(src_dir, bundle)
+            print(f"Built: {dest.relative_to(ROOT)}")
+
+
+def build_gitignore() -> None:
+    dest = build_catalog(ROOT / "resources" / "gitignore", CATALOG)
+    print(f"Built: {dest.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    build_templates()
+    build_gitignore()
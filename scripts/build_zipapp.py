@@ -0,0 +1,210 @@
+"""Build a self-contained zipapp of project-setup and its dependencies.
+
+    python scripts/build_zipapp.py                 # -> dist/project-setup.pyz
+    python scripts/build_zipapp.py --measure 10    # build, then compare startup
+
+The archive contains ``project_setup`` and the runtime dependencies it
+imports (typer and what typer needs) as precompiled, sourceless ``.pyc``
+files stored uncompressed, so zipimport can load each module with one read
+and no compilation. typer's optional rich output is left out and switched
+off (``TYPER_USE_RICH=0``), which keeps the archive, and the zip directory
+read at startup, small. The bytecode is specific to the Python version
+that built the archive; the archive refuses to start under any other
+version.
+
+Run it with ``python project-setup.pyz project-init ...``.
+"""
+
+import argparse
+import compileall
+import importlib.metadata
+import importlib.util
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import List, Set
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = ROOT / "src" / "project_setup"
+DEFAULT_OUTPUT = ROOT / "dist" / "project-setup.pyz"
+
+# typer's rich formatting; project-setup's commands do not use it.
+OPTIONAL_DISTRIBUTIONS = {"rich", "pygments", "markdown-it-py", "mdurl"}
+
+MAIN_TEMPLATE = '''import os
+import sys
+
+if sys.version_info[:2] != {version}:
+    sys.exit(
+        "project-setup.pyz was built for Python {dotted}; "
+        "run it with that interpreter or rebuild it."
+    )
+
+# rich is not in the archive.
+os.environ.setdefault("TYPER_USE_RICH", "0")
+
+from project_setup.cli import main
+
+main()
+'''
+
+
+def _requirement_name(requirement: str) -> str:
+    return re.split(r"[\s\[;<>=!~(]", requirement, maxsplit=1)[0]
+
+
+def unused_distributions() -> Set[str]:
+    """Return the declared dependencies the archive can leave out."""
+    unused = set(OPTIONAL_DISTRIBUTIONS)
+    # typer releases that vendor click do not import the click distribution.
+    if importlib.util.find_spec("typer._click") is not None:
+        unused.add("click")
+    return unused
+
+
+def runtime_distributions(root: str = "project-setup") -> List[str]:
+    """Return the installed distributions ``root`` needs at runtime."""
+    seen: Set[str] = set()
+    unused = unused_distributions()
+    pending = [_requirement_name(r) for r in _root_requirements(root)]
+    while pending:
+        name = pending.pop()
+        key = name.lower().replace("_", "-")
+        if key in seen or key in unused:
+            continue
+        try:
+            dist = importlib.metadata.distribution(name)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+        seen.add(key)
+        for requirement in dist.requires or []:
+            if "extra ==" not in requirement:
+                pending.append(_requirement_name(requirement))
+    return sorted(seen)
+
+
+def _root_requirements(root: str) -> List[str]:
+    try:
+        return importlib.metadata.requires(root) or []
+    except importlib.metadata.PackageNotFoundError:
+        return ["typer", "click"]
+
+
+def stage(staging: Path) -> None:
+    """Copy the package and its dependencies into ``staging``."""
+    shutil.copytree(
+        PACKAGE_DIR,
+        staging / "project_setup",
+        ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+    )
+    for name in runtime_distributions():
+        dist = importlib.metadata.distribution(name)
+        for file in dist.files or []:
+            parts = Path(file).parts
+            if parts[0] in ("..", "project_setup") or "__pycache__" in parts:
+                continue
+            if file.suffix in (".pyc", ".so", ".pyd") or parts[0].endswith(".data"):
+                continue
+            src = Path(dist.locate_file(file))
+            if not src.is_file():
+                continue
+            dest = staging / file
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dest)
+
+
+def compile_sourceless(staging: Path) -> None:
+    """Compile every module next to its source, then drop the sources."""
+    if not compileall.compile_dir(
+        str(staging), quiet=1, legacy=True, workers=0
+    ):
+        raise SystemExit("Error: bytecode compilation failed")
+    for source in staging.rglob("*.py"):
+        if source.with_suffix(".pyc").exists():
+            source.unlink()
+
+
+def write_archive(staging: Path, output: Path) -> None:
+    (staging / "__main__.py").write_text(
+        MAIN_TEMPLATE.format(
+            version=tuple(sys.version_info[:2]),
+            dotted="{}.{}".format(*sys.version_info[:2]),
+        )
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(output.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(b"#!/usr/bin/env python3\n")
+        # Stored, not deflated: zipimport then reads each .pyc without inflating.
+        with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_STORED) as archive:
+            for path in sorted(staging.rglob("*")):
+                if path.is_file():
+                    archive.write(path, path.relative_to(staging).as_posix())
+    tmp.chmod(0o755)
+    os.replace(tmp, output)
+
+
+def build(output: Path) -> Path:
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = Path(tmp)
+        stage(staging)
+        compile_sourceless(staging)
+        write_archive(staging, output)
+    return output
+
+
+def _median_ms(cmd: List[str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def measure(output: Path, runs: int) -> None:
+    """Compare ``--help`` startup of the zipapp and the installed commands."""
+    candidates = [
+        ("zipapp", [sys.executable, str(output), "--help"]),
+        ("python -m project_setup", [sys.executable, "-m", "project_setup", "--help"]),
+    ]
+    for script in ("project-setup", "project-init"):
+        path = shutil.which(script)
+        if path:
+            candidates.append((script, [path, "--help"]))
+
+    print(f"Startup time, median of {runs} runs:")
+    for label, cmd in candidates:
+        try:
+            print(f"  {label:<26} {_median_ms(cmd, runs):8.1f} ms")
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"  {label:<26} failed: {e}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--measure",
+        type=int,
+        metavar="RUNS",
+        default=0,
+        help="Compare startup time against the installed entry points",
+    )
+    args = parser.parse_args()
+
+    output = build(args.output)
+    print(f"Built: {output} ({output.stat().st_size // 1024} KiB)")
+    if args.measure:
+        measure(output, args.measure)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,3 @@
 """Project Setup - A tool for setting up new projects."""
+
+__version__ = "0.1.0"
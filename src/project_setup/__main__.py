@@ -1,5 +1,5 @@
 """Entry point for running the package as a module."""
 
-from project_setup.proj_setup import app
+from project_setup.cli import main
 
-app()
+main()
@@ -0,0 +1,108 @@
+"""Cache store CLI command."""
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from project_setup import cache_store, hooks, languages, mirrors
+
+cache_app = typer.Typer(
+    add_completion=False,
+    rich_markup_mode=None,
+    help="Inspect and prune the shared cache.",
+)
+
+
+def _selected(namespace: Optional[str]):
+    names = cache_store.namespaces()
+    if namespace:
+        if namespace not in names:
+            typer.echo(f"Error: Unknown cache namespace '{namespace}'", err=True)
+            raise typer.Exit(code=1)
+        names = [namespace]
+    return [cache_store.CacheStore(name) for name in names]
+
+
+@cache_app.command("stats")
+def stats_cmd(
+    namespace: Optional[str] = typer.Option(
+        None, "--namespace", help="Only show this namespace"
+    ),
+) -> None:
+    """Show entries and size per cache namespace."""
+    typer.echo(f"Cache: {cache_store.store_root()}")
+    for store in _selected(namespace):
+        info = store.stats()
+        typer.echo(
+            f"  {info['namespace']:<10} {info['entries']:>5} entries  "
+            f"{cache_store.format_size(info['size']):>10} / "
+            f"{cache_store.format_size(info['budget'])}"
+        )
+
+
+@cache_app.command("prune")
+def prune_cmd(
+    namespace: Optional[str] = typer.Option(
+        None, "--namespace", help="Only prune this namespace"
+    ),
+    max_size: Optional[str] = typer.Option(
+        None, "--max-size", help="Evict down to this size, e.g. 100M"
+    ),
+    max_age_days: Optional[float] = typer.Option(
+        None, "--max-age-days", help="Remove entries unused for this many days"
+    ),
+    clear: bool = typer.Option(False, "--all", help="Remove every entry"),
+) -> None:
+    """Evict least recently used entries down to the budgets."""
+    limit = None
+    if max_size:
+        try:
+            limit = cache_store.parse_size(max_size)
+        except ValueError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(code=1)
+    max_age = max_age_days * 86400 if max_age_days is not None else None
+
+    total_removed = total_freed = 0
+    for store in _selected(namespace):
+        removed, freed = store.prune(max_size=limit, max_age=max_age, clear=clear)
+        if removed:
+            typer.echo(
+                f"  {store.namespace}: removed {removed} entries "
+                f"({cache_store.format_size(freed)})"
+            )
+        total_removed += removed
+        total_freed += freed
+    typer.echo(
+        f"Removed {total_removed} entries, freed {cache_store.format_size(total_freed)}"
+    )
+
+
+@cache_app.command("warm-hooks")
+def warm_hooks_cmd(
+    language: Optional[List[str]] = typer.Option(
+        None, "--language", help="Only this language's hooks (repeatable)"
+    ),
+) -> None:
+    """Install the pre-commit hook environments ahead of time."""
+    try:
+        reports = hooks.warm(language or languages.names())
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Hook cache: {hooks.hook_home()}")
+    for name, report in reports:
+        typer.echo(f"  {name:<8} {report.describe()}")
+    if not all(report.installed for _, report in reports):
+        raise typer.Exit(code=1)
+
+
+@cache_app.command("fill-mirror", hidden=True)
+def fill_mirror_cmd(
+    url: str = typer.Argument(..., help="URL the clone was made from"),
+    clone: Path = typer.Argument(..., help="Local clone to mirror"),
+) -> None:
+    """Publish the mirror of URL from a local clone (run by git-setup)."""
+    if not mirrors.refresh(url, clone):
+        raise typer.Exit(code=1)
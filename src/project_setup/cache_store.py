@@ -0,0 +1,333 @@
+"""Shared on-disk cache store.
+
+Expensive, reusable artifacts (tool probe results, clone mirrors, generated
+project trees...) are kept in namespaces under
+``<cache dir>/store/<namespace>/<key>/``. Entries are built in a staging
+directory and published with a rename, so readers never see a partial
+entry. Each namespace has a lock file: readers hold it shared while they
+use an entry, and publishing and eviction hold it exclusively, so
+concurrent ``project-init`` processes never remove an entry in use.
+
+Every namespace has a size budget. After each publish, the least recently
+used entries are evicted until the namespace fits. Entries pinned by a path
+that still exists (e.g. a venv layered on a shared base) are never evicted,
+only removed by an explicit ``prune(clear=True)``. Budgets can be set with
+``PROJECT_SETUP_CACHE_BUDGETS``, e.g. ``mirrors=1G,results=100M``.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from project_setup import paths
+from project_setup.locking import file_lock
+
+BUDGET_ENV = "PROJECT_SETUP_CACHE_BUDGETS"
+ENTRY_META = ".entry.json"
+LOCK_NAME = ".lock"
+PINS_DIR = ".pins"
+
+MiB = 1024 * 1024
+DEFAULT_BUDGET = 256 * MiB
+BUDGETS = {
+    "probes": 1 * MiB,
+    "results": 256 * MiB,
+    "mirrors": 2048 * MiB,
+    "bases": 4096 * MiB,
+}
+
+# Staging directories left behind by a crashed process are removed by prune.
+STALE_STAGING_SECONDS = 3600
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9._-]*$")
+_UNITS = {"": 1, "K": 1024, "M": MiB, "G": 1024 * MiB}
+
+
+class Entry(NamedTuple):
+    key: str
+    path: Path
+    size: int
+    created: float
+    last_used: float
+
+
+def store_root() -> Path:
+    return paths.cache_dir() / "store"
+
+
+def key_for(text: str) -> str:
+    """Return a cache key derived from ``text``."""
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def parse_size(text: str) -> int:
+    """Parse a size such as ``512``, ``64K``, ``100M`` or ``2G``."""
+    match = re.fullmatch(r"\s*(\d+)\s*([KMG]?)i?B?\s*", text, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size: {text!r}")
+    return int(match.group(1)) * _UNITS[match.group(2).upper()]
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def budgets() -> Dict[str, int]:
+    """Return the per-namespace budgets, including overrides from the env."""
+    result = dict(BUDGETS)
+    for item in os.environ.get(BUDGET_ENV, "").split(","):
+        name, sep, value = item.partition("=")
+        if not sep:
+            continue
+        try:
+            result[name.strip()] = parse_size(value)
+        except ValueError:
+            continue
+    return result
+
+
+def namespaces() -> List[str]:
+    """Return the known namespaces and any found on disk."""
+    found = set(BUDGETS)
+    try:
+        found.update(p.name for p in store_root().iterdir() if p.is_dir())
+    except OSError:
+        pass
+    return sorted(found)
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _make_writable(func, path, _exc_info) -> None:
+    # Entries may hold read-only trees; their directories must be writable
+    # for their contents to be deleted.
+    try:
+        os.chmod(os.path.dirname(path), 0o755)
+        os.chmod(path, 0o755)
+        func(path)
+    except OSError:
+        pass
+
+
+def _remove(path: Path) -> None:
+    # Rename first so a crash mid-delete never leaves a half-removed entry.
+    trash = path.with_name(f".trash-{path.name}-{os.getpid()}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        return
+    shutil.rmtree(trash, onerror=_make_writable)
+
+
+class CacheStore:
+    """One namespace of the cache store."""
+
+    def __init__(
+        self,
+        namespace: str,
+        budget: Optional[int] = None,
+        root: Optional[Path] = None,
+    ) -> None:
+        if not _NAME_RE.match(namespace):
+            raise ValueError(f"Invalid cache namespace: {namespace!r}")
+        self.namespace = namespace
+        self.path = Path(root or store_root()) / namespace
+        self.budget = (
+            budget if budget is not None else budgets().get(namespace, DEFAULT_BUDGET)
+        )
+
+    def lock(self, shared: bool = False):
+        return file_lock(self.path / LOCK_NAME, shared=shared)
+
+    def entry_path(self, key: str) -> Path:
+        if not _NAME_RE.match(key):
+            raise ValueError(f"Invalid cache key: {key!r}")
+        return self.path / key
+
+    def _read_entry(self, path: Path) -> Optional[Entry]:
+        meta_path = path / ENTRY_META
+        try:
+            meta = json.loads(meta_path.read_text())
+            last_used = meta_path.stat().st_mtime
+        except (OSError, ValueError):
+            return None
+        return Entry(
+            path.name,
+            path,
+            int(meta.get("size", 0)),
+            float(meta.get("created", 0)),
+            last_used,
+        )
+
+    def entry(self, key: str) -> Optional[Entry]:
+        return self._read_entry(self.entry_path(key))
+
+    def entries(self) -> List[Entry]:
+        try:
+            children = [p for p in self.path.iterdir() if not p.name.startswith(".")]
+        except OSError:
+            return []
+        found = (self._read_entry(p) for p in children if p.is_dir())
+        return [e for e in found if e is not None]
+
+    def pin(self, key: str, holder: Path) -> None:
+        """Keep ``key`` from eviction for as long as ``holder`` exists."""
+        pins = self.entry_path(key) / PINS_DIR
+        pins.mkdir(exist_ok=True)
+        holder = Path(holder).resolve()
+        (pins / key_for(str(holder))).write_text(str(holder))
+
+    def pinned(self, entry: Entry) -> bool:
+        try:
+            pins = list((entry.path / PINS_DIR).iterdir())
+        except OSError:
+            return False
+        for pin in pins:
+            try:
+                if Path(pin.read_text()).exists():
+                    return True
+            except OSError:
+                continue
+        return False
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the entry directory for ``key`` and mark it as used."""
+        path = self.entry_path(key)
+        try:
+            # The metadata file's mtime is the entry's last use, for LRU.
+            os.utime(path / ENTRY_META)
+        except OSError:
+            return None
+        return path
+
+    @contextmanager
+    def reading(self, key: str) -> Iterator[Optional[Path]]:
+        """Yield the entry for ``key`` (or None), protected from eviction."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self.lock(shared=True):
+            yield self.get(key)
+
+    def publish(
+        self, key: str, build: Callable[[Path], None], replace: bool = False
+    ) -> bool:
+        """Build an entry with ``build(staging_dir)`` and publish it atomically.
+
+        Returns False if the entry already exists (and ``replace`` is not
+        set), e.g. because a concurrent process published it first.
+        """
+        entry = self.entry_path(key)
+        if not replace and self.entry(key) is not None:
+            return False
+        self.path.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.path))
+        try:
+            build(staging)
+            meta = {"key": key, "size": _tree_size(staging), "created": time.time()}
+            (staging / ENTRY_META).write_text(json.dumps(meta))
+            with self.lock():
+                if entry.exists():
+                    if not replace:
+                        return False
+                    _remove(entry)
+                os.rename(staging, entry)
+                self._evict(self.budget, keep=key)
+            return True
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def get_json(self, key: str):
+        """Return the JSON value stored under ``key``, or None."""
+        path = self.get(key)
+        if path is None:
+            return None
+        try:
+            return json.loads((path / "value.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put_json(self, key: str, value, replace: bool = False) -> bool:
+        def build(staging: Path) -> None:
+            (staging / "value.json").write_text(json.dumps(value))
+
+        return self.publish(key, build, replace=replace)
+
+    def _evict(self, budget: int, keep: Optional[str] = None) -> Tuple[int, int]:
+        # Callers hold the exclusive lock.
+        entries = sorted(self.entries(), key=lambda e: e.last_used)
+        total = sum(e.size for e in entries)
+        removed = freed = 0
+        for entry in entries:
+            if total <= budget:
+                break
+            if entry.key == keep or self.pinned(entry):
+                continue
+            _remove(entry.path)
+            total -= entry.size
+            removed += 1
+            freed += entry.size
+        return removed, freed
+
+    def prune(
+        self,
+        max_size: Optional[int] = None,
+        max_age: Optional[float] = None,
+        clear: bool = False,
+    ) -> Tuple[int, int]:
+        """Evict entries; return (entries removed, bytes freed).
+
+        Without arguments, evicts down to the namespace budget. ``max_age``
+        removes entries not used for that many seconds; ``clear`` removes
+        every entry.
+        """
+        if not self.path.is_dir():
+            return 0, 0
+        with self.lock():
+            removed = freed = 0
+            now = time.time()
+            for child in self.path.iterdir():
+                if child.name.startswith((".tmp-", ".trash-")):
+                    try:
+                        stale = now - child.stat().st_mtime > STALE_STAGING_SECONDS
+                    except OSError:
+                        continue
+                    if stale:
+                        shutil.rmtree(child, ignore_errors=True)
+            for entry in self.entries():
+                expired = max_age is not None and now - entry.last_used > max_age
+                if clear or (expired and not self.pinned(entry)):
+                    _remove(entry.path)
+                    removed += 1
+                    freed += entry.size
+            more_removed, more_freed = self._evict(
+                self.budget if max_size is None else max_size
+            )
+        return removed + more_removed, freed + more_freed
+
+    def stats(self) -> Dict[str, object]:
+        entries = self.entries()
+        return {
+            "namespace": self.namespace,
+            "entries": len(entries),
+            "size": sum(e.size for e in entries),
+            "budget": self.budget,
+        }
@@ -0,0 +1,98 @@
+"""Top-level ``project-setup`` command group.
+
+Commands are registered by name and import path only. A command's module
+is imported when that command is invoked, so ``--help`` and each
+subcommand pay only for typer and the code they use.
+"""
+
+from typing import Dict, List, NamedTuple
+
+import typer
+import typer.core
+import typer.main
+
+
+class LazyCommand(NamedTuple):
+    module: str
+    attribute: str
+    help: str
+
+
+COMMANDS: Dict[str, LazyCommand] = {
+    "proj-setup": LazyCommand(
+        "project_setup.proj_setup", "proj_setup", "Scaffold a project directory."
+    ),
+    "templates": LazyCommand(
+        "project_setup.proj_setup", "templates_cmd", "List available project templates."
+    ),
+    "git-setup": LazyCommand(
+        "project_setup.git_setup", "git_setup", "Initialize or clone a Git repository."
+    ),
+    "venv-setup": LazyCommand(
+        "project_setup.venv_setup", "venv_setup", "Create a virtual environment."
+    ),
+    "cli-config": LazyCommand(
+        "project_setup.cli_config", "cli_config_cmd", "Configure opencode/claude."
+    ),
+    "project-init": LazyCommand(
+        "project_setup.project_init", "project_init", "Initialize a complete project."
+    ),
+    "remote-create": LazyCommand(
+        "project_setup.remote_cmd", "remote_create", "Create remote repositories."
+    ),
+    "cache": LazyCommand(
+        "project_setup.cache_cmd", "cache_app", "Inspect and prune the shared cache."
+    ),
+}
+
+
+def load_command(name: str):
+    """Import a registered command and build its click command."""
+    spec = COMMANDS[name]
+    # __import__ (unlike importlib.import_module) is visible to -X importtime.
+    module = __import__(spec.module, fromlist=[spec.attribute])
+    obj = getattr(module, spec.attribute)
+    if isinstance(obj, typer.Typer):
+        command = typer.main.get_command(obj)
+    else:
+        # Plain help output: typer's rich formatting costs ~100 ms to import.
+        app = typer.Typer(add_completion=False, rich_markup_mode=None)
+        app.command(name=name, help=spec.help)(obj)
+        command = typer.main.get_command(app)
+    command.name = name
+    return command
+
+
+class LazyGroup(typer.core.TyperGroup):
+    """Command group that imports its commands on first use."""
+
+    def list_commands(self, ctx) -> List[str]:
+        return sorted(set(COMMANDS) | set(self.commands))
+
+    def get_command(self, ctx, name: str):
+        if name in self.commands:
+            return self.commands[name]
+        if name not in COMMANDS:
+            return None
+        command = load_command(name)
+        self.commands[name] = command
+        return command
+
+    def format_commands(self, ctx, formatter) -> None:
+        rows = [(name, COMMANDS[name].help) for name in sorted(COMMANDS)]
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+app = typer.Typer(cls=LazyGroup, add_completion=False, rich_markup_mode=None)
+
+
+@app.callback()
+def root() -> None:
+    """A tool for setting up new coding projects."""
+
+
+def main() -> None:
+    """Entry point for the project-setup CLI command."""
+    app()
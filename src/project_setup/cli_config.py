@@ -1,12 +1,14 @@
 """CLI configuration command."""
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from project_setup import dedup, metrics, project_files
 
+
+@metrics.instrument("cli-config")
 def cli_config(
     project_dir: Optional[str] = None,
     workflow: Optional[str] = None,
@@ -49,6 +51,7 @@ def cli_config(
         if cli is None:
             cli = "both"
 
+    include_init = False
     if cli in ("opencode", "both"):
         if is_interactive:
             server_input = typer.prompt(
@@ -56,67 +59,53 @@ def cli_config(
                 default="local",
             )
             server = server_input if server_input else "local"
-        else:
-            if server is None:
-                server = "local"
+            include_init = typer.prompt(
+                "Create /init command script? (y/n)",
+                default="n",
+            ).lower() in ("y", "yes")
+        elif server is None:
+            server = "local"
+
+    if cli == "both" and is_interactive:
+        handoff_input = typer.prompt(
+            "Include handoff plugin? (y/n)",
+            default="n",
+        )
+        include_handoff = handoff_input.lower() in ("y", "yes")
 
-        opencode_config = {
-            "server": server,
-            "workflow": workflow,
-        }
+    files = project_files.cli_files(
+        cli, workflow, server, include_handoff, include_init
+    )
+    for path in dedup.write_tree(project_path, files):
+        typer.echo(f"Created: {path}")
 
-        opencode_dir = project_path / ".opencode"
-        opencode_dir.mkdir(parents=True, exist_ok=True)
+    typer.echo("CLI configuration complete!")
 
-        settings_file = opencode_dir / "settings.json"
-        with open(settings_file, "w") as f:
-            json.dump(opencode_config, f, indent=2)
 
-        typer.echo(f"Created: {settings_file}")
+def cli_config_cmd(
+    project_dir: Optional[str] = typer.Argument(None, help="Project directory path"),
+    workflow: Optional[str] = typer.Option(
+        None, "--workflow", help="Workflow type: agentic or assisted"
+    ),
+    cli: Optional[str] = typer.Option(
+        None, "--cli", help="CLI tool: opencode, claude, or both"
+    ),
+    server: Optional[str] = typer.Option(
+        None, "--server", help="Server mode for opencode: local or server"
+    ),
+    include_handoff: bool = typer.Option(
+        False, "--include-handoff", help="Include handoff plugin"
+    ),
+) -> None:
+    cli_config(
+        project_dir=project_dir,
+        workflow=workflow,
+        cli=cli,
+        server=server,
+        include_handoff=include_handoff,
+    )
 
-        if is_interactive:
-            include_init = typer.prompt(
-                "Create /init command script? (y/n)",
-                default="n",
-            )
-            if include_init.lower() in ("y", "yes"):
-                commands_dir = opencode_dir / "commands"
-                commands_dir.mkdir(exist_ok=True)
-                init_file = commands_dir / "init.py"
-                init_file.write_text(
-                    '#!/usr/bin/env python3\n"""Init command for opencode."""\n\n'
-                )
-                typer.echo(f"Created: {init_file}")
-
-    if cli in ("claude", "both"):
-        claude_config = {
-            "workflow": workflow,
-        }
-
-        claude_dir = project_path / ".claude"
-        claude_dir.mkdir(parents=True, exist_ok=True)
-
-        settings_file = claude_dir / "settings.json"
-        with open(settings_file, "w") as f:
-            json.dump(claude_config, f, indent=2)
-
-        typer.echo(f"Created: {settings_file}")
-
-    if cli == "both":
-        if is_interactive:
-            handoff_input = typer.prompt(
-                "Include handoff plugin? (y/n)",
-                default="n",
-            )
-            include_handoff = handoff_input.lower() in ("y", "yes")
-
-        if include_handoff:
-            mcp_dir = project_path / ".opencode" / "mcp"
-            mcp_dir.mkdir(parents=True, exist_ok=True)
-            handoff_file = mcp_dir / "handoff.py"
-            handoff_file.write_text(
-                "# Handoff plugin placeholder\n# This is a ROADMAP item for future implementation\n"
-            )
-            typer.echo(f"Created: {handoff_file}")
 
-    typer.echo("CLI configuration complete!")
+def main() -> None:
+    """Entry point for the cli-config CLI command."""
+    typer.run(cli_config_cmd)
@@ -0,0 +1,261 @@
+"""Content-addressed placement of generated files.
+
+Generated boilerplate (settings JSON, ``.editorconfig``, ``pytest.ini``,
+``.gitignore``...) is byte-identical across most projects. When dedup is
+enabled, file bodies are kept once in a content-addressed store and placed
+into projects as reflinks (copy-on-write clones) or, if requested,
+read-only hardlinks. Either falls back to a normal copy when the
+filesystem cannot share the data.
+
+A hardlinked file *is* the store object: a tool that rewrites it in place
+(a formatter, a pre-commit fixer, an editor writing in place) changes it
+for every project sharing it, whatever its mode says to root. Writes made
+here go through ``write_*``, which replaces rather than edits a shared
+file; ``detach_tree`` gives a project its own copies before tools run; and
+an object whose content no longer matches its digest is replaced before it
+is linked again.
+
+Dedup is configured through the environment; ``project-init`` enables it
+for its own process with ``enabled`` and passes ``child_env`` to the
+commands it runs:
+
+- ``PROJECT_SETUP_DEDUP``: ``reflink`` or ``hardlink`` (unset: off)
+- ``PROJECT_SETUP_DEDUP_STORE``: store location (default: cache dir)
+- ``PROJECT_SETUP_DEDUP_LOG``: file that collects per-file placement records
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Union
+
+from project_setup import metrics, paths
+
+DEDUP_ENV = "PROJECT_SETUP_DEDUP"
+STORE_ENV = "PROJECT_SETUP_DEDUP_STORE"
+LOG_ENV = "PROJECT_SETUP_DEDUP_LOG"
+MODES = ("reflink", "hardlink")
+
+# ioctl request number for FICLONE (linux/fs.h).
+FICLONE = 0x40049409
+
+# Settings enabled in this process; they take precedence over the environment.
+_active: Dict[str, str] = {}
+
+
+def _setting(name: str) -> Optional[str]:
+    return _active.get(name) or os.environ.get(name)
+
+
+@contextmanager
+def enabled(mode: str) -> Iterator[str]:
+    """Enable dedup in ``mode`` in this process; yield the placement log.
+
+    On exit the previous settings are restored and the log is removed.
+    """
+    fd, log = tempfile.mkstemp(prefix="project-setup-dedup-")
+    os.close(fd)
+    previous = dict(_active)
+    _active.update({DEDUP_ENV: mode, LOG_ENV: log})
+    try:
+        yield log
+    finally:
+        _active.clear()
+        _active.update(previous)
+        try:
+            os.unlink(log)
+        except OSError:
+            pass
+
+
+def child_env() -> Dict[str, str]:
+    """Return the settings enabled in this process, as a child's environment."""
+    return dict(_active)
+
+
+def dedup_mode() -> Optional[str]:
+    mode = (_setting(DEDUP_ENV) or "").lower()
+    return mode if mode in MODES else None
+
+
+def store_dir() -> Path:
+    value = _setting(STORE_ENV)
+    return Path(value) if value else paths.cache_dir() / "objects"
+
+
+def store_object(data: bytes, store: Optional[Path] = None) -> Path:
+    """Add ``data`` to the store (if missing) and return its path."""
+    digest = hashlib.sha256(data).hexdigest()
+    obj = (store or store_dir()) / digest[:2] / digest[2:]
+    try:
+        if hashlib.sha256(obj.read_bytes()).hexdigest() == digest:
+            return obj
+    except OSError:
+        pass
+    # Missing, or edited in place through a hardlink: (re)write it.
+    obj.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=obj.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # Objects are shared by every project that links to them.
+        os.chmod(tmp, 0o444)
+        os.replace(tmp, obj)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return obj
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        with open(src, "rb") as s, open(dest, "wb") as d:
+            try:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            except OSError:
+                return False
+        os.chmod(dest, 0o644)
+        return True
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dest), 0) != 0:
+            return False
+        os.chmod(dest, 0o644)
+        return True
+    return False
+
+
+def unshare(path: Union[str, Path]) -> None:
+    """Unlink ``path`` if writing to it could change another file.
+
+    That is a symlink, or a file sharing its inode through a hardlink.
+    """
+    path = Path(path)
+    try:
+        if path.is_symlink() or path.stat().st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def detach_tree(root: Union[str, Path]) -> int:
+    """Replace hardlinked files under ``root`` by private copies.
+
+    Returns the number of files detached. ``.git`` is not searched.
+    """
+    detached = 0
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d != ".git"]
+        for name in files:
+            path = Path(directory) / name
+            if path.is_symlink() or path.stat().st_nlink < 2:
+                continue
+            data = path.read_bytes()
+            path.unlink()
+            path.write_bytes(data)
+            detached += 1
+    return detached
+
+
+def place(dest: Union[str, Path], data: bytes, mode: str) -> str:
+    """Place ``data`` at ``dest`` from the store; return the method used."""
+    dest = Path(dest)
+    obj = store_object(data)
+    if dest.exists() or dest.is_symlink():
+        dest.unlink()
+
+    method = "copy"
+    if mode == "hardlink":
+        try:
+            os.link(obj, dest)
+            method = "hardlink"
+        except OSError:
+            pass
+    elif mode == "reflink":
+        try:
+            if _reflink(obj, dest):
+                method = "reflink"
+        except OSError:
+            pass
+
+    if method == "copy":
+        if dest.exists():
+            dest.unlink()
+        shutil.copyfile(obj, dest)
+    _log(method, len(data))
+    return method
+
+
+def _log(method: str, size: int) -> None:
+    log_path = _setting(LOG_ENV)
+    if not log_path:
+        return
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, f"{method} {size}\n".encode())
+    finally:
+        os.close(fd)
+
+
+def write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Write a generated file, through the store when dedup is enabled."""
+    metrics.record_write(len(data))
+    mode = dedup_mode()
+    if mode is None:
+        unshare(path)
+        Path(path).write_bytes(data)
+        return
+    place(path, data, mode)
+
+
+def write_text(path: Union[str, Path], content: str) -> None:
+    write_bytes(path, content.encode("utf-8"))
+
+
+def write_tree(root: Union[str, Path], files: Mapping[str, str]) -> List[Path]:
+    """Write ``files`` (relative path: content) under ``root``; return the paths."""
+    written = []
+    for name, content in files.items():
+        path = Path(root) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_text(path, content)
+        written.append(path)
+    return written
+
+
+def summarize_log(log_path: Union[str, Path]) -> Dict[str, int]:
+    """Summarize placement records into files, bytes and inodes saved."""
+    summary = {
+        "files": 0,
+        "reflink": 0,
+        "hardlink": 0,
+        "copy": 0,
+        "bytes_saved": 0,
+        "inodes_saved": 0,
+    }
+    try:
+        lines = Path(log_path).read_text().splitlines()
+    except OSError:
+        return summary
+    for line in lines:
+        method, _, size = line.partition(" ")
+        if method not in ("reflink", "hardlink", "copy"):
+            continue
+        summary["files"] += 1
+        summary[method] += 1
+        if method != "copy":
+            summary["bytes_saved"] += int(size)
+        if method == "hardlink":
+            summary["inodes_saved"] += 1
+    return summary
@@ -0,0 +1,243 @@
+"""Language and layout detection for a cloned repository.
+
+``project-init --git existing`` scans the clone to choose its steps: the
+languages (manifests such as ``pyproject.toml`` or ``package.json``, else
+source file extensions), a ``src/`` or flat layout, test configurations
+and venvs already in the repository.
+
+The scan is breadth-first, and directories are listed in parallel batches
+of ``BATCH`` (``os.scandir`` releases the GIL). It
+skips what the root ``.gitignore`` ignores, as well as VCS, dependency and
+venv directories. It stops once every language has a manifest, below
+``MAX_DEPTH``, or after ``MAX_ENTRIES`` entries or ``TIME_BUDGET`` seconds,
+so its cost does not grow with the size of the repository: the top levels
+hold the manifests and configurations it looks for.
+"""
+
+import fnmatch
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Deque, Dict, List, NamedTuple, Optional, Pattern, Tuple
+
+from project_setup import gitignore, languages
+
+MANIFESTS: Dict[str, Tuple[str, ...]] = {
+    "python": (
+        "pyproject.toml",
+        "setup.py",
+        "setup.cfg",
+        "requirements.txt",
+        "Pipfile",
+    ),
+    "node": ("package.json",),
+    "rust": ("Cargo.toml",),
+    "go": ("go.mod",),
+}
+EXTENSIONS = {
+    ".py": "python",
+    ".js": "node",
+    ".mjs": "node",
+    ".ts": "node",
+    ".tsx": "node",
+    ".rs": "rust",
+    ".go": "go",
+}
+# Never descended into, ignored or not.
+SKIP_DIRS = frozenset(
+    {".git", ".hg", ".svn", "node_modules", "__pycache__", ".tox", ".nox"}
+)
+# Test configuration files, or (file, section) when only a section counts.
+TEST_CONFIGS = (
+    ("pytest.ini", None),
+    ("conftest.py", None),
+    ("pyproject.toml", "[tool.pytest.ini_options]"),
+    ("setup.cfg", "[tool:pytest]"),
+    ("tox.ini", "[pytest]"),
+    ("jest.config.js", None),
+    ("jest.config.ts", None),
+    ("vitest.config.ts", None),
+)
+MANIFEST_FILES = {
+    name: language for language, names in MANIFESTS.items() for name in names
+}
+MAX_DEPTH = 4
+MAX_ENTRIES = 50_000
+TIME_BUDGET = 0.25
+WORKERS = 16
+# Directories listed per round; bounds the listing a stopped scan wastes.
+BATCH = 4 * WORKERS
+
+
+class Detection(NamedTuple):
+    # Detected languages, the primary one first.
+    languages: List[str]
+    src_layout: bool
+    test_configs: List[str]
+    venvs: List[str]
+    entries: int
+    # False when a limit stopped the scan before it covered the repository.
+    complete: bool
+
+    @property
+    def language(self) -> Optional[str]:
+        return self.languages[0] if self.languages else None
+
+    def describe(self) -> str:
+        found = ", ".join(
+            languages.LANGUAGES[name].label for name in self.languages
+        )
+        lines = [
+            f"Languages: {found or 'none detected'}",
+            f"Layout: {'src/' if self.src_layout else 'flat'}",
+            f"Test configuration: {', '.join(self.test_configs) or 'none'}",
+            f"Virtual environments: {', '.join(self.venvs) or 'none'}",
+        ]
+        scope = "all" if self.complete else "the top"
+        lines.append(f"Scanned {scope} {self.entries} entries")
+        return "\n".join(lines)
+
+
+class _Ignore:
+    """The root .gitignore, as one regex for names and one for paths."""
+
+    def __init__(self, text: str) -> None:
+        names: Dict[bool, List[str]] = {True: [], False: []}
+        paths: Dict[bool, List[str]] = {True: [], False: []}
+        for pattern in gitignore.patterns(text):
+            if pattern.glob.startswith("**/") and "/" not in pattern.glob[3:]:
+                names[pattern.directory].append(fnmatch.translate(pattern.glob[3:]))
+            else:
+                paths[pattern.directory].append(fnmatch.translate(pattern.glob))
+        # Directory-only patterns match directories; the others match both.
+        self._names = {
+            is_dir: self._compile(names[False] + (names[True] if is_dir else []))
+            for is_dir in (True, False)
+        }
+        self._paths = {
+            is_dir: self._compile(paths[False] + (paths[True] if is_dir else []))
+            for is_dir in (True, False)
+        }
+
+    @staticmethod
+    def _compile(parts: List[str]) -> Optional[Pattern[str]]:
+        return re.compile("|".join(parts)) if parts else None
+
+    def __call__(self, name: str, path: str, is_dir: bool) -> bool:
+        by_name, by_path = self._names[is_dir], self._paths[is_dir]
+        return bool(
+            (by_name and by_name.match(name)) or (by_path and by_path.match(path))
+        )
+
+
+def _list(directory: Path) -> List[Tuple[str, bool]]:
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                (entry.name, entry.is_dir(follow_symlinks=False))
+                for entry in entries
+            ]
+    except OSError:
+        return []
+
+
+def _test_configs(root: Path, names: List[str]) -> List[str]:
+    found = []
+    for name, section in TEST_CONFIGS:
+        if name not in names:
+            continue
+        if section is not None:
+            try:
+                if section not in (root / name).read_text(errors="replace"):
+                    continue
+            except OSError:
+                continue
+        found.append(name)
+    return found
+
+
+def scan(root: Path) -> Detection:
+    """Detect the languages, layout, test configuration and venvs of ``root``."""
+    deadline = time.perf_counter() + TIME_BUDGET
+    ignore_file = root / ".gitignore"
+    try:
+        ignored = _Ignore(ignore_file.read_text(errors="replace"))
+    except OSError:
+        ignored = _Ignore("")
+
+    root_manifests = set()
+    manifests: Dict[str, int] = {}
+    sources: Dict[str, int] = {}
+    venvs = set()
+    root_listing: List[Tuple[str, bool]] = []
+    entries = 0
+    complete = True
+    # Breadth-first: directories are listed a batch at a time, in order.
+    queue: Deque[Tuple[Path, str, int]] = deque([(root, "", 0)])
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        while queue:
+            if (
+                len(manifests) == len(MANIFESTS)
+                or entries >= MAX_ENTRIES
+                or time.perf_counter() > deadline
+            ):
+                complete = False
+                break
+            batch = [queue.popleft() for _ in range(min(len(queue), BATCH))]
+            listings = pool.map(_list, [directory for directory, _, _ in batch])
+            for (directory, prefix, depth), listing in zip(batch, listings):
+                if not prefix:
+                    root_listing = listing
+                elif ("pyvenv.cfg", False) in listing:
+                    # A venv: recorded, but not scanned.
+                    venvs.add(prefix.rstrip("/"))
+                    continue
+                entries += len(listing)
+                for name, is_dir in listing:
+                    path = prefix + name
+                    if is_dir:
+                        if name in SKIP_DIRS or ignored(name, path, True):
+                            continue
+                        if depth < MAX_DEPTH:
+                            queue.append((directory / name, path + "/", depth + 1))
+                        else:
+                            complete = False
+                        continue
+                    language = MANIFEST_FILES.get(name)
+                    if language is None:
+                        language = EXTENSIONS.get(name[name.rfind(".") :])
+                        if language and not ignored(name, path, False):
+                            sources[language] = sources.get(language, 0) + 1
+                    elif not ignored(name, path, False):
+                        manifests[language] = manifests.get(language, 0) + 1
+                        if not prefix:
+                            root_manifests.add(language)
+
+    # Root manifests first; then by source files, manifests and MANIFESTS order.
+    ranked = sorted(
+        set(manifests) | set(sources),
+        key=lambda name: (
+            name not in root_manifests,
+            -sources.get(name, 0),
+            -manifests.get(name, 0),
+            list(MANIFESTS).index(name),
+        ),
+    )
+    # Venvs are usually ignored, so the scan does not reach them.
+    root_names = [name for name, _ in root_listing]
+    venvs.update(
+        name
+        for name, is_dir in root_listing
+        if is_dir and (root / name / "pyvenv.cfg").is_file()
+    )
+    return Detection(
+        languages=ranked,
+        src_layout=("src", True) in root_listing,
+        test_configs=_test_configs(root, root_names),
+        venvs=sorted(venvs),
+        entries=entries,
+        complete=complete,
+    )
@@ -0,0 +1,308 @@
+"""Dockerfile, devcontainer and .dockerignore generation.
+
+The Dockerfile installs dependencies in a layer that copies only the
+dependency manifests (``pyproject.toml``, ``uv.lock`` and
+``requirements*.txt``), so editing sources reuses the cached dependency
+layer, and keeps the uv or pip download cache in a BuildKit cache mount
+rather than in the image. Development requirements
+(``requirements-dev*.txt``, e.g. the perf profile's) stay out of the image;
+the devcontainer installs them when it is created. A project without a
+runtime manifest gets an empty ``requirements.txt`` to list its dependencies
+in. The Dockerfile follows the project's venv backend (uv when
+``pyvenv.cfg`` was written by uv) and layout (``src/`` or flat), and puts
+the environment in ``/opt/venv`` so it never collides with a host ``.venv``
+mounted into a devcontainer.
+"""
+
+import fnmatch
+import json
+import sys
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from project_setup import dedup, runner
+
+VENV_DIR = "/opt/venv"
+MANIFESTS = ("pyproject.toml", "uv.lock")
+REQUIREMENTS = "requirements*.txt"
+DEV_REQUIREMENTS = "requirements-dev*.txt"
+REQUIREMENTS_STUB = "# Dependencies, one per line; the Dockerfile installs them.\n"
+SRC_EXTRA_FILES = ("README.md", "LICENSE")
+UV_IMAGE = "ghcr.io/astral-sh/uv:latest"
+DOCKERIGNORE = """\
+.git
+.venv
+**/__pycache__
+**/*.py[cod]
+.pytest_cache
+.mypy_cache
+.ruff_cache
+.vscode
+.idea
+.opencode
+.claude
+.devcontainer
+.env
+"""
+
+# Prints the [project] dependencies of pyproject.toml, one per line, so pip
+# can install them before the sources are copied.
+_PYPROJECT_DEPS = (
+    "import {module}; "
+    "deps = {module}.load(open('pyproject.toml', 'rb'))"
+    ".get('project', {{}}).get('dependencies', []); "
+    "print('\\n'.join(deps))"
+)
+
+
+class Layout(NamedTuple):
+    backend: str
+    src: bool
+    python: str
+    manifests: List[str]
+    # Top-level files copied beside src/ in a src layout.
+    extras: Tuple[str, ...] = ()
+
+    @property
+    def requirements(self) -> List[str]:
+        """The requirements files installed into the image."""
+        return [
+            m
+            for m in self.manifests
+            if fnmatch.fnmatch(m, REQUIREMENTS)
+            and not fnmatch.fnmatch(m, DEV_REQUIREMENTS)
+        ]
+
+    @property
+    def dev_requirements(self) -> List[str]:
+        """The requirements files installed only in the devcontainer."""
+        return [m for m in self.manifests if fnmatch.fnmatch(m, DEV_REQUIREMENTS)]
+
+    @property
+    def cache_dir(self) -> str:
+        return "/root/.cache/uv" if self.backend == "uv" else "/root/.cache/pip"
+
+
+def find_manifests(names: Iterable[str]) -> List[str]:
+    """Return the dependency manifests among ``names``, in install order."""
+    names = {n for n in names if "/" not in n}
+    requirements = sorted(
+        (n for n in names if fnmatch.fnmatch(n, REQUIREMENTS)),
+        key=lambda n: (n != "requirements.txt", n),
+    )
+    return [m for m in MANIFESTS if m in names] + requirements
+
+
+def _install_args(requirements: List[str]) -> str:
+    return " ".join(f"-r {r}" for r in requirements)
+
+
+def _pyvenv_cfg(project_path: Path) -> dict:
+    values = {}
+    try:
+        lines = (project_path / ".venv" / "pyvenv.cfg").read_text().splitlines()
+    except OSError:
+        return values
+    for line in lines:
+        key, sep, value = line.partition("=")
+        if sep:
+            values[key.strip()] = value.strip()
+    return values
+
+
+def default_backend() -> str:
+    """Return the backend for a project without a venv: uv when installed."""
+    return "uv" if runner.probe_tool("uv") else "venv"
+
+
+def tree_layout(
+    paths: Collection[str], backend: Optional[str] = None, python: Optional[str] = None
+) -> Layout:
+    """Describe the project whose files have the relative ``paths``."""
+    return Layout(
+        backend=backend or default_backend(),
+        src=any(p.startswith("src/") for p in paths),
+        python=python or f"{sys.version_info.major}.{sys.version_info.minor}",
+        manifests=find_manifests(paths),
+        extras=tuple(f for f in SRC_EXTRA_FILES if f in paths),
+    )
+
+
+def detect_layout(project_path: Path, backend: Optional[str] = None) -> Layout:
+    """Describe the project: venv backend, src layout, Python and manifests."""
+    cfg = _pyvenv_cfg(project_path)
+    if backend is None and cfg:
+        backend = "uv" if "uv" in cfg else "venv"
+    version = cfg.get("version") or cfg.get("version_info")
+    paths = [p.name for p in project_path.iterdir() if p.is_file()]
+    if (project_path / "src").is_dir():
+        paths.append("src/")
+    return tree_layout(
+        paths, backend, ".".join(version.split(".")[:2]) if version else None
+    )
+
+
+def _source_copies(layout: Layout) -> List[str]:
+    if not layout.src:
+        return ["COPY . ."]
+    lines = [f"COPY {' '.join(layout.extras)} ./"] if layout.extras else []
+    return lines + ["COPY src/ src/"]
+
+
+def _uv_steps(layout: Layout) -> List[str]:
+    cache = f"RUN --mount=type=cache,target={layout.cache_dir} \\"
+    frozen = " --frozen" if "uv.lock" in layout.manifests else ""
+    steps = [
+        f"COPY --from={UV_IMAGE} /uv /uvx /bin/",
+        "ENV UV_COMPILE_BYTECODE=1 \\",
+        "    UV_LINK_MODE=copy \\",
+        f"    UV_PROJECT_ENVIRONMENT={VENV_DIR} \\",
+        f"    VIRTUAL_ENV={VENV_DIR} \\",
+        f'    PATH="{VENV_DIR}/bin:$PATH"',
+        "",
+        "WORKDIR /app",
+        "",
+    ]
+    requirements = layout.requirements
+    if "pyproject.toml" in layout.manifests:
+        manifests = [m for m in layout.manifests if m in MANIFESTS]
+        steps += [
+            "# Dependencies only: this layer is reused until the manifests change.",
+            f"COPY {' '.join(manifests)} ./",
+            cache,
+            f"    uv sync --no-install-project --no-dev{frozen}",
+            "",
+            *_source_copies(layout),
+            cache,
+            f"    uv sync --no-dev{frozen}",
+        ]
+    elif requirements:
+        steps += [
+            "# Dependencies only: this layer is reused until the manifests change.",
+            f"COPY {' '.join(requirements)} ./",
+            cache,
+            f"    uv venv {VENV_DIR} && uv pip install {_install_args(requirements)}",
+            "",
+            *_source_copies(layout),
+        ]
+    else:
+        steps += [f"RUN uv venv {VENV_DIR}", "", *_source_copies(layout)]
+    return steps
+
+
+def _pip_steps(layout: Layout) -> List[str]:
+    cache = f"RUN --mount=type=cache,target={layout.cache_dir} \\"
+    steps = [
+        "ENV PIP_DISABLE_PIP_VERSION_CHECK=1 \\",
+        f"    VIRTUAL_ENV={VENV_DIR} \\",
+        f'    PATH="{VENV_DIR}/bin:$PATH"',
+        f"RUN python -m venv {VENV_DIR}",
+        "",
+        "WORKDIR /app",
+        "",
+    ]
+    if "pyproject.toml" in layout.manifests:
+        major, minor = (int(p) for p in layout.python.split(".")[:2])
+        if (major, minor) >= (3, 11):
+            reader, install = "tomllib", ""
+        else:
+            reader, install = "tomli", "pip install tomli && "
+        script = _PYPROJECT_DEPS.format(module=reader)
+        steps += [
+            "# Dependencies only: this layer is reused until the manifests change.",
+            "COPY pyproject.toml ./",
+            cache,
+            f'    {install}python -c "{script}" > /tmp/requirements.txt \\',
+            "    && pip install -r /tmp/requirements.txt",
+            "",
+            *_source_copies(layout),
+            cache,
+            "    pip install --no-deps .",
+        ]
+    elif layout.requirements:
+        steps += [
+            "# Dependencies only: this layer is reused until the manifests change.",
+            f"COPY {' '.join(layout.requirements)} ./",
+            cache,
+            f"    pip install {_install_args(layout.requirements)}",
+            "",
+            *_source_copies(layout),
+        ]
+    else:
+        steps += _source_copies(layout)
+    return steps
+
+
+def render_dockerfile(layout: Layout) -> str:
+    header = [
+        "# syntax=docker/dockerfile:1",
+        f"FROM python:{layout.python}-slim",
+        "",
+    ]
+    if layout.backend == "uv":
+        body = _uv_steps(layout)
+    else:
+        body = _pip_steps(layout)
+    return "\n".join(header + body + ["", 'CMD ["python"]', ""])
+
+
+def render_devcontainer(project_name: str, layout: Layout) -> dict:
+    config = {
+        "name": project_name,
+        "build": {"dockerfile": "../Dockerfile", "context": ".."},
+        "mounts": [
+            f"source=project-setup-{Path(layout.cache_dir).name}-cache,"
+            f"target={layout.cache_dir},type=volume"
+        ],
+        "customizations": {
+            "vscode": {
+                "extensions": ["ms-python.python"],
+                "settings": {
+                    "python.defaultInterpreterPath": f"{VENV_DIR}/bin/python"
+                },
+            }
+        },
+    }
+    # Reinstall the workspace copy of the project, editable, into /opt/venv,
+    # along with the development requirements the image leaves out.
+    pip = "uv pip install" if layout.backend == "uv" else "pip install"
+    dev = _install_args(layout.dev_requirements)
+    commands = []
+    if "pyproject.toml" in layout.manifests:
+        if layout.backend == "uv":
+            commands.append("uv sync")
+            if dev:
+                commands.append(f"{pip} {dev}")
+        else:
+            commands.append(f"{pip} -e . {dev}".rstrip())
+    elif layout.requirements or dev:
+        installs = _install_args(layout.requirements + layout.dev_requirements)
+        commands.append(f"{pip} {installs}")
+    if commands:
+        config["postCreateCommand"] = " && ".join(commands)
+    return config
+
+
+def docker_files(project_name: str, layout: Layout) -> Dict[str, str]:
+    """Return the Dockerfile, devcontainer and .dockerignore by relative path.
+
+    A project without a runtime manifest also gets an empty ``requirements.txt``.
+    """
+    files = {}
+    if not set(layout.manifests) - set(layout.dev_requirements):
+        files["requirements.txt"] = REQUIREMENTS_STUB
+        layout = layout._replace(manifests=["requirements.txt", *layout.manifests])
+    files["Dockerfile"] = render_dockerfile(layout)
+    files[".devcontainer/devcontainer.json"] = (
+        json.dumps(render_devcontainer(project_name, layout), indent=2) + "\n"
+    )
+    files[".dockerignore"] = DOCKERIGNORE
+    return files
+
+
+def write_docker_config(
+    project_path: Path, backend: Optional[str] = None
+) -> List[Path]:
+    """Write the Dockerfile, devcontainer and .dockerignore for the project."""
+    layout = detect_layout(project_path, backend)
+    return dedup.write_tree(project_path, docker_files(project_path.name, layout))
@@ -0,0 +1,134 @@
+"""Git's large-repository performance settings.
+
+``apply`` configures a repository the way ``scalar`` does for big
+working trees, as far as the installed git supports:
+
+- ``feature.manyFiles`` (index v4, untracked cache) and
+  ``core.untrackedCache``
+- ``core.preloadIndex``, which stats the index in parallel
+- ``core.fsmonitor`` with git's built-in daemon, on platforms that have one
+- a commit-graph with changed-path Bloom filters, kept up to date on fetch
+- a multi-pack-index, when the repository has packs
+- registration for ``git maintenance``, which adds the repository to
+  ``maintenance.repo`` in the user's global git config
+
+and times ``git status`` before and after. Registering schedules nothing:
+the maintenance tasks only run once ``git maintenance start`` has installed
+the per-user schedule, which is left to the user, and the report says so.
+"""
+
+import re
+import statistics
+import subprocess
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from project_setup import runner
+
+STATUS_RUNS = 3
+
+# (key, value, minimum git version)
+SETTINGS = (
+    ("feature.manyFiles", "true", (2, 24)),
+    ("core.untrackedCache", "true", (2, 8)),
+    ("core.preloadIndex", "true", (2, 1)),
+    ("core.commitGraph", "true", (2, 18)),
+    ("fetch.writeCommitGraph", "true", (2, 24)),
+)
+FSMONITOR_VERSION = (2, 37)
+MAINTENANCE_NOTE = (
+    "  maintenance: registered in the global git config (maintenance.repo); "
+    "nothing is scheduled until `git maintenance start` is run"
+)
+
+
+class Report(NamedTuple):
+    applied: List[str]
+    skipped: List[str]
+    status_before: float
+    status_after: float
+
+    def describe(self) -> str:
+        lines = [f"Git performance profile: {', '.join(self.applied)}"]
+        if self.skipped:
+            lines.append(f"  skipped: {'; '.join(self.skipped)}")
+        if "maintenance" in self.applied:
+            lines.append(MAINTENANCE_NOTE)
+        lines.append(
+            f"  git status: {self.status_before * 1000:.1f} ms -> "
+            f"{self.status_after * 1000:.1f} ms"
+        )
+        return "\n".join(lines)
+
+
+def git_version() -> Tuple[int, ...]:
+    result = runner.run(["git", "version"], capture_output=True, text=True)
+    match = re.search(r"(\d+)\.(\d+)", result.stdout)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+
+def _git(repo: Path, *args: str) -> subprocess.CompletedProcess:
+    return runner.run(["git", *args], cwd=repo, capture_output=True, text=True)
+
+
+def time_status(repo: Path, runs: int = STATUS_RUNS) -> float:
+    """Return the median wall time of ``git status`` after one warm-up run."""
+    _git(repo, "status", "--porcelain")
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _git(repo, "status", "--porcelain")
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def fsmonitor_supported(repo: Path) -> bool:
+    """Return whether this platform has git's built-in fsmonitor daemon."""
+    result = _git(repo, "fsmonitor--daemon", "status")
+    return "not supported" not in result.stderr
+
+
+def apply(repo: Path, version: Optional[Tuple[int, ...]] = None) -> Report:
+    """Apply the performance profile to ``repo`` and time ``git status``."""
+    version = version or git_version()
+    before = time_status(repo)
+    applied: List[str] = []
+    skipped: List[str] = []
+
+    for key, value, minimum in SETTINGS:
+        if version < minimum:
+            skipped.append(f"{key} (git {'.'.join(map(str, minimum))}+)")
+            continue
+        if _git(repo, "config", key, value).returncode == 0:
+            applied.append(key)
+        else:
+            skipped.append(key)
+
+    if version < FSMONITOR_VERSION:
+        skipped.append("core.fsmonitor (git 2.37+)")
+    elif not fsmonitor_supported(repo):
+        skipped.append("core.fsmonitor (no built-in daemon on this platform)")
+    elif _git(repo, "config", "core.fsmonitor", "true").returncode == 0:
+        applied.append("core.fsmonitor")
+
+    if _git(repo, "commit-graph", "write", "--reachable", "--changed-paths").returncode:
+        skipped.append("commit-graph")
+    else:
+        applied.append("commit-graph")
+
+    packs = repo / ".git" / "objects" / "pack"
+    if not any(packs.glob("*.pack")):
+        skipped.append("multi-pack-index (no packs yet)")
+    elif _git(repo, "multi-pack-index", "write").returncode:
+        skipped.append("multi-pack-index")
+    else:
+        applied.append("multi-pack-index")
+
+    result = _git(repo, "maintenance", "register")
+    if result.returncode:
+        skipped.append(f"maintenance ({result.stderr.strip() or 'register failed'})")
+    else:
+        applied.append("maintenance")
+
+    return Report(applied, skipped, before, time_status(repo))
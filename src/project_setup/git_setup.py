@@ -1,4 +1,8 @@
-"""Git setup CLI command."""
+"""Git setup CLI command.
+
+The remote, git performance and mirror modules are imported by the modes
+and options that use them.
+"""
 
 import subprocess
 from pathlib import Path
@@ -7,88 +11,39 @@ from urllib.parse import urlparse
 
 import typer
 
-GITIGNORE_TEMPLATES = {
-    "Python": """__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-venv/
-.venv/
-env/
-.env
-.pytest_cache/
-.coverage
-htmlcov/
-*.log
-""",
-    "Node": """node_modules/
-npm-debug.log*
-yarn-debug.log*
-yarn-error.log*
-package-lock.json
-yarn.lock
-.env
-.env.local
-dist/
-build/
-.DS_Store
-*.log
-coverage/
-.nyc_output/
-""",
-    "Rust": """target/
-Cargo.lock
-*.rs.bk
-*.pdb
-.DS_Store
-""",
-    "Go": """*.exe
-*.exe~
-*.dll
-*.so
-*.dylib
-*.test
-*.out
-vendor/
-go.sum
-.DS_Store
-*.log
-""",
-    "Blank": """*
-""",
-}
+from project_setup import dedup, gitignore, metrics, project_files, runner
 
 
 def check_git_installed() -> bool:
-    try:
-        subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return runner.probe_tool("git")
+
+
+def clone_repository(url: str, target_path: Path) -> None:
+    """Clone ``url``, borrowing objects from a cached mirror when one exists.
+
+    ``--dissociate`` copies the borrowed objects, so the clone does not
+    depend on the mirror once it finishes. A missing or stale mirror is
+    filled from the clone in the background.
+    """
+    from project_setup import cache_store, mirrors
+
+    store = mirrors.mirrors_store()
+    cmd = ["git", "clone"]
+    with store.reading(cache_store.key_for(url)) as entry:
+        if entry is not None:
+            cmd += ["--reference-if-able", str(entry / "repo.git"), "--dissociate"]
+        runner.run(cmd + [url, str(target_path)], capture_output=True, check=True)
+    if mirrors.needs_refresh(url):
+        mirrors.refresh_in_background(url, target_path)
+
 
+def apply_perf_profile(repo: Path) -> None:
+    """Enable git's large-repository settings and report their effect."""
+    from project_setup import git_perf
 
-def get_gitignore_template(template_name: str) -> str:
-    return GITIGNORE_TEMPLATES.get(template_name, GITIGNORE_TEMPLATES["Blank"])
+    report = git_perf.apply(repo)
+    # stdout carries only the project path, for project-init.
+    typer.echo(report.describe(), err=True)
 
 
 def create_project_directory(project_path: Path) -> None:
@@ -103,6 +58,7 @@ def create_project_directory(project_path: Path) -> None:
         raise typer.Exit(code=1)
 
 
+@metrics.instrument("git-setup")
 def git_setup(
     project_name: Optional[str] = typer.Argument(
         None, help="Name of the project (for new mode)"
@@ -127,7 +83,22 @@ def git_setup(
         None, "--include-readme", help="Include README.md file"
     ),
     template: Optional[str] = typer.Option(
-        None, "--template", help="Gitignore template: Python, Node, Rust, Go, Blank"
+        None,
+        "--template",
+        help="Gitignore template(s), e.g. Python or Python+Node+JetBrains",
+    ),
+    create_remote: Optional[bool] = typer.Option(
+        None,
+        "--create-remote",
+        help="Create the repository on the hosting API and push (new mode)",
+    ),
+    perf_profile: Optional[bool] = typer.Option(
+        None,
+        "--perf-profile",
+        help=(
+            "Enable git's large-repository performance settings; registers the "
+            "repository for git maintenance in your global git config"
+        ),
     ),
 ) -> None:
     if not check_git_installed():
@@ -149,6 +120,10 @@ def git_setup(
             include_gitignore = None
         if isinstance(include_readme, typer.models.OptionInfo):
             include_readme = None
+        if isinstance(create_remote, typer.models.OptionInfo):
+            create_remote = None
+    if isinstance(perf_profile, typer.models.OptionInfo):
+        perf_profile = None
 
     if is_interactive:
         mode = typer.prompt("Git mode (new/existing/none)", default="new")
@@ -202,6 +177,9 @@ def git_setup(
         if is_interactive and not description:
             description = typer.prompt("Description (optional)", default="")
 
+        if is_interactive and create_remote is None:
+            create_remote = typer.prompt("Create remote repository?", default=False)
+
         if include_gitignore is None:
             if is_interactive:
                 include_gitignore = typer.prompt("Include .gitignore?", default=True)
@@ -211,17 +189,29 @@ def git_setup(
         if include_gitignore and not template:
             if is_interactive:
                 template = typer.prompt(
-                    "Gitignore template (Python/Node/Rust/Go/Blank)", default="Python"
+                    "Gitignore template (e.g. Python or Python+JetBrains)",
+                    default="Python",
                 )
             else:
                 template = "Python"
 
+        try:
+            files = project_files.repository_files(
+                project_name,
+                template if include_gitignore else None,
+                bool(include_readme),
+                description,
+            )
+        except gitignore.GitignoreError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(code=1)
+
         project_path = Path.cwd() / project_name
 
         create_project_directory(project_path)
 
         try:
-            subprocess.run(
+            runner.run(
                 ["git", "init"],
                 cwd=project_path,
                 capture_output=True,
@@ -234,27 +224,16 @@ def git_setup(
             )
             raise typer.Exit(code=1)
 
-        if include_gitignore:
-            template_name = template if template else "Python"
-            gitignore_content = get_gitignore_template(template_name)
-            gitignore_path = project_path / ".gitignore"
-            gitignore_path.write_text(gitignore_content)
-
-        if include_readme:
-            readme_content = f"# {project_name}\n\n"
-            if description:
-                readme_content += f"{description}\n"
-            readme_path = project_path / "README.md"
-            readme_path.write_text(readme_content)
+        dedup.write_tree(project_path, files)
 
         try:
-            subprocess.run(
+            runner.run(
                 ["git", "add", "."],
                 cwd=project_path,
                 capture_output=True,
                 check=True,
             )
-            subprocess.run(
+            runner.run(
                 ["git", "commit", "-m", "Initial commit"],
                 cwd=project_path,
                 capture_output=True,
@@ -267,6 +246,25 @@ def git_setup(
             )
             raise typer.Exit(code=1)
 
+        if perf_profile:
+            apply_perf_profile(project_path)
+
+        if create_remote:
+            from project_setup import remote
+
+            try:
+                repo = remote.publish(
+                    project_path, project_name, is_private, description
+                )
+            except remote.RemoteError as e:
+                typer.echo(f"Error: {e}", err=True)
+                raise typer.Exit(code=1)
+            # stdout carries only the project path, for project-init.
+            typer.echo(
+                f"Remote repository: {repo.get('html_url') or repo['clone_url']}",
+                err=True,
+            )
+
         typer.echo(project_path)
 
     elif mode == "existing":
@@ -311,11 +309,7 @@ def git_setup(
             raise typer.Exit(code=1)
 
         try:
-            subprocess.run(
-                ["git", "clone", url, str(target_path)],
-                capture_output=True,
-                check=True,
-            )
+            clone_repository(url, target_path)
         except subprocess.CalledProcessError as e:
             typer.echo(
                 f"Error cloning repository: {e.stderr.decode() if e.stderr else e}",
@@ -323,4 +317,12 @@ def git_setup(
             )
             raise typer.Exit(code=1)
 
+        if perf_profile:
+            apply_perf_profile(target_path)
+
         typer.echo(target_path)
+
+
+def main() -> None:
+    """Entry point for the git-setup CLI command."""
+    typer.run(git_setup)
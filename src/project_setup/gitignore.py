@@ -0,0 +1,187 @@
+"""The .gitignore template catalog.
+
+The catalog ships as one zip resource, ``data/gitignore.zip``, built from
+``resources/gitignore`` by ``scripts/build_resources.py``: a template per
+deflated member (editor and OS templates under ``Global/``) and an
+``index.json`` naming each template, its member and its aliases. Opening
+the catalog reads only the zip's central directory and the index; a
+template's member is inflated when it is rendered, so startup time and
+memory do not grow with the catalog.
+
+Names are case-insensitive and combine with ``+``: ``Python+Node+JetBrains``
+renders each template under a ``### Name ###`` header, without repeating a
+pattern an earlier template already has. Unknown names are an error.
+"""
+
+import difflib
+import io
+import json
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+CATALOG = Path(__file__).parent / "data" / "gitignore.zip"
+INDEX_NAME = "index.json"
+ALIASES_NAME = "aliases.json"
+SUFFIX = ".gitignore"
+SEPARATOR = "+"
+# Fixed member timestamps keep rebuilt catalogs byte-identical.
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+
+class GitignoreError(Exception):
+    """Raised for unknown template names or an unreadable catalog."""
+
+
+class Pattern(NamedTuple):
+    glob: str
+    # True for patterns that match only directories (a trailing "/").
+    directory: bool
+
+
+class Catalog(NamedTuple):
+    archive: zipfile.ZipFile
+    members: Dict[str, str]
+    lookup: Dict[str, str]
+
+
+@lru_cache(maxsize=None)
+def _catalog() -> Catalog:
+    try:
+        if CATALOG.is_file():
+            archive = zipfile.ZipFile(CATALOG)
+        else:
+            # In the zipapp the catalog is a member of the archive itself.
+            archive = zipfile.ZipFile(io.BytesIO(__loader__.get_data(str(CATALOG))))
+        index = json.loads(archive.read(INDEX_NAME))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        raise GitignoreError(f"Cannot read the gitignore catalog: {e}") from e
+    members = {name: entry["path"] for name, entry in index["templates"].items()}
+    lookup = {name.lower(): name for name in members}
+    for alias, name in index["aliases"].items():
+        lookup.setdefault(alias.lower(), name)
+    return Catalog(archive, members, lookup)
+
+
+def names() -> List[str]:
+    """Return the catalog's template names."""
+    return sorted(_catalog().members, key=str.lower)
+
+
+def resolve(spec: str) -> List[str]:
+    """Return the template names of ``spec`` (``A+B+...``), in order."""
+    catalog = _catalog()
+    resolved: List[str] = []
+    for part in spec.split(SEPARATOR):
+        part = part.strip()
+        name = catalog.lookup.get(part.lower())
+        if name is None:
+            close = difflib.get_close_matches(part.lower(), catalog.lookup, n=3)
+            hint = (
+                f"; did you mean {', '.join(catalog.lookup[c] for c in close)}?"
+                if close
+                else ""
+            )
+            raise GitignoreError(f"Unknown gitignore template '{part}'{hint}")
+        if name not in resolved:
+            resolved.append(name)
+    return resolved
+
+
+def template(name: str) -> str:
+    """Return the content of one template, by its canonical name."""
+    catalog = _catalog()
+    return catalog.archive.read(catalog.members[name]).decode("utf-8")
+
+
+def render(spec: str) -> str:
+    """Return the .gitignore content for ``spec``."""
+    resolved = resolve(spec)
+    if len(resolved) == 1:
+        return template(resolved[0])
+    seen = set()
+    sections = []
+    for name in resolved:
+        lines = [f"### {name} ###"]
+        for line in template(name).splitlines():
+            pattern = line.strip()
+            if pattern and not pattern.startswith("#"):
+                if pattern in seen:
+                    continue
+                seen.add(pattern)
+            lines.append(line)
+        sections.append("\n".join(lines).rstrip("\n") + "\n")
+    return "\n".join(sections)
+
+
+def with_entries(text: str, entries: List[str], comment: str) -> str:
+    """Return ``text`` with the ``entries`` it lacks appended under ``comment``."""
+    present = {line.strip() for line in text.splitlines()}
+    missing = [entry for entry in entries if entry not in present]
+    if not missing:
+        return text
+    if text and not text.endswith("\n"):
+        text += "\n"
+    if text:
+        text += "\n"
+    return text + "\n".join([f"# {comment}", *missing]) + "\n"
+
+
+def patterns(text: str) -> List[Pattern]:
+    """Return the patterns of a .gitignore as globs relative to its directory.
+
+    As in git, a pattern without an inner slash matches at any depth and gets
+    a ``**/`` prefix; others are anchored. Negations, escapes and patterns
+    matching everything are skipped.
+    """
+    result: List[Pattern] = []
+    seen = set()
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", "!", "\\")) or " " in line:
+            continue
+        directory = line.endswith("/")
+        body = line.rstrip("/")
+        anchored = "/" in body
+        if body.endswith("/**"):
+            body, directory = body[:-3], True
+        if body.strip("*/") == "":
+            continue
+        glob = body.lstrip("/") if anchored else f"**/{body}"
+        if glob in seen:
+            continue
+        seen.add(glob)
+        result.append(Pattern(glob, directory))
+    return result
+
+
+def build_catalog(source_dir: Path, dest: Path) -> Path:
+    """Pack ``source_dir`` (``*.gitignore``, ``Global/``, aliases) into ``dest``."""
+    templates: Dict[str, Dict[str, str]] = {}
+    sources = sorted(source_dir.rglob(f"*{SUFFIX}"))
+    for path in sources:
+        member = path.relative_to(source_dir).as_posix()
+        name = path.name[: -len(SUFFIX)]
+        if name in templates:
+            raise GitignoreError(f"Duplicate gitignore template '{name}'")
+        category = "global" if member.startswith("Global/") else "languages"
+        templates[name] = {"path": member, "category": category}
+    aliases_path = source_dir / ALIASES_NAME
+    aliases = json.loads(aliases_path.read_text()) if aliases_path.is_file() else {}
+    for alias, name in aliases.items():
+        if name not in templates:
+            raise GitignoreError(f"Alias '{alias}' names unknown template '{name}'")
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    index = {"templates": templates, "aliases": aliases}
+    with zipfile.ZipFile(dest, "w") as archive:
+        for name, data in [
+            (INDEX_NAME, json.dumps(index, indent=1, sort_keys=True).encode()),
+            *((p.relative_to(source_dir).as_posix(), p.read_bytes()) for p in sources),
+        ]:
+            info = zipfile.ZipInfo(name, ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, data, compresslevel=9)
+    return dest
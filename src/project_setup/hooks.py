@@ -0,0 +1,254 @@
+"""pre-commit configuration and hook environments from a shared cache.
+
+``render_config`` writes a ``.pre-commit-config.yaml`` for the project's
+language with pinned hook revisions. pre-commit keeps the environment of
+each ``(repo, rev)`` under one per-user directory, ``$PRE_COMMIT_HOME``
+(default ``$XDG_CACHE_HOME/pre-commit``), shared by every repository on the
+machine, so once a revision has been installed no project fetches or
+builds it again.
+
+``install`` installs the hook environments and then the git hook during
+``project-init``, so the initial commit (and every commit after it) only
+runs the hooks; without the environments no git hook is installed, since
+it would fail every commit. ``warm`` installs the environments for every language's
+config ahead of time, e.g. when building a machine image, which lets
+offline projects get their hooks without the network.
+"""
+
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from project_setup import dedup, languages, runner
+
+CONFIG_NAME = ".pre-commit-config.yaml"
+
+# (repo, rev, [(hook id, args)])
+COMMON_REPOS = (
+    (
+        "https://github.com/pre-commit/pre-commit-hooks",
+        "v4.6.0",
+        [
+            ("trailing-whitespace", ()),
+            ("end-of-file-fixer", ()),
+            ("check-yaml", ()),
+            ("check-toml", ()),
+            ("check-json", ()),
+            ("check-merge-conflict", ()),
+            ("check-added-large-files", ()),
+        ],
+    ),
+)
+LANGUAGE_REPOS = {
+    "python": (
+        (
+            "https://github.com/astral-sh/ruff-pre-commit",
+            "v0.6.9",
+            [("ruff", ("--fix",)), ("ruff-format", ())],
+        ),
+    ),
+    "node": (
+        (
+            "https://github.com/pre-commit/mirrors-prettier",
+            "v3.1.0",
+            [("prettier", ())],
+        ),
+    ),
+}
+# Hooks using the language's own toolchain, which need no hook environment.
+LOCAL_HOOKS = {
+    "rust": [
+        ("cargo-fmt", "cargo fmt", "cargo fmt --", "rust", False),
+    ],
+    "go": [
+        ("gofmt", "gofmt", "gofmt -l -w", "go", True),
+    ],
+}
+
+
+class Report(NamedTuple):
+    installed: bool
+    warm: bool
+    seconds: float
+    detail: str
+
+    def describe(self) -> str:
+        if not self.installed:
+            return f"pre-commit hooks not installed: {self.detail}"
+        source = "from the shared cache" if self.warm else "and added to the cache"
+        return (
+            f"pre-commit hooks installed {source} in {self.seconds:.1f} s "
+            f"({self.detail})"
+        )
+
+
+def render_config(language: str = "python") -> str:
+    """Return the ``.pre-commit-config.yaml`` for ``language``."""
+    lines = ["repos:"]
+    for repo, rev, hooks in COMMON_REPOS + LANGUAGE_REPOS.get(language, ()):
+        lines += [f"  - repo: {repo}", f"    rev: {rev}", "    hooks:"]
+        for hook_id, args in hooks:
+            lines.append(f"      - id: {hook_id}")
+            if args:
+                lines.append(f"        args: [{', '.join(args)}]")
+    local = LOCAL_HOOKS.get(language)
+    if local:
+        lines += ["  - repo: local", "    hooks:"]
+        for hook_id, name, entry, file_type, pass_filenames in local:
+            lines += [
+                f"      - id: {hook_id}",
+                f"        name: {name}",
+                f"        entry: {entry}",
+                "        language: system",
+                f"        types: [{file_type}]",
+            ]
+            if not pass_filenames:
+                lines.append("        pass_filenames: false")
+    return "\n".join(lines) + "\n"
+
+
+def write_config(project_path: Path, language: str = "python") -> Optional[Path]:
+    """Write the config unless the project already has one."""
+    path = project_path / CONFIG_NAME
+    if path.exists():
+        return None
+    dedup.write_text(path, render_config(language))
+    return path
+
+
+def config_repos(config: str) -> List[Tuple[str, str]]:
+    """Return the ``(repo, rev)`` pairs of a config, without local/meta repos."""
+    pairs = []
+    repo = None
+    for line in config.splitlines():
+        match = re.match(r"\s*-?\s*(repo|rev):\s*['\"]?([^'\"\s#]+)", line)
+        if not match:
+            continue
+        if match.group(1) == "repo":
+            repo = match.group(2)
+        elif repo and repo not in ("local", "meta"):
+            pairs.append((repo, match.group(2)))
+            repo = None
+    return pairs
+
+
+def hook_home() -> Path:
+    """Return pre-commit's cache directory, where hook environments live."""
+    if os.environ.get("PRE_COMMIT_HOME"):
+        return Path(os.environ["PRE_COMMIT_HOME"])
+    cache = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache) / "pre-commit"
+
+
+def is_warm(config: str, home: Optional[Path] = None) -> bool:
+    """Return whether every hook environment of ``config`` is installed."""
+    database = (home or hook_home()) / "db.db"
+    if not database.is_file():
+        return False
+    try:
+        with sqlite3.connect(f"file:{database}?mode=ro", uri=True) as db:
+            rows = dict(
+                ((repo, ref), path)
+                for repo, ref, path in db.execute("SELECT repo, ref, path FROM repos")
+            )
+    except sqlite3.Error:
+        return False
+    for pair in config_repos(config):
+        path = rows.get(pair)
+        # pre-commit marks a finished environment with .install_state_v1.
+        if not path or not any(Path(path).glob("*/.install_state_v1")):
+            return False
+    return True
+
+
+def pre_commit_command() -> Optional[List[str]]:
+    """Return the argv prefix that runs pre-commit, if it is installed."""
+    binary = shutil.which("pre-commit")
+    if binary:
+        return [binary]
+    if find_spec("pre_commit") is not None:
+        return [sys.executable, "-m", "pre_commit"]
+    return None
+
+
+def _install_hooks(command: List[str], repo: Path) -> Optional[str]:
+    result = runner.run(
+        [*command, "install-hooks"], cwd=repo, capture_output=True, text=True
+    )
+    if result.returncode:
+        return (result.stderr or result.stdout).strip() or "install-hooks failed"
+    return None
+
+
+def install(project_path: Path, offline: bool = False) -> Report:
+    """Install the project's hook environments, then the git hook."""
+    config_path = project_path / CONFIG_NAME
+    if not config_path.is_file():
+        return Report(False, False, 0.0, f"no {CONFIG_NAME}")
+    command = pre_commit_command()
+    if command is None:
+        return Report(
+            False, False, 0.0, "pre-commit is not installed; run `pre-commit install`"
+        )
+    warm = is_warm(config_path.read_text())
+    if offline and not warm:
+        # The commit hook would fail trying to fetch the environments.
+        return Report(
+            False,
+            False,
+            0.0,
+            "hook environments are not cached; run `project-setup cache "
+            "warm-hooks` while online, then `pre-commit install`",
+        )
+
+    start = time.perf_counter()
+    error = _install_hooks(command, project_path)
+    if error:
+        return Report(False, warm, 0.0, error)
+    result = runner.run(
+        [*command, "install"], cwd=project_path, capture_output=True, text=True
+    )
+    if result.returncode:
+        return Report(False, warm, 0.0, result.stderr.strip() or "install failed")
+    return Report(True, warm, time.perf_counter() - start, str(hook_home()))
+
+
+def warm(language_names: Iterable[str]) -> List[Tuple[str, Report]]:
+    """Install the hook environments of each language's config."""
+    command = pre_commit_command()
+    reports = []
+    for language in language_names:
+        if language not in languages.LANGUAGES:
+            raise ValueError(f"unknown language '{language}'")
+        config = render_config(language)
+        if command is None:
+            reports.append(
+                (language, Report(False, False, 0.0, "pre-commit is not installed"))
+            )
+            continue
+        if is_warm(config):
+            reports.append((language, Report(True, True, 0.0, str(hook_home()))))
+            continue
+        start = time.perf_counter()
+        with tempfile.TemporaryDirectory(prefix="project-setup-hooks-") as tmp:
+            repo = Path(tmp)
+            runner.run(["git", "init", "-q"], cwd=repo, capture_output=True)
+            (repo / CONFIG_NAME).write_text(config)
+            error = _install_hooks(command, repo)
+        if error:
+            reports.append((language, Report(False, False, 0.0, error)))
+        else:
+            reports.append(
+                (
+                    language,
+                    Report(True, False, time.perf_counter() - start, str(hook_home())),
+                )
+            )
+    return reports
@@ -0,0 +1,153 @@
+"""Language scaffolds and the shared package stores they use.
+
+Python projects are built by the usual steps (venv, pytest...). Node, Rust
+and Go projects are rendered from the ``node``, ``rust`` and ``go``
+templates, which write the manifest (``package.json``, ``Cargo.toml``,
+``go.mod``) directly instead of running each ecosystem's init tool, plus
+configuration that points dependency fetches at a store shared by every
+project:
+
+- Node: ``.npmrc`` sets the pnpm ``store-dir`` and npm ``cache``
+- Rust: the cargo registry in ``$CARGO_HOME`` (already shared per user)
+- Go: ``.envrc`` (direnv) sets ``GOMODCACHE`` and a ``GOPROXY`` that tries
+  the local module cache before the network
+
+Fetches prefer the local store. With ``offline``, the configuration forbids
+network access instead, which needs a populated store.
+
+That configuration holds this machine's absolute store paths, so the files
+carrying it are listed in the project's ``.gitignore`` and never committed.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from project_setup import dedup, gitignore, paths
+from project_setup.templates import materialize
+
+STORE_ENV = "PROJECT_SETUP_PACKAGE_STORE"
+
+
+class Language(NamedTuple):
+    name: str
+    label: str
+    template: Optional[str]
+    gitignore: str
+    # Scaffold files with machine-specific settings, kept out of git.
+    local_config: Tuple[str, ...] = ()
+
+
+LANGUAGES: Dict[str, Language] = {
+    "python": Language("python", "Python", None, "Python"),
+    "node": Language("node", "Node", "node", "Node", ("/.npmrc",)),
+    "rust": Language("rust", "Rust", "rust", "Rust", ("/.cargo/config.toml",)),
+    "go": Language("go", "Go", "go", "Go", ("/.envrc",)),
+}
+
+
+def names() -> List[str]:
+    return list(LANGUAGES)
+
+
+def for_template(template: str) -> Optional[str]:
+    """Return the language scaffolded by the template named ``template``."""
+    return next(
+        (lang.name for lang in LANGUAGES.values() if lang.template == template),
+        None,
+    )
+
+
+def package_store() -> Path:
+    """Return the root of the shared Node and Go package stores."""
+    value = os.environ.get(STORE_ENV)
+    return Path(value) if value else paths.cache_dir() / "packages"
+
+
+def cargo_home() -> Path:
+    value = os.environ.get("CARGO_HOME")
+    return Path(value) if value else Path.home() / ".cargo"
+
+
+def store_paths() -> Dict[str, Path]:
+    root = package_store()
+    return {
+        "pnpm_store": root / "pnpm",
+        "npm_cache": root / "npm",
+        "go_mod_cache": root / "go",
+        "cargo_home": cargo_home(),
+    }
+
+
+def _populated_dir(language: str) -> Optional[Path]:
+    stores = store_paths()
+    if language == "node":
+        return stores["pnpm_store"]
+    if language == "rust":
+        return stores["cargo_home"] / "registry" / "cache"
+    if language == "go":
+        return stores["go_mod_cache"] / "cache" / "download"
+    return None
+
+
+def store_populated(language: str) -> bool:
+    """Return whether the shared store for ``language`` has any packages."""
+    directory = _populated_dir(language)
+    if directory is None:
+        return False
+    try:
+        return any(directory.iterdir())
+    except OSError:
+        return False
+
+
+def store_variables(offline: bool = False) -> Dict[str, str]:
+    """Return the template variables that wire projects to the stores."""
+    stores = store_paths()
+    download = stores["go_mod_cache"] / "cache" / "download"
+    go_proxy = (
+        "off"
+        if offline
+        else f"{download.as_uri()},https://proxy.golang.org,direct"
+    )
+    return {
+        **{name: str(path) for name, path in stores.items()},
+        "go_proxy": go_proxy,
+        "offline": "true" if offline else "false",
+    }
+
+
+def scaffold(
+    language: str,
+    project_path: Path,
+    project_name: str,
+    description: str = "",
+    offline: bool = False,
+) -> List[Path]:
+    """Render the scaffold for ``language`` into ``project_path``."""
+    template = LANGUAGES[language].template
+    if template is None:
+        return []
+    written = materialize(
+        template,
+        project_path,
+        project_name,
+        description,
+        extra=store_variables(offline),
+    )
+    ignore_local_config(language, project_path)
+    return written
+
+
+def ignore_local_config(language: str, project_path: Path) -> None:
+    """List the language's machine-specific config files in ``.gitignore``."""
+    entries = list(LANGUAGES[language].local_config)
+    if not entries:
+        return
+    ignore_file = Path(project_path) / ".gitignore"
+    text = ignore_file.read_text() if ignore_file.is_file() else ""
+    updated = gitignore.with_entries(
+        text, entries, "project-setup: paths to this machine's package stores"
+    )
+    if updated != text:
+        dedup.write_text(ignore_file, updated)
@@ -0,0 +1,226 @@
+"""Project venvs layered on a shared, read-only base of dependencies.
+
+A base is the site-packages tree of one dependency set, installed once
+with ``--target`` into the ``bases`` namespace of the cache store, keyed by
+the normalized requirements and the interpreter's cache tag and platform.
+It is byte-compiled while it is built (Python cannot write ``__pycache__``
+into it afterwards) and then made read-only.
+
+A project venv is an ordinary, empty venv with a ``.pth`` file naming the
+base. Python appends the base after the venv's own site-packages, so
+packages installed into the venv take precedence, and pip sees the base's
+distributions as installed and only adds what the project needs on top.
+The base's console and GUI scripts are written into the venv's ``bin``
+as small wrappers for the venv's interpreter (``--target`` installs leave
+them behind with the building interpreter's shebang). pip will not remove
+files outside the venv, so ``pip uninstall`` of a base package is a no-op:
+install another version into the venv to shadow it, or change the base.
+Every venv layered on a base pins it in the cache store, so the base is
+not evicted while any of them exists. Creation time, disk use and page
+cache then scale with each project's own dependencies, since the base's
+files are shared by every project that uses it.
+"""
+
+import configparser
+import os
+import shutil
+import stat
+import subprocess
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+from project_setup import cache_store, precompile, runner
+
+NAMESPACE = "bases"
+PTH_NAME = "_project_setup_base.pth"
+SCRIPT_GROUPS = ("console_scripts", "gui_scripts")
+# Longer shebang lines are cut off by the kernel.
+MAX_SHEBANG = 127
+SCRIPT_TEMPLATE = """\
+{shebang}
+# Runs {name} from the project-setup base layer.
+import sys
+from {module} import {head}
+if __name__ == "__main__":
+    sys.exit({call}())
+"""
+
+
+class BaseError(Exception):
+    """Raised when a base environment cannot be built or linked."""
+
+
+class Base(NamedTuple):
+    key: str
+    site_packages: Path
+    built: bool
+
+
+def read_requirements(path: Path) -> List[str]:
+    """Return the requirement lines of ``path``, without comments or blanks."""
+    lines = []
+    for line in path.read_text().splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if line and not line.startswith("#"):
+            lines.append(line)
+    return lines
+
+
+def interpreter_tag(python: Path) -> str:
+    """Return ``<cache tag>-<platform>`` for the interpreter at ``python``."""
+    result = runner.run(
+        [
+            str(python),
+            "-c",
+            "import sys, sysconfig; "
+            "print(f'{sys.implementation.cache_tag}-{sysconfig.get_platform()}')",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise BaseError(f"cannot run {python}: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def base_key(requirements: List[str], tag: str) -> str:
+    normalized = sorted({line.lower().replace(" ", "") for line in requirements})
+    return cache_store.key_for("\n".join([tag, *normalized]))
+
+
+def _make_read_only(root: Path) -> None:
+    read_only = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for name in filenames + dirnames:
+            path = os.path.join(dirpath, name)
+            if not os.path.islink(path):
+                os.chmod(path, os.stat(path).st_mode & read_only)
+    os.chmod(root, os.stat(root).st_mode & read_only)
+
+
+def _install_command(python: Path, target: Path, requirements: Path) -> List[str]:
+    if shutil.which("uv"):
+        return [
+            "uv",
+            "pip",
+            "install",
+            "--python",
+            str(python),
+            "--target",
+            str(target),
+            "-r",
+            str(requirements),
+        ]
+    return [
+        str(python),
+        "-m",
+        "pip",
+        "install",
+        "--disable-pip-version-check",
+        "--target",
+        str(target),
+        "-r",
+        str(requirements),
+    ]
+
+
+def ensure_base(python: Path, requirements: Path) -> Base:
+    """Return the base for ``requirements``, building it if needed."""
+    lines = read_requirements(requirements)
+    key = base_key(lines, interpreter_tag(python))
+    store = cache_store.CacheStore(NAMESPACE)
+
+    def build(staging: Path) -> None:
+        target = staging / "site-packages"
+        normalized = staging / "requirements.txt"
+        normalized.write_text("\n".join(lines) + "\n")
+        try:
+            runner.run(
+                _install_command(python, target, normalized),
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=requirements.parent,
+            )
+            runner.run(
+                [str(python), "-m", "compileall", "-q", "-j", "0", str(target)],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise BaseError(
+                f"installing the base failed: {(e.stderr or e.stdout or '').strip()}"
+            )
+        _make_read_only(target)
+
+    built = store.publish(key, build)
+    if not built:
+        store.get(key)
+    return Base(key, store.entry_path(key) / "site-packages", built)
+
+
+def entry_points(site_packages: Path) -> Dict[str, str]:
+    """Return ``{command: "module:attr"}`` for the scripts of the base."""
+    scripts: Dict[str, str] = {}
+    for path in sorted(site_packages.glob("*.dist-info/entry_points.txt")):
+        parser = configparser.ConfigParser(delimiters=("=",), interpolation=None)
+        parser.optionxform = str  # type: ignore[assignment]
+        try:
+            parser.read(path, encoding="utf-8")
+        except configparser.Error:
+            continue
+        for group in SCRIPT_GROUPS:
+            if parser.has_section(group):
+                for name, value in parser.items(group):
+                    scripts.setdefault(name, value.split("[", 1)[0].strip())
+    return scripts
+
+
+def _shebang(python: Path) -> str:
+    line = f"#!{python}"
+    if len(line) <= MAX_SHEBANG and " " not in line:
+        return line
+    # Re-executed by sh under the venv's Python, as pip's launchers do.
+    return f"#!/bin/sh\n'''exec' \"{python}\" \"$0\" \"$@\"\n' '''"
+
+
+def write_scripts(venv_path: Path, base: Base) -> List[Path]:
+    """Write wrappers for the base's scripts into the venv's ``bin``.
+
+    Commands the venv already has (its own installs, ``python``, ``pip``)
+    are left alone.
+    """
+    python = precompile.venv_python(venv_path)
+    written = []
+    for name, target in entry_points(base.site_packages).items():
+        module, _, attr = (part.strip() for part in target.partition(":"))
+        script = python.parent / name
+        if not module or not attr or script.exists():
+            continue
+        script.write_text(
+            SCRIPT_TEMPLATE.format(
+                shebang=_shebang(python),
+                name=name,
+                module=module,
+                head=attr.split(".")[0],
+                call=attr,
+            )
+        )
+        script.chmod(0o755)
+        written.append(script)
+    return written
+
+
+def link(venv_path: Path, base: Base) -> List[Path]:
+    """Layer ``venv_path`` on ``base`` and pin the base while the venv exists.
+
+    Returns the wrappers written for the base's scripts.
+    """
+    site = precompile.site_packages(venv_path)
+    if not site:
+        raise BaseError(f"no site-packages in {venv_path}")
+    (site[0] / PTH_NAME).write_text(f"{base.site_packages}\n")
+    scripts = write_scripts(venv_path, base)
+    cache_store.CacheStore(NAMESPACE).pin(base.key, venv_path)
+    return scripts
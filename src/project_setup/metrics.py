@@ -0,0 +1,255 @@
+"""Prometheus textfile metrics for project-setup runs.
+
+When ``PROJECT_SETUP_METRICS_FILE`` is set, or within ``exporting``, each
+process accumulates metrics in memory and, on exit, merges them into that
+file for the node-exporter textfile collector. ``project-init`` passes
+``child_env`` to the commands it runs, so they add to the same file. All
+series are counters or histogram counters, so merging is a sum. The file is
+rewritten under a lock and replaced atomically, so a scrape never sees a
+partial file.
+"""
+
+import atexit
+import functools
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from project_setup.locking import file_lock
+
+METRICS_ENV = "PROJECT_SETUP_METRICS_FILE"
+
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+FAMILIES = {
+    "project_setup_step_duration_seconds": (
+        "histogram",
+        "Duration of project-init steps.",
+    ),
+    "project_setup_step_failures_total": (
+        "counter",
+        "project-init steps that failed.",
+    ),
+    "project_setup_command_duration_seconds": (
+        "histogram",
+        "Duration of project-setup commands.",
+    ),
+    "project_setup_command_failures_total": (
+        "counter",
+        "project-setup commands that failed.",
+    ),
+    "project_setup_subprocess_spawns_total": (
+        "counter",
+        "External processes started, by tool.",
+    ),
+    "project_setup_files_written_total": ("counter", "Generated files written."),
+    "project_setup_bytes_written_total": ("counter", "Bytes of generated files."),
+    "project_setup_venv_backend_total": (
+        "counter",
+        "Virtual environments created, by backend.",
+    ),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_samples: Dict[Tuple[str, Labels], float] = {}
+_registered = False
+# Set by ``exporting``; takes precedence over the environment.
+_file: Optional[str] = None
+_lock = threading.Lock()
+
+_SAMPLE_RE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$")
+_LABEL_RE = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def metrics_file() -> Optional[str]:
+    return _file or os.environ.get(METRICS_ENV) or None
+
+
+@contextmanager
+def exporting(path: str) -> Iterator[None]:
+    """Export this process's metrics to ``path``, flushing them on exit."""
+    global _file
+    previous, _file = _file, path
+    try:
+        yield
+    finally:
+        flush()
+        _file = previous
+
+
+def child_env() -> Dict[str, str]:
+    """Return the metrics file set by ``exporting``, as a child's environment."""
+    return {METRICS_ENV: _file} if _file else {}
+
+
+def _add(name: str, labels: Dict[str, str], value: float) -> None:
+    global _registered
+    if metrics_file() is None:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    # Verification checks and other worker threads record concurrently.
+    with _lock:
+        _samples[key] = _samples.get(key, 0.0) + value
+        if not _registered:
+            atexit.register(flush)
+            _registered = True
+
+
+def inc(name: str, value: float = 1, **labels: str) -> None:
+    _add(name, labels, value)
+
+
+def observe(name: str, seconds: float, **labels: str) -> None:
+    for bound in DURATION_BUCKETS:
+        _add(f"{name}_bucket", {**labels, "le": str(bound)}, int(seconds <= bound))
+    _add(f"{name}_bucket", {**labels, "le": "+Inf"}, 1)
+    _add(f"{name}_sum", labels, seconds)
+    _add(f"{name}_count", labels, 1)
+
+
+def _failed(exc: BaseException) -> bool:
+    # typer.Exit and SystemExit with code 0 are normal exits.
+    code = getattr(exc, "exit_code", getattr(exc, "code", 1))
+    return code not in (0, None)
+
+
+@contextmanager
+def timed(kind: str, name: str) -> Iterator[None]:
+    """Time a step or command, counting it as failed if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        if _failed(e):
+            inc(f"project_setup_{kind}_failures_total", **{kind: name})
+        raise
+    finally:
+        observe(
+            f"project_setup_{kind}_duration_seconds",
+            time.perf_counter() - start,
+            **{kind: name},
+        )
+
+
+def step(name: str):
+    return timed("step", name)
+
+
+def command(name: str):
+    return timed("command", name)
+
+
+def instrument(name: str):
+    """Decorate a command function to record its duration and failures."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with command(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_spawn(tool: str) -> None:
+    inc("project_setup_subprocess_spawns_total", tool=tool)
+
+
+def record_write(size: int) -> None:
+    inc("project_setup_files_written_total")
+    inc("project_setup_bytes_written_total", size)
+
+
+def record_venv_backend(backend: str) -> None:
+    inc("project_setup_venv_backend_total", backend=backend)
+
+
+def _parse(text: str) -> Dict[Tuple[str, Labels], float]:
+    samples = {}
+    for line in text.splitlines():
+        match = _SAMPLE_RE.match(line.strip())
+        if not match or line.startswith("#"):
+            continue
+        name, raw_labels, value = match.groups()
+        labels = tuple(sorted(_LABEL_RE.findall(raw_labels or "")))
+        try:
+            samples[(name, labels)] = float(value)
+        except ValueError:
+            continue
+    return samples
+
+
+def _family(name: str) -> str:
+    for suffix in ("_bucket", "_sum", "_count"):
+        if name.endswith(suffix) and name[: -len(suffix)] in FAMILIES:
+            return name[: -len(suffix)]
+    return name
+
+
+def _le_key(labels: Labels) -> float:
+    le = dict(labels).get("le")
+    return float("inf") if le in (None, "+Inf") else float(le)
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render(samples: Dict[Tuple[str, Labels], float]) -> str:
+    """Render samples in the Prometheus text exposition format."""
+    by_family: Dict[str, list] = {}
+    for (name, labels), value in samples.items():
+        by_family.setdefault(_family(name), []).append((name, labels, value))
+
+    lines = []
+    for family in sorted(by_family):
+        kind, help_text = FAMILIES.get(family, ("untyped", ""))
+        if help_text:
+            lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+        rows = sorted(
+            by_family[family],
+            key=lambda r: (
+                tuple(kv for kv in r[1] if kv[0] != "le"),
+                r[0],
+                _le_key(r[1]),
+            ),
+        )
+        for name, labels, value in rows:
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+            series = f"{name}{{{label_text}}}" if label_text else name
+            lines.append(f"{series} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def flush() -> None:
+    """Merge this process's samples into the metrics file."""
+    path = metrics_file()
+    if path is None or not _samples:
+        return
+    target = Path(path)
+    try:
+        with file_lock(target.with_name(target.name + ".lock")):
+            try:
+                merged = _parse(target.read_text())
+            except OSError:
+                merged = {}
+            for key, value in _samples.items():
+                merged[key] = merged.get(key, 0.0) + value
+            fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".metrics-")
+            with os.fdopen(fd, "w") as f:
+                f.write(render(merged))
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, target)
+        _samples.clear()
+    except OSError as e:
+        print(f"Warning: could not write metrics to {path}: {e}", file=sys.stderr)
@@ -0,0 +1,64 @@
+"""Bare mirrors of cloned repositories, kept in the cache store.
+
+``git-setup`` clones borrow objects from the mirror of their URL when one
+exists. A missing or stale mirror is rebuilt from the fresh clone, not the
+remote, by a detached ``project-setup cache fill-mirror`` process, so the
+clone makes one network transfer and never waits for the mirror.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+
+from project_setup import cache_store, runner
+
+NAMESPACE = "mirrors"
+# Mirrors older than this are rebuilt from the next clone of the same URL.
+MAX_AGE = 7 * 86400
+
+
+def mirrors_store() -> cache_store.CacheStore:
+    return cache_store.CacheStore(NAMESPACE)
+
+
+def needs_refresh(url: str) -> bool:
+    entry = mirrors_store().entry(cache_store.key_for(url))
+    return entry is None or time.time() - entry.created > MAX_AGE
+
+
+def refresh(url: str, clone: Path) -> bool:
+    """Publish a bare mirror of ``url``, built from the local ``clone``."""
+
+    def build(staging: Path) -> None:
+        mirror = staging / "repo.git"
+        runner.run(
+            ["git", "clone", "--mirror", "--no-local", str(clone), str(mirror)],
+            capture_output=True,
+            check=True,
+        )
+        runner.run(
+            ["git", "-C", str(mirror), "remote", "set-url", "origin", url],
+            capture_output=True,
+            check=True,
+        )
+
+    try:
+        return mirrors_store().publish(cache_store.key_for(url), build, replace=True)
+    except (subprocess.CalledProcessError, OSError):
+        # The mirror only speeds up later clones.
+        return False
+
+
+def refresh_in_background(url: str, clone: Path) -> None:
+    """Start ``refresh`` in a process that outlives this command."""
+    try:
+        runner.start(
+            [*runner.self_command(), "cache", "fill-mirror", url, str(clone)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
@@ -0,0 +1,294 @@
+"""In-process mock of the hosting API, for offline tests and benchmarks.
+
+Implements ``POST /user/repos`` over HTTP/1.1 keep-alive, backing each
+repository with a bare git repository whose path is returned as the
+``clone_url``, so the full create-and-push flow runs without network.
+``GET /repos/mock/<name>`` returns a created repository. Per-request
+latency, connection setup cost (TCP and TLS handshakes), rate limiting and
+lost connections can be simulated::
+
+    with MockHostingServer(root, latency=0.05, handshake=0.1) as server:
+        client = HostingClient(server.url, token="test")
+        ...
+    server.requests, server.connections
+
+Run standalone with ``python -m project_setup.mock_remote --root DIR`` and
+point ``PROJECT_SETUP_API_URL`` at the printed URL.
+"""
+
+import argparse
+import json
+import re
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body are separate writes; without this, Nagle's
+        # algorithm and delayed ACKs stall every keep-alive response.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.mock._count("connections")
+        with self.server.mock._lock:
+            self.server.mock._sockets.add(self.request)
+        if self.server.mock.handshake:
+            time.sleep(self.server.mock.handshake)
+
+    def finish(self) -> None:
+        with self.server.mock._lock:
+            self.server.mock._sockets.discard(self.request)
+        super().finish()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send(
+        self, status: int, payload: dict, headers: Optional[dict] = None
+    ) -> None:
+        if self.server.mock._next_drop():
+            # The request was handled, but its response is lost.
+            self.close_connection = True
+            return
+        gateway = self.server.mock._next_gateway_error()
+        if gateway is not None:
+            # The request was handled, but a gateway answered in its place.
+            status, payload, headers = gateway, {"message": "Gateway error"}, None
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        mock = self.server.mock
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        mock._count("requests")
+        if mock.latency:
+            time.sleep(mock.latency)
+
+        authorization = self.headers.get("Authorization")
+        if mock.token and authorization != f"Bearer {mock.token}":
+            self._send(401, {"message": "Bad credentials"})
+            return
+        throttle = mock._next_throttle()
+        if throttle is not None:
+            status, headers = throttle
+            self._send(status, {"message": "API rate limit exceeded"}, headers)
+            return
+        if self.path != "/user/repos":
+            self._send(404, {"message": "Not Found"})
+            return
+        try:
+            payload = json.loads(raw or b"{}")
+        except ValueError:
+            self._send(400, {"message": "Problems parsing JSON"})
+            return
+        status, body = mock._create(payload)
+        self._send(status, body)
+
+    def do_GET(self) -> None:
+        mock = self.server.mock
+        mock._count("requests")
+        prefix, _, name = self.path.rpartition("/")
+        with mock._lock:
+            repo = mock.repos.get(name) if prefix == "/repos/mock" else None
+        if repo:
+            self._send(200, repo)
+        else:
+            self._send(404, {"message": "Not Found"})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    mock: "MockHostingServer"
+
+
+class MockHostingServer:
+    """A local hosting API that creates bare repositories under ``root``."""
+
+    def __init__(
+        self,
+        root: Path,
+        latency: float = 0.0,
+        token: Optional[str] = None,
+        handshake: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.root = Path(root)
+        self.latency = latency
+        self.token = token
+        self.handshake = handshake
+        self.requests = 0
+        self.connections = 0
+        self.repos: Dict[str, dict] = {}
+        self._throttles: List[tuple] = []
+        self._drops = 0
+        self._gateway_errors: List[int] = []
+        self._sockets: Set[socket.socket] = set()
+        self._lock = threading.Lock()
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def throttle(
+        self, count: int = 1, retry_after: Optional[float] = 0, status: int = 429
+    ) -> None:
+        """Answer the next ``count`` requests as rate limited.
+
+        With ``retry_after`` the response is ``status`` (``429`` or ``503``)
+        with ``Retry-After``; with None it is ``403`` with an exhausted
+        ``X-RateLimit-Remaining``.
+        """
+        if retry_after is not None:
+            response = (status, {"Retry-After": str(retry_after)})
+        else:
+            reset = str(int(time.time()))
+            response = (
+                403,
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+            )
+        with self._lock:
+            self._throttles.extend([response] * count)
+
+    def drop(self, count: int = 1) -> None:
+        """Handle the next ``count`` requests but close without responding."""
+        with self._lock:
+            self._drops += count
+
+    def gateway_error(self, status: int = 504, count: int = 1) -> None:
+        """Handle the next ``count`` requests but answer with ``status``."""
+        with self._lock:
+            self._gateway_errors.extend([status] * count)
+
+    def close_idle(self) -> None:
+        """Close every open connection, as a server's idle timeout would."""
+        with self._lock:
+            sockets = list(self._sockets)
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _next_drop(self) -> bool:
+        with self._lock:
+            if not self._drops:
+                return False
+            self._drops -= 1
+            return True
+
+    def _next_gateway_error(self) -> Optional[int]:
+        with self._lock:
+            return self._gateway_errors.pop(0) if self._gateway_errors else None
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _next_throttle(self) -> Optional[tuple]:
+        with self._lock:
+            return self._throttles.pop(0) if self._throttles else None
+
+    def _create(self, payload: dict) -> tuple:
+        name = str(payload.get("name", ""))
+        if not _NAME_RE.match(name) or name in (".", ".."):
+            return 422, {
+                "message": "Validation Failed",
+                "errors": [{"message": "name is invalid"}],
+            }
+        with self._lock:
+            if name in self.repos:
+                return 422, {
+                    "message": "Repository creation failed.",
+                    "errors": [{"message": "name already exists on this account"}],
+                }
+            self.repos[name] = {}
+        path = self.root / f"{name}.git"
+        subprocess.run(
+            ["git", "init", "--bare", "-q", str(path)],
+            check=True,
+            capture_output=True,
+        )
+        repo = {
+            "name": name,
+            "full_name": f"mock/{name}",
+            "private": bool(payload.get("private", False)),
+            "description": payload.get("description") or None,
+            "clone_url": str(path),
+            "html_url": f"{self.url}/mock/{name}",
+        }
+        with self._lock:
+            self.repos[name] = repo
+        return 201, repo
+
+    def start(self) -> "MockHostingServer":
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockHostingServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a mock hosting API.")
+    parser.add_argument("--root", type=Path, help="Directory for bare repositories")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds per request"
+    )
+    parser.add_argument(
+        "--handshake", type=float, default=0.0, help="Seconds per new connection"
+    )
+    parser.add_argument("--token", help="Require this token")
+    args = parser.parse_args()
+
+    root = args.root or Path(tempfile.mkdtemp(prefix="mock-remote-"))
+    server = MockHostingServer(
+        root, args.latency, args.token, args.handshake, port=args.port
+    )
+    print(f"Mock hosting API at {server.url} (repositories in {root})")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
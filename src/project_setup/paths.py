@@ -0,0 +1,35 @@
+"""Per-user directories for project-setup data and caches."""
+
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+APP_NAME = "project-setup"
+
+
+def _base(env_var: str, windows_var: str, default: str) -> Path:
+    value = os.environ.get(env_var)
+    if value:
+        return Path(value)
+    if sys.platform == "win32" and os.environ.get(windows_var):
+        return Path(os.environ[windows_var])
+    return Path.home() / default
+
+
+def cache_dir() -> Path:
+    """Return the cache directory (``$XDG_CACHE_HOME/project-setup``)."""
+    return _base("XDG_CACHE_HOME", "LOCALAPPDATA", ".cache") / APP_NAME
+
+
+def data_dir() -> Path:
+    """Return the user data directory (``$XDG_DATA_HOME/project-setup``)."""
+    return _base("XDG_DATA_HOME", "APPDATA", ".local/share") / APP_NAME
+
+
+def system_data_dirs() -> List[Path]:
+    """Return the system data directories from ``$XDG_DATA_DIRS``."""
+    if sys.platform == "win32":
+        return []
+    value = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+    return [Path(d) / APP_NAME for d in value.split(os.pathsep) if d]
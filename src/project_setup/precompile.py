@@ -0,0 +1,121 @@
+"""Bytecode precompilation of new virtual environments and projects.
+
+The first import of every module compiles it to ``.pyc``, one file at a
+time. Precompiling runs ``compileall`` with one worker per core in a child
+process, using the venv's own interpreter so the bytecode matches the
+version that will load it, while the rest of project-init carries on. The
+child's CPU time is what the first imports would otherwise have spent.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from project_setup import runner
+
+SOURCE_DIRS = ("src", "tests")
+
+
+class Report(NamedTuple):
+    files: int
+    workers: int
+    wall: float
+    cpu: Optional[float]
+    ok: bool
+
+    def describe(self) -> str:
+        text = (
+            f"Bytecode for {self.files} modules ready in {self.wall:.2f} s "
+            f"({self.workers} workers)"
+        )
+        if self.cpu is not None:
+            text += f"; up to {self.cpu:.2f} s of compilation moved off first import"
+        return text if self.ok else text + " (some files failed to compile)"
+
+
+def venv_python(venv_path: Path) -> Path:
+    if sys.platform == "win32":
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def site_packages(venv_path: Path) -> List[Path]:
+    if sys.platform == "win32":
+        candidates = [venv_path / "Lib" / "site-packages"]
+    else:
+        candidates = sorted(venv_path.glob("lib/python*/site-packages"))
+    return [p for p in candidates if p.is_dir()]
+
+
+def source_dirs(project_path: Path) -> List[Path]:
+    return [project_path / d for d in SOURCE_DIRS if (project_path / d).is_dir()]
+
+
+def count_sources(paths: List[Path]) -> int:
+    total = 0
+    for path in paths:
+        for _, _, filenames in os.walk(path):
+            total += sum(1 for f in filenames if f.endswith(".py"))
+    return total
+
+
+class Precompile:
+    """A ``compileall`` run in a child process."""
+
+    def __init__(self, python: Path, paths: List[Path], workers: int = 0) -> None:
+        self.paths = paths
+        self.files = count_sources(paths)
+        self.workers = workers or os.cpu_count() or 1
+        self._start = time.perf_counter()
+        self.process = runner.start(
+            [
+                str(python),
+                "-m",
+                "compileall",
+                "-q",
+                "-j",
+                str(self.workers),
+                *(str(p) for p in paths),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def wait(self) -> Report:
+        cpu = None
+        if hasattr(os, "wait4"):
+            # wait4 reports the CPU time of this child (and its workers) alone.
+            _, status, usage = os.wait4(self.process.pid, 0)
+            self.process.returncode = os.waitstatus_to_exitcode(status)
+            cpu = usage.ru_utime + usage.ru_stime
+        else:
+            self.process.wait()
+        return Report(
+            self.files,
+            self.workers,
+            time.perf_counter() - self._start,
+            cpu,
+            self.process.returncode == 0,
+        )
+
+
+def start(
+    project_path: Path, include_venv: bool = True, include_sources: bool = True
+) -> Optional[Precompile]:
+    """Start precompiling the venv and/or sources of ``project_path``."""
+    venv_path = project_path / ".venv"
+    python = venv_python(venv_path)
+    if not python.exists():
+        python = Path(sys.executable)
+    paths = []
+    if include_venv:
+        paths.extend(site_packages(venv_path))
+    if include_sources:
+        paths.extend(source_dirs(project_path))
+    if not paths:
+        return None
+    return Precompile(python, paths)
+
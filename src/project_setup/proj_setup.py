@@ -5,15 +5,12 @@ from typing import Optional
 
 import typer
 
-from project_setup.git_setup import git_setup
-from project_setup.venv_setup import venv_setup
-from project_setup.cli_config import cli_config
-from project_setup.project_init import project_init
+from project_setup import gitignore, languages, metrics
+from project_setup.template_registry import TemplateRegistry
+from project_setup.templates import TemplateError, materialize
 
-app = typer.Typer()
 
-
-@app.command(name="proj-setup")
+@metrics.instrument("proj-setup")
 def proj_setup(
     project_name: Optional[str] = typer.Argument(
         None, help="Name of the project to create"
@@ -23,6 +20,12 @@ def proj_setup(
     ),
     flat: bool = typer.Option(False, "--flat", help="Flat structure (no src/)"),
     src: bool = typer.Option(True, "--src", help="Use src/ structure (default)"),
+    template: Optional[str] = typer.Option(
+        None,
+        "--template",
+        "-t",
+        help="Project template (library, cli, fastapi) or path to a bundle",
+    ),
 ) -> None:
     if flat and src:
         src = False
@@ -38,6 +41,10 @@ def proj_setup(
             flat = False
         if isinstance(src, typer.models.OptionInfo):
             src = True
+        if isinstance(template, typer.models.OptionInfo):
+            template = None
+
+    registry = TemplateRegistry()
 
     if is_interactive:
         project_name = typer.prompt("Project name")
@@ -47,11 +54,13 @@ def proj_setup(
         )
         path = path_input if path_input else str(Path.cwd())
         structure = typer.prompt(
-            "Structure type (flat/src)",
+            f"Structure type ({'/'.join(['flat', 'src'] + registry.names())})",
             default="src",
         )
         flat = structure == "flat"
         src = structure == "src"
+        if not flat and not src:
+            template = structure
 
     if path is None or path == "":
         path_obj = Path.cwd()
@@ -60,6 +69,15 @@ def proj_setup(
 
     project_path = path_obj / project_name
 
+    language = None
+    if template:
+        language = languages.for_template(template)
+        try:
+            template = str(registry.resolve(template))
+        except TemplateError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(code=1)
+
     if project_path.exists():
         typer.echo(f"Error: Directory '{project_path}' already exists", err=True)
         raise typer.Exit(code=1)
@@ -70,7 +88,21 @@ def proj_setup(
         typer.echo(f"Error creating directory: {e}", err=True)
         raise typer.Exit(code=1)
 
-    if flat:
+    if template:
+        try:
+            # Language templates reference the shared package stores.
+            materialize(
+                template,
+                project_path,
+                project_name,
+                extra=languages.store_variables(),
+            )
+        except TemplateError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(code=1)
+        if language:
+            languages.ignore_local_config(language, project_path)
+    elif flat:
         init_file = project_path / "__init__.py"
         init_file.touch()
     else:
@@ -82,141 +114,38 @@ def proj_setup(
     typer.echo(project_path)
 
 
-@app.command(name="git-setup")
-def git_setup_cmd(
-    project_name: Optional[str] = typer.Argument(
-        None, help="Name of the project (for new mode)"
-    ),
-    mode: Optional[str] = typer.Option(
-        None, "--mode", help="Mode: new, existing, or none"
-    ),
-    url: Optional[str] = typer.Option(
-        None, "--url", help="Repository URL for existing mode"
-    ),
-    public: Optional[bool] = typer.Option(None, "--public", help="Public repository"),
-    private: Optional[bool] = typer.Option(
-        None, "--private", help="Private repository"
-    ),
-    description: Optional[str] = typer.Option(
-        None, "--description", help="Project description"
+def templates_cmd(
+    add: Optional[str] = typer.Option(
+        None, "--add", help="Pack a template directory into the user templates"
     ),
-    include_gitignore: Optional[bool] = typer.Option(
-        None, "--include-gitignore", help="Include .gitignore file"
-    ),
-    include_readme: Optional[bool] = typer.Option(
-        None, "--include-readme", help="Include README.md file"
-    ),
-    template: Optional[str] = typer.Option(
-        None, "--template", help="Gitignore template: Python, Node, Rust, Go, Blank"
+    list_gitignore: bool = typer.Option(
+        False, "--gitignore", help="List the .gitignore templates instead"
     ),
 ) -> None:
-    git_setup(
-        project_name=project_name,
-        mode=mode,
-        url=url,
-        public=public,
-        private=private,
-        description=description,
-        include_gitignore=include_gitignore,
-        include_readme=include_readme,
-        template=template,
-    )
+    """List available project templates."""
+    if list_gitignore:
+        for name in gitignore.names():
+            typer.echo(name)
+        return
 
+    registry = TemplateRegistry()
 
-@app.command(name="venv-setup")
-def venv_setup_cmd(
-    project_dir: Optional[str] = typer.Argument(None, help="Project directory path"),
-    yes: bool = typer.Option(False, "--yes", help="Skip prompt, create venv"),
-    use_uv: Optional[bool] = typer.Option(
-        None, "--use-uv", help="Use uv for venv creation"
-    ),
-    use_python: Optional[bool] = typer.Option(
-        None, "--use-python", help="Use python -m venv"
-    ),
-) -> None:
-    venv_setup(
-        project_dir=project_dir,
-        yes=yes,
-        use_uv=use_uv,
-        use_python=use_python,
-    )
+    if add:
+        try:
+            dest = registry.add(Path(add))
+        except (OSError, ValueError, TemplateError) as e:
+            typer.echo(f"Error adding template: {e}", err=True)
+            raise typer.Exit(code=1)
+        typer.echo(f"Added: {dest}")
 
+    for name, entry in registry.templates().items():
+        typer.echo(f"{name:<16} {entry['description']}")
 
-@app.command(name="cli-config")
-def cli_config_cmd(
-    project_dir: Optional[str] = typer.Argument(None, help="Project directory path"),
-    workflow: Optional[str] = typer.Option(
-        None, "--workflow", help="Workflow type: agentic or assisted"
-    ),
-    cli: Optional[str] = typer.Option(
-        None, "--cli", help="CLI tool: opencode, claude, or both"
-    ),
-    server: Optional[str] = typer.Option(
-        None, "--server", help="Server mode for opencode: local or server"
-    ),
-    include_handoff: bool = typer.Option(
-        False, "--include-handoff", help="Include handoff plugin"
-    ),
-) -> None:
-    cli_config(
-        project_dir=project_dir,
-        workflow=workflow,
-        cli=cli,
-        server=server,
-        include_handoff=include_handoff,
-    )
 
-
-@app.command(name="project-init")
-def project_init_cmd(
-    git: Optional[str] = typer.Option(
-        None, "--git", help="Git mode: new, existing, or none"
-    ),
-    name: Optional[str] = typer.Option(None, "--name", help="Project name"),
-    url: Optional[str] = typer.Option(
-        None, "--url", help="Repository URL for existing mode"
-    ),
-    public: Optional[bool] = typer.Option(None, "--public", help="Public repository"),
-    private: Optional[bool] = typer.Option(
-        None, "--private", help="Private repository"
-    ),
-    venv: Optional[bool] = typer.Option(
-        None, "--venv", help="Create virtual environment"
-    ),
-    no_venv: Optional[bool] = typer.Option(
-        None, "--no-venv", help="Skip virtual environment creation"
-    ),
-    cli: Optional[str] = typer.Option(
-        None, "--cli", help="CLI tool: opencode, claude, or both"
-    ),
-    server: Optional[str] = typer.Option(
-        None, "--server", help="Server mode for opencode: local or server"
-    ),
-    workflow: Optional[str] = typer.Option(
-        None, "--workflow", help="Workflow type: agentic or assisted"
-    ),
-    pytest: Optional[bool] = typer.Option(
-        None, "--pytest", help="Set up pytest testing"
-    ),
-    no_pytest: Optional[bool] = typer.Option(
-        None, "--no-pytest", help="Skip pytest setup"
-    ),
-) -> None:
-    project_init(
-        git=git,
-        name=name,
-        url=url,
-        public=public,
-        private=private,
-        venv=venv,
-        no_venv=no_venv,
-        cli=cli,
-        server=server,
-        workflow=workflow,
-        pytest=pytest,
-        no_pytest=no_pytest,
-    )
+def main() -> None:
+    """Entry point for the proj-setup CLI command."""
+    typer.run(proj_setup)
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -0,0 +1,226 @@
+"""Contents of the files generated into a project, by relative path.
+
+The commands write these to disk; ``project-init --emit-tar`` renders the
+same contents straight into a tar stream, without a project directory.
+
+The editor settings and ``pyrightconfig.json`` exclude what the project's
+``.gitignore`` ignores, so VS Code and Pyright do not watch, search or
+analyze the venv, caches and build output.
+"""
+
+import json
+import sys
+from typing import Dict, List, Optional
+
+from project_setup import gitignore, pytest_profiles
+
+EDITORCONFIG = """root = true
+
+[*]
+indent_style = space
+indent_size = 4
+end_of_line = lf
+charset = utf-8
+trim_trailing_whitespace = true
+insert_final_newline = true
+
+[*.py]
+indent_size = 4
+
+[*.{json,yaml,yml}]
+indent_size = 2
+
+[*.md]
+trim_trailing_whitespace = false
+"""
+
+EXAMPLE_TEST = '''"""Example test file."""
+
+
+def test_example():
+    """Example test."""
+    assert True
+'''
+
+# Ignored directories that are also hidden from the explorer; build output
+# and the like stay visible.
+CACHE_DIRS = (
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".hypothesis",
+    ".tox",
+    ".nox",
+)
+# Venv directory names, in the order the IDE step looks for one.
+VENV_DIRS = (".venv", "venv", "env")
+# Pyright's default excludes, which an explicit exclude list replaces.
+PYRIGHT_EXCLUDES = ["**/node_modules", "**/__pycache__", "**/.*"]
+
+OPENCODE_INIT = '#!/usr/bin/env python3\n"""Init command for opencode."""\n'
+HANDOFF_PLUGIN = (
+    "# Handoff plugin placeholder\n"
+    "# This is a ROADMAP item for future implementation\n"
+)
+
+
+def readme(project_name: str, description: Optional[str]) -> str:
+    content = f"# {project_name}\n"
+    if description:
+        content += f"\n{description}\n"
+    return content
+
+
+def repository_files(
+    project_name: str,
+    template: Optional[str],
+    include_readme: bool,
+    description: Optional[str],
+) -> Dict[str, str]:
+    """Return the files of a new repository's initial commit."""
+    files = {}
+    if template:
+        files[".gitignore"] = gitignore.render(template)
+    if include_readme:
+        files["README.md"] = readme(project_name, description)
+    return files
+
+
+def _json(data: Dict) -> str:
+    # A final newline, as end-of-file-fixer would leave it.
+    return json.dumps(data, indent=2) + "\n"
+
+
+def opencode_settings(server: str, workflow: str) -> str:
+    return _json({"server": server, "workflow": workflow})
+
+
+def claude_settings(workflow: str) -> str:
+    return _json({"workflow": workflow})
+
+
+def cli_files(
+    cli: str,
+    workflow: str,
+    server: Optional[str],
+    include_handoff: bool,
+    include_init: bool = False,
+) -> Dict[str, str]:
+    """Return the opencode/claude settings that ``cli-config`` writes."""
+    files = {}
+    if cli in ("opencode", "both"):
+        files[".opencode/settings.json"] = opencode_settings(
+            server or "local", workflow
+        )
+        if include_init:
+            files[".opencode/commands/init.py"] = OPENCODE_INIT
+    if cli in ("claude", "both"):
+        files[".claude/settings.json"] = claude_settings(workflow)
+    if cli == "both" and include_handoff:
+        files[".opencode/mcp/handoff.py"] = HANDOFF_PLUGIN
+    return files
+
+
+def _ignored(ignore_text: str, venv: Optional[str]) -> List[gitignore.Pattern]:
+    ignored = gitignore.patterns(ignore_text)
+    if venv and not any(p.glob in (venv, f"**/{venv}") for p in ignored):
+        ignored.append(gitignore.Pattern(venv, True))
+    return ignored
+
+
+def exclude_settings(ignore_text: str, venv: Optional[str] = None) -> Dict:
+    """Return the VS Code watcher, search and explorer excludes."""
+    ignored = _ignored(ignore_text, venv)
+    return {
+        "files.watcherExclude": {
+            f"{p.glob}/**" if p.directory else p.glob: True for p in ignored
+        },
+        "search.exclude": {p.glob: True for p in ignored},
+        "files.exclude": {
+            p.glob: True
+            for p in ignored
+            if p.directory and p.glob.rsplit("/", 1)[-1] in CACHE_DIRS
+        },
+    }
+
+
+def vscode_settings(
+    language: str = "python", ignore_text: str = "", venv: Optional[str] = None
+) -> str:
+    settings = exclude_settings(ignore_text, venv if language == "python" else None)
+    if language != "python":
+        return _json({"editor.formatOnSave": True, **settings})
+    settings = {
+        "python.defaultInterpreterPath": f"{venv or '.venv'}/Scripts/python.exe"
+        if sys.platform == "win32"
+        else f"{venv or '.venv'}/bin/python",
+        "editor.formatOnSave": True,
+        "editor.codeActionsOnSave": {
+            "source.organizeImports": True,
+        },
+        **settings,
+    }
+    return _json(settings)
+
+
+def pyright_config(
+    ignore_text: str = "", src_layout: bool = False, venv: Optional[str] = None
+) -> str:
+    """Return ``pyrightconfig.json``, excluding ignored directories.
+
+    ``venv`` is set only when the project has one, since Pyright reports a
+    missing venv as an error.
+    """
+    exclude = list(PYRIGHT_EXCLUDES)
+    for pattern in _ignored(ignore_text, venv):
+        # Pyright globs have no character classes.
+        if "[" not in pattern.glob and pattern.glob not in exclude:
+            exclude.append(pattern.glob)
+    config: Dict = {
+        "include": ["src", "tests"] if src_layout else ["."],
+        "exclude": exclude,
+        "stubPath": "typings",
+        "typeCheckingMode": "basic",
+    }
+    if src_layout:
+        config["extraPaths"] = ["src"]
+    if venv:
+        config["venvPath"] = "."
+        config["venv"] = venv
+    return _json(config)
+
+
+def ide_files(
+    language: str = "python",
+    ignore_text: str = "",
+    src_layout: bool = False,
+    venv: Optional[str] = None,
+) -> Dict[str, str]:
+    """Return the IDE files, given the project's .gitignore, layout and venv."""
+    files = {
+        ".vscode/settings.json": vscode_settings(language, ignore_text, venv),
+        ".editorconfig": EDITORCONFIG,
+    }
+    if language == "python":
+        files["pyrightconfig.json"] = pyright_config(ignore_text, src_layout, venv)
+    return files
+
+
+def pytest_files(
+    profile: str = "basic", pyproject: Optional[str] = None
+) -> Dict[str, str]:
+    """Return the pytest scaffolding; the ``perf`` profile adds its tree.
+
+    ``perf`` also adds its dev dependencies to ``pyproject`` (the project's
+    ``pyproject.toml`` text, None without one).
+    """
+    files = {
+        "tests/__init__.py": "",
+        "tests/test_example.py": EXAMPLE_TEST,
+        "pytest.ini": pytest_profiles.pytest_ini(profile),
+    }
+    if profile == "perf":
+        files.update(pytest_profiles.perf_files())
+        files.update(pytest_profiles.dev_dependency_files(pyproject))
+    return files
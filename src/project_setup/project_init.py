@@ -1,13 +1,37 @@
-"""Project initialization orchestrator."""
+"""Project initialization orchestrator.
 
-import json
+Modules only some runs need (remote, verify, docker, tar output...) are
+imported by the step that uses them, so a plain run does not load them.
+"""
+
+import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import typer
 
+from project_setup import (
+    dedup,
+    gitignore,
+    languages,
+    metrics,
+    plugins,
+    project_files,
+    pytest_profiles,
+    runner,
+)
+from project_setup.templates import TemplateError
+
+if TYPE_CHECKING:
+    from project_setup import detect, verify
+
+
+def child_env() -> Dict[str, str]:
+    """Return the environment of the commands project-init runs."""
+    return {**os.environ, **metrics.child_env(), **dedup.child_env()}
+
 
 def run_git_setup(
     project_name: Optional[str],
@@ -22,7 +46,7 @@ def run_git_setup(
     is_interactive: bool,
 ) -> str:
     """Run git-setup and return the project path."""
-    cmd = [sys.executable, "-m", "project_setup", "git-setup"]
+    cmd = [*runner.self_command(), "git-setup"]
 
     if project_name:
         cmd.append(project_name)
@@ -44,10 +68,11 @@ def run_git_setup(
     if template:
         cmd.extend(["--template", template])
 
-    result = subprocess.run(
+    result = runner.run(
         cmd,
         capture_output=True,
         text=True,
+        env=child_env(),
     )
 
     if result.returncode != 0:
@@ -69,7 +94,7 @@ def run_venv_setup(
     use_python: Optional[bool],
 ) -> None:
     """Run venv-setup."""
-    cmd = [sys.executable, "-m", "project_setup", "venv-setup", project_dir]
+    cmd = [*runner.self_command(), "venv-setup", project_dir]
 
     if yes:
         cmd.append("--yes")
@@ -78,10 +103,11 @@ def run_venv_setup(
     if use_python:
         cmd.append("--use-python")
 
-    result = subprocess.run(
+    result = runner.run(
         cmd,
         capture_output=True,
         text=True,
+        env=child_env(),
     )
 
     if result.returncode != 0:
@@ -89,6 +115,15 @@ def run_venv_setup(
         raise typer.Exit(code=1)
 
 
+def finish_staged_venv(project_path: Path, backend: str) -> None:
+    """Complete a venv adopted from speculation as venv-setup would."""
+    from project_setup.venv_setup import update_gitignore
+
+    metrics.record_venv_backend(backend)
+    update_gitignore(project_path)
+    typer.echo(f"Virtual environment created at: {project_path / '.venv'} ({backend})")
+
+
 def run_cli_config(
     project_dir: str,
     workflow: Optional[str],
@@ -98,7 +133,7 @@ def run_cli_config(
     is_interactive: bool,
 ) -> None:
     """Run cli-config."""
-    cmd = [sys.executable, "-m", "project_setup", "cli-config", project_dir]
+    cmd = [*runner.self_command(), "cli-config", project_dir]
 
     if workflow:
         cmd.extend(["--workflow", workflow])
@@ -109,10 +144,11 @@ def run_cli_config(
     if include_handoff:
         cmd.append("--include-handoff")
 
-    result = subprocess.run(
+    result = runner.run(
         cmd,
         capture_output=True,
         text=True,
+        env=child_env(),
     )
 
     if result.returncode != 0:
@@ -120,90 +156,154 @@ def run_cli_config(
         raise typer.Exit(code=1)
 
 
-def create_ide_config(project_path: Path) -> None:
-    """Create IDE configuration files."""
-    vscode_dir = project_path / ".vscode"
-    vscode_dir.mkdir(exist_ok=True)
-
-    vscode_settings = {
-        "python.defaultInterpreterPath": ".venv/Scripts/python.exe"
-        if sys.platform == "win32"
-        else ".venv/bin/python",
-        "python.analysis.typeCheckingMode": "basic",
-        "editor.formatOnSave": True,
-        "editor.codeActionsOnSave": {
-            "source.organizeImports": True,
-        },
-    }
-
-    settings_file = vscode_dir / "settings.json"
-    with open(settings_file, "w") as f:
-        json.dump(vscode_settings, f, indent=2)
-    typer.echo(f"Created: {settings_file}")
-
-    editorconfig_content = """root = true
-
-[*]
-indent_style = space
-indent_size = 4
-end_of_line = lf
-charset = utf-8
-trim_trailing_whitespace = true
-insert_final_newline = true
-
-[*.py]
-indent_size = 4
-
-[*.{json,yaml,yml}]
-indent_size = 2
-
-[*.md]
-trim_trailing_whitespace = false
-"""
+def check_language(language: str, offline: Optional[bool]) -> None:
+    """Validate the language, and that its store can serve an offline project."""
+    if language not in languages.LANGUAGES:
+        typer.echo(
+            f"Error: Invalid language '{language}'. "
+            f"Use {', '.join(languages.names())}.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    if offline and language == "python":
+        typer.echo("Error: --offline applies to node, rust and go projects", err=True)
+        raise typer.Exit(code=1)
+    if offline and not languages.store_populated(language):
+        typer.echo(
+            f"Error: --offline needs a populated {language} package store "
+            f"(see {languages.package_store()})",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+
+def plan_plugin_steps() -> Dict[str, List[plugins.PluginStep]]:
+    """Discover plugin steps and group them by the built-in step they follow."""
+    try:
+        return plugins.schedule(plugins.discover())
+    except plugins.PluginError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
 
-    editorconfig_file = project_path / ".editorconfig"
-    with open(editorconfig_file, "w") as f:
-        f.write(editorconfig_content)
-    typer.echo(f"Created: {editorconfig_file}")
 
+def run_plugin_steps(
+    plan: Dict[str, List[plugins.PluginStep]],
+    after: str,
+    context: plugins.StepContext,
+) -> None:
+    """Run the plugin steps scheduled after the built-in step ``after``."""
+    for step in plan.get(after, []):
+        typer.echo(f"--- Plugin Step: {step.name} ---")
+        with metrics.step(f"plugin:{step.name}"):
+            try:
+                plugins.run(step, context)
+            except plugins.PluginError as e:
+                typer.echo(f"Error: {e}", err=True)
+                raise typer.Exit(code=1)
+        typer.echo("")
 
-def setup_pytest(project_path: Path) -> None:
-    """Set up pytest for the project."""
-    tests_dir = project_path / "tests"
-    tests_dir.mkdir(exist_ok=True)
 
-    init_file = tests_dir / "__init__.py"
-    init_file.touch()
+def run_scaffold(
+    language: str, project_path: Path, description: Optional[str], offline: bool
+) -> None:
+    """Render the language scaffold into the project."""
+    try:
+        written = languages.scaffold(
+            language, project_path, project_path.name, description or "", offline
+        )
+    except (OSError, TemplateError) as e:
+        typer.echo(f"Error creating {language} scaffold: {e}", err=True)
+        raise typer.Exit(code=1)
+    for path in written:
+        typer.echo(f"Created: {path}")
+
+
+def detect_project(project_path: Path) -> "detect.Detection":
+    """Scan a cloned repository for its languages, layout, tests and venvs."""
+    from project_setup import detect
+
+    detection = detect.scan(project_path)
+    typer.echo(detection.describe())
+    return detection
+
+
+def create_ide_config(project_path: Path, language: str = "python") -> None:
+    """Create IDE configuration files.
+
+    Editor and Pyright excludes follow the project's .gitignore, ``src/``
+    layout and venv, so run this after the git and venv steps.
+    """
+    ignore_file = project_path / ".gitignore"
+    ignore_text = ignore_file.read_text() if ignore_file.is_file() else ""
+    venv = next(
+        (
+            name
+            for name in project_files.VENV_DIRS
+            if (project_path / name / "pyvenv.cfg").is_file()
+        ),
+        None,
+    )
+    files = project_files.ide_files(
+        language, ignore_text, (project_path / "src").is_dir(), venv
+    )
+    for path in dedup.write_tree(project_path, files):
+        typer.echo(f"Created: {path}")
 
-    test_file = tests_dir / "test_example.py"
-    test_file.write_text('''"""Example test file."""
 
-def test_example():
-    """Example test."""
-    assert True
-''')
-    typer.echo(f"Created: {test_file}")
+def setup_pytest(project_path: Path, profile: str = "basic") -> None:
+    """Set up pytest for the project, with the given scaffolding profile."""
+    files = project_files.pytest_files(
+        profile, pytest_profiles.read_pyproject(project_path)
+    )
+    for path in dedup.write_tree(project_path, files):
+        typer.echo(f"Created: {path}")
+    if profile == "perf" and not files.keys() & pytest_profiles.DEV_SPECS:
+        typer.echo(
+            "Warning: pyproject.toml already has a dev dependency group; add "
+            f"{', '.join(pytest_profiles.DEV_DEPENDENCIES)} to it",
+            err=True,
+        )
 
-    pytest_ini = project_path / "pytest.ini"
-    pytest_ini.write_text("""[pytest]
-testpaths = tests
-python_files = test_*.py
-python_classes = Test*
-python_functions = test_*
-""")
-    typer.echo(f"Created: {pytest_ini}")
+
+def create_docker_config(project_path: Path) -> None:
+    """Create the Dockerfile, devcontainer and .dockerignore."""
+    from project_setup import docker_config
+
+    for path in docker_config.write_docker_config(project_path):
+        typer.echo(f"Created: {path}")
+
+
+def setup_pre_commit(
+    project_path: Path, language: str, write_config: bool, offline: bool
+) -> None:
+    """Write the pre-commit config and install the hooks and their environments."""
+    from project_setup import hooks
+
+    if write_config:
+        path = hooks.write_config(project_path, language)
+        if path:
+            typer.echo(f"Created: {path}")
+    report = hooks.install(project_path, offline)
+    if report.installed:
+        typer.echo(report.describe())
+    else:
+        typer.echo(f"Warning: {report.describe()}", err=True)
 
 
 def git_add_and_commit(project_path: Path) -> None:
-    """Add all files and commit."""
+    """Add all files and commit.
+
+    Generated files already satisfy the pre-commit hooks (final newlines,
+    no trailing whitespace), so a failed commit is reported, not retried.
+    """
     try:
-        subprocess.run(
+        runner.run(
             ["git", "add", "."],
             cwd=project_path,
             capture_output=True,
             check=True,
         )
-        subprocess.run(
+        runner.run(
             ["git", "commit", "-m", "Initial project setup"],
             cwd=project_path,
             capture_output=True,
@@ -211,10 +311,135 @@ def git_add_and_commit(project_path: Path) -> None:
         )
         typer.echo("Git commit created: 'Initial project setup'")
     except subprocess.CalledProcessError as e:
-        typer.echo(f"Warning: Git commit failed: {e}", err=True)
+        # Hook output (git sends it to stderr) says what to fix.
+        output = (e.stderr or b"") + (e.stdout or b"")
+        detail = output.decode(errors="replace").strip() or e
+        typer.echo(f"Warning: Git commit failed: {detail}", err=True)
 
 
+def emit_project_tar(
+    destination: str,
+    project_name: str,
+    git: str,
+    description: Optional[str],
+    template: Optional[str],
+    cli: str,
+    workflow: str,
+    server: Optional[str],
+    use_pytest: bool,
+    pytest_profile: str,
+    docker: bool,
+) -> None:
+    """Render the project into a tar archive at ``destination`` (``-``: stdout).
+
+    The files come from the same builders the steps write to disk, each
+    given the tree built so far in place of the project directory.
+    """
+    from project_setup import docker_config, tar_stream
+
+    initial: Dict[str, str] = {}
+    if git == "new":
+        initial = project_files.repository_files(
+            project_name, template, True, description
+        )
+    files = dict(initial)
+    files.update(project_files.cli_files(cli, workflow, server, False))
+    files.update(
+        project_files.ide_files(
+            "python",
+            files.get(".gitignore", ""),
+            any(path.startswith("src/") for path in files),
+        )
+    )
+    if use_pytest:
+        files.update(
+            project_files.pytest_files(pytest_profile, files.get("pyproject.toml"))
+        )
+    if docker:
+        layout = docker_config.tree_layout(files)
+        files.update(docker_config.docker_files(project_name, layout))
+
+    tree = {path: content.encode("utf-8") for path, content in files.items()}
+    directories = tar_stream.GIT_DIRS if git == "new" else ()
+    if git == "new":
+        try:
+            author, committer = tar_stream.identities()
+        except tar_stream.EmitError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(code=1)
+        commits = [
+            tar_stream.Commit(
+                "Initial commit",
+                {path: tree[path] for path in initial},
+            ),
+            tar_stream.Commit("Initial project setup", dict(tree)),
+        ]
+        tree.update(
+            tar_stream.git_repository(
+                commits, tar_stream.default_branch(), author, committer
+            )
+        )
+
+    if destination == "-":
+        tar_stream.write_tar(sys.stdout.buffer, tree, directories)
+        sys.stdout.buffer.flush()
+    else:
+        with open(destination, "wb") as f:
+            tar_stream.write_tar(f, tree, directories)
+    typer.echo(
+        f"Wrote {project_name}: {len(files)} files"
+        f"{' and a git repository' if git == 'new' else ''}",
+        err=True,
+    )
+
+
+def verify_project(project_path: Path, checks: List["verify.Check"]) -> None:
+    """Run the verification checks and exit with an error if any failed."""
+    from project_setup import verify
+
+    results, wall = verify.run_checks(project_path, checks)
+    for result in results:
+        typer.echo(result.describe())
+    total = sum(result.seconds for result in results)
+    typer.echo(f"{len(results)} checks in {wall:.2f} s ({total:.2f} s if run serially)")
+    failed = [result.name for result in results if result.status == "failed"]
+    if failed:
+        typer.echo(f"Error: verification failed: {', '.join(failed)}", err=True)
+        raise typer.Exit(code=1)
+
+
+def materialize_cached_project(key: str, name: str, git: str) -> Path:
+    """Create the project from the result cache, with a fresh git repo."""
+    from project_setup import result_cache
+
+    project_path = Path.cwd() / name
+    if project_path.exists():
+        typer.echo(f"Error: Directory '{project_path}' already exists", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        result_cache.materialize(key, project_path, name)
+    except OSError as e:
+        typer.echo(f"Error creating project from cache: {e}", err=True)
+        raise typer.Exit(code=1)
+
+    if git == "new":
+        try:
+            runner.run(
+                ["git", "init"],
+                cwd=project_path,
+                capture_output=True,
+                check=True,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            typer.echo(f"Error running git init: {e}", err=True)
+            raise typer.Exit(code=1)
+    return project_path
+
+
+@metrics.instrument("project-init")
 def project_init(
+    ctx: typer.Context,
     git: Optional[str] = typer.Option(
         None, "--git", help="Git mode: new, existing, or none"
     ),
@@ -247,6 +472,72 @@ def project_init(
     no_pytest: Optional[bool] = typer.Option(
         None, "--no-pytest", help="Skip pytest setup"
     ),
+    pytest_profile: Optional[str] = typer.Option(
+        None,
+        "--pytest-profile",
+        help="pytest scaffolding: basic, or perf (xdist, durations, benchmarks)",
+    ),
+    dedup_mode: Optional[str] = typer.Option(
+        None,
+        "--dedup",
+        help="Share identical generated files via a content store: reflink or hardlink",
+    ),
+    metrics_file: Optional[str] = typer.Option(
+        None,
+        "--metrics-file",
+        help="Merge Prometheus textfile metrics for this run into this file",
+    ),
+    cache: Optional[bool] = typer.Option(
+        None, "--cache", help="Reuse a cached project tree built with the same options"
+    ),
+    create_remote: Optional[bool] = typer.Option(
+        None,
+        "--create-remote",
+        help="Create the repository on the hosting API and push (new mode)",
+    ),
+    language: Optional[str] = typer.Option(
+        None, "--language", help="Project language: python, node, rust, or go"
+    ),
+    offline: Optional[bool] = typer.Option(
+        None,
+        "--offline",
+        help="Configure dependency fetches to use only the shared package store",
+    ),
+    base_requirements: Optional[str] = typer.Option(
+        None,
+        "--base-requirements",
+        help="Layer the venv on a shared read-only base built from this file",
+    ),
+    precompile_bytecode: Optional[bool] = typer.Option(
+        None,
+        "--precompile",
+        help="Compile the venv and project sources to bytecode in the background",
+    ),
+    git_perf_profile: Optional[bool] = typer.Option(
+        None,
+        "--git-perf-profile",
+        help=(
+            "Enable git's large-repository performance settings (new/existing); "
+            "registers the repository for git maintenance in your global git config"
+        ),
+    ),
+    docker: Optional[bool] = typer.Option(
+        None, "--docker", help="Generate a Dockerfile, devcontainer and .dockerignore"
+    ),
+    run_verify: Optional[bool] = typer.Option(
+        None, "--verify", help="Check the finished project, running checks in parallel"
+    ),
+    pre_commit: Optional[bool] = typer.Option(
+        None,
+        "--pre-commit",
+        help="Add a pre-commit config and install the hooks from the shared cache",
+    ),
+    emit_tar: Optional[str] = typer.Option(
+        None,
+        "--emit-tar",
+        help="Write the project as a tar archive to this file ('-' for stdout) "
+        "instead of creating a directory",
+    ),
 ) -> None:
     """Initialize a complete project with all modules."""
 
@@ -275,26 +566,151 @@ def project_init(
             pytest = None
         if isinstance(no_pytest, typer.models.OptionInfo):
             no_pytest = None
+    if isinstance(dedup_mode, typer.models.OptionInfo):
+        dedup_mode = None
+    if isinstance(metrics_file, typer.models.OptionInfo):
+        metrics_file = None
+    if isinstance(cache, typer.models.OptionInfo):
+        cache = None
+    if isinstance(create_remote, typer.models.OptionInfo):
+        create_remote = None
+    if isinstance(language, typer.models.OptionInfo):
+        language = None
+    if isinstance(offline, typer.models.OptionInfo):
+        offline = None
+    if isinstance(precompile_bytecode, typer.models.OptionInfo):
+        precompile_bytecode = None
+    if isinstance(base_requirements, typer.models.OptionInfo):
+        base_requirements = None
+    base_requirements_path = None
+    if base_requirements:
+        base_requirements_path = Path(base_requirements).resolve()
+        if not base_requirements_path.is_file():
+            typer.echo(f"Error: '{base_requirements}' is not a file", err=True)
+            raise typer.Exit(code=1)
+    if isinstance(pytest_profile, typer.models.OptionInfo):
+        pytest_profile = None
+    if pytest_profile is not None and pytest_profile not in pytest_profiles.PROFILES:
+        typer.echo(
+            f"Error: Invalid pytest profile '{pytest_profile}'. Use basic or perf.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    if isinstance(git_perf_profile, typer.models.OptionInfo):
+        git_perf_profile = None
+    if isinstance(docker, typer.models.OptionInfo):
+        docker = None
+    if isinstance(run_verify, typer.models.OptionInfo):
+        run_verify = None
+    if isinstance(pre_commit, typer.models.OptionInfo):
+        pre_commit = None
+    if isinstance(emit_tar, typer.models.OptionInfo):
+        emit_tar = None
+    if emit_tar is not None:
+        if is_interactive:
+            typer.echo("Error: --emit-tar needs --git and --name", err=True)
+            raise typer.Exit(code=1)
+        if git not in ("new", "none") or language not in (None, "python"):
+            typer.echo(
+                "Error: --emit-tar supports new and none mode python projects",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        # These need a project directory, a venv or the network.
+        unsupported = [
+            flag
+            for flag, value in (
+                ("--venv", venv),
+                ("--base-requirements", base_requirements),
+                ("--precompile", precompile_bytecode),
+                ("--git-perf-profile", git_perf_profile),
+                ("--pre-commit", pre_commit),
+                ("--create-remote", create_remote),
+                ("--cache", cache),
+                ("--dedup", dedup_mode),
+                ("--verify", run_verify),
+            )
+            if value
+        ]
+        if unsupported:
+            typer.echo(
+                f"Error: --emit-tar cannot be combined with {', '.join(unsupported)}",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+
+    if metrics_file:
+        # Until this command exits; the commands it runs get it through env=.
+        ctx.with_resource(metrics.exporting(str(Path(metrics_file).resolve())))
+
+    dedup_log = None
+    if dedup_mode:
+        if dedup_mode not in dedup.MODES:
+            typer.echo(
+                f"Error: Invalid dedup mode '{dedup_mode}'. Use reflink or hardlink.",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        # Enabled until this command exits, however it exits.
+        dedup_log = ctx.with_resource(
+            dedup.enabled(dedup_mode)
+        )
 
+    plugin_plan = plan_plugin_steps()
+    if emit_tar is not None and any(plugin_plan.values()):
+        # Plugin steps work on a project directory.
+        names = [step.name for steps in plugin_plan.values() for step in steps]
+        typer.echo(
+            f"Error: --emit-tar cannot run plugin steps ({', '.join(names)}); "
+            f"set {plugins.DISABLE_ENV}=1 to create the project without them",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    speculation = None
     if is_interactive:
+        # Probe tools and stage the venv while the user answers the prompts.
+        from project_setup import speculate
+
+        speculation = speculate.Speculation()
+        speculation.probe_tools()
+
         typer.echo("=== Project Initialization ===\n")
 
         git = typer.prompt("Git mode (new/existing/none)", default="new")
 
+        # A clone's language is detected once it is cloned.
+        detect_language = git == "existing" and language is None
+        if language is None and not detect_language:
+            language = typer.prompt(
+                f"Language ({'/'.join(languages.names())})", default="python"
+            )
+        if not detect_language:
+            check_language(language, offline)
+        is_python = language in (None, "python")
+
         if git == "new":
             name = typer.prompt("Project name")
+            if is_python:
+                speculation.start_venv(Path.cwd() / name)
 
             visibility = typer.prompt("Visibility (public/private)", default="private")
             is_private = visibility == "private"
 
             description = typer.prompt("Description (optional)", default="")
 
+            if create_remote is None:
+                create_remote = typer.prompt(
+                    "Create remote repository?", default=False
+                )
+
             include_gitignore = typer.prompt("Include .gitignore?", default=True)
             include_readme = typer.prompt("Include README?", default=True)
 
             if include_gitignore:
                 template = typer.prompt(
-                    "Gitignore template (Python/Node/Rust/Go/Blank)", default="Python"
+                    "Gitignore template (e.g. Python or Python+JetBrains)",
+                    default=languages.LANGUAGES[language].gitignore,
                 )
             else:
                 template = None
@@ -304,10 +720,23 @@ def project_init(
                 "Project name (optional, leave empty to derive from URL)", default=""
             )
             name = name if name else None
+            if name and is_python:
+                speculation.start_venv(Path.cwd() / name)
+            # The clone brings its own; these apply to new repositories.
+            is_private = True
+            description = None
+            include_gitignore = include_readme = False
+            template = None
         else:
             name = typer.prompt("Project name")
+            if is_python:
+                speculation.start_venv(Path.cwd() / name)
 
-        create_venv = typer.prompt("Create virtual environment?", default=True)
+        create_venv = is_python and typer.prompt(
+            "Create virtual environment?", default=True
+        )
+        if not create_venv:
+            speculation.cancel_venv()
 
         cli = typer.prompt("Primary CLI tool (opencode/claude/both)", default="both")
 
@@ -324,22 +753,55 @@ def project_init(
         else:
             include_handoff = False
 
-        use_pytest = typer.prompt("Set up pytest testing?", default=True)
+        use_pytest = is_python and typer.prompt(
+            "Set up pytest testing?", default=True
+        )
+        if use_pytest and pytest_profile is None:
+            pytest_profile = typer.prompt(
+                "Testing profile (basic/perf)", default="basic"
+            )
+
+        if docker is None:
+            docker = is_python and typer.prompt(
+                "Generate Dockerfile and devcontainer?", default=False
+            )
+
+        if pre_commit is None:
+            pre_commit = git != "none" and typer.prompt(
+                "Install pre-commit hooks?", default=False
+            )
 
         typer.echo("")
     else:
+        detect_language = git == "existing" and language is None
+        language = language or "python"
+        if not detect_language:
+            check_language(language, offline)
+        if docker and language != "python":
+            typer.echo("Error: --docker applies to python projects", err=True)
+            raise typer.Exit(code=1)
+        if pre_commit and git == "none":
+            typer.echo("Error: --pre-commit needs a git repository", err=True)
+            raise typer.Exit(code=1)
         create_venv = (
             venv if venv is not None else (not no_venv if no_venv is not None else True)
         )
         use_pytest = (
             pytest
             if pytest is not None
-            else (not no_pytest if no_pytest is not None else False)
+            else (
+                not no_pytest
+                if no_pytest is not None
+                else pytest_profile is not None
+            )
         )
+        # cli-config prompts for whichever of these it is not given.
+        cli = cli or "both"
+        workflow = workflow or "assisted"
         include_handoff = False
         include_gitignore = True
         include_readme = True
-        template = "Python"
+        template = languages.LANGUAGES[language].gitignore
         is_private = private if private is not None else True
         description = None
 
@@ -348,62 +810,284 @@ def project_init(
             use_pytest = False
             cli = "both"
             workflow = "assisted"
+        if language != "python" and not detect_language:
+            create_venv = False
+            use_pytest = False
 
-    typer.echo("--- Step 1: Git Setup ---")
-    project_path = run_git_setup(
-        project_name=name,
-        git_mode=git,
-        url=url,
-        public=is_private if not is_interactive and public is None else public,
-        private=is_private if not is_interactive and private is None else private,
-        description=description,
-        include_gitignore=include_gitignore,
-        include_readme=include_readme,
-        template=template,
-        is_interactive=is_interactive,
-    )
+    if git == "new" and include_gitignore and template:
+        try:
+            gitignore.resolve(template)
+        except gitignore.GitignoreError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(code=1)
+
+    if emit_tar is not None:
+        with metrics.step("emit-tar"):
+            emit_project_tar(
+                emit_tar,
+                name,
+                git,
+                description,
+                template if include_gitignore else None,
+                cli or "both",
+                workflow or "assisted",
+                server,
+                use_pytest,
+                pytest_profile or "basic",
+                bool(docker),
+            )
+        return
+
+    cache_key = None
+    cached_tree = None
+    if cache and git in ("new", "none"):
+        from project_setup import result_cache
+
+        cache_key = result_cache.spec_key(
+            result_cache.normalize_spec(
+                git=git,
+                include_gitignore=include_gitignore,
+                template=template,
+                include_readme=include_readme,
+                description=description,
+                create_venv=create_venv,
+                cli=cli,
+                server=server,
+                workflow=workflow,
+                include_handoff=include_handoff,
+                use_pytest=use_pytest,
+                pytest_profile=pytest_profile or "basic",
+                language=language,
+                offline=bool(offline),
+                docker=bool(docker),
+                pre_commit=bool(pre_commit),
+                plugins=[
+                    f"{step.name}={step.value}"
+                    for steps in plugin_plan.values()
+                    for step in steps
+                ],
+            )
+        )
+        cached_tree = result_cache.lookup(cache_key)
+
+    if cached_tree is not None:
+        typer.echo("--- Step 1: Project from Cache ---")
+        with metrics.step("cache"):
+            project_path_obj = materialize_cached_project(cache_key, name, git)
+        project_path = str(project_path_obj)
+    else:
+        typer.echo("--- Step 1: Git Setup ---")
+        with metrics.step("git"):
+            project_path = run_git_setup(
+                project_name=name,
+                git_mode=git,
+                url=url,
+                public=is_private if not is_interactive and public is None else public,
+                private=is_private
+                if not is_interactive and private is None
+                else private,
+                description=description,
+                include_gitignore=include_gitignore,
+                include_readme=include_readme,
+                template=template,
+                is_interactive=is_interactive,
+            )
+        project_path_obj = Path(project_path)
     typer.echo(f"Project created at: {project_path}\n")
 
-    project_path_obj = Path(project_path)
+    if git_perf_profile and git in ("new", "existing"):
+        # Before the remaining steps, so the initial commit benefits too.
+        from project_setup import git_perf
+
+        with metrics.step("git-perf"):
+            typer.echo(git_perf.apply(project_path_obj).describe() + "\n")
+
+    if git == "existing":
+        typer.echo("--- Auto-detect ---")
+        with metrics.step("detect"):
+            detection = detect_project(project_path_obj)
+        if detect_language:
+            language = detection.language or "python"
+            check_language(language, offline)
+        if language != "python":
+            create_venv = False
+            use_pytest = False
+            docker = False
+        if create_venv and detection.venvs:
+            typer.echo(f"Using the existing venv {detection.venvs[0]}")
+            create_venv = False
+        if use_pytest and detection.test_configs:
+            typer.echo(f"Keeping the existing {detection.test_configs[0]} for pytest")
+            use_pytest = False
+        if not create_venv and speculation:
+            speculation.cancel_venv()
+        typer.echo("")
+
+    context = plugins.StepContext(
+        project_path_obj, project_path_obj.name, language, git, is_interactive
+    )
+    if cached_tree is None:
+        run_plugin_steps(plugin_plan, "git", context)
+
+    if language != "python" and cached_tree is None and git in ("new", "none"):
+        typer.echo(f"--- Step 2: {languages.LANGUAGES[language].label} Scaffold ---")
+        with metrics.step("scaffold"):
+            run_scaffold(language, project_path_obj, description, bool(offline))
+        typer.echo("")
+    if cached_tree is None:
+        run_plugin_steps(plugin_plan, "scaffold", context)
 
     if create_venv:
         typer.echo("--- Step 2: Virtual Environment ---")
-        run_venv_setup(
-            project_dir=project_path,
-            yes=True,
-            use_uv=None,
-            use_python=None,
-        )
+        with metrics.step("venv"):
+            backend = (
+                speculation.take_venv(project_path_obj) if speculation else None
+            )
+            if backend:
+                finish_staged_venv(project_path_obj, backend)
+            else:
+                run_venv_setup(
+                    project_dir=project_path,
+                    yes=True,
+                    use_uv=None,
+                    use_python=None,
+                )
+            if base_requirements_path:
+                from project_setup import venv_setup
+
+                venv_setup.layer_on_base(
+                    project_path_obj / ".venv", base_requirements_path
+                )
+        typer.echo("")
+    if cached_tree is None:
+        run_plugin_steps(plugin_plan, "venv", context)
+
+    precompile_jobs = []
+    if precompile_bytecode and language == "python":
+        # Compiles site-packages while the remaining steps run.
+        from project_setup import precompile
+
+        job = precompile.start(project_path_obj, include_sources=False)
+        if job is not None:
+            precompile_jobs.append(job)
+
+    if cached_tree is None:
+        typer.echo("--- Step 3: CLI Configuration ---")
+        with metrics.step("cli"):
+            run_cli_config(
+                project_dir=project_path,
+                workflow=workflow,
+                cli=cli,
+                server=server,
+                include_handoff=include_handoff,
+                is_interactive=is_interactive,
+            )
         typer.echo("")
+        run_plugin_steps(plugin_plan, "cli", context)
 
-    typer.echo("--- Step 3: CLI Configuration ---")
-    run_cli_config(
-        project_dir=project_path,
-        workflow=workflow,
-        cli=cli,
-        server=server,
-        include_handoff=include_handoff,
-        is_interactive=is_interactive,
-    )
-    typer.echo("")
+        typer.echo("--- Step 4: IDE Configuration ---")
+        with metrics.step("ide"):
+            create_ide_config(project_path_obj, language)
+        typer.echo("")
+        run_plugin_steps(plugin_plan, "ide", context)
+
+        if use_pytest:
+            typer.echo("--- Step 5: Testing Setup ---")
+            with metrics.step("pytest"):
+                setup_pytest(project_path_obj, pytest_profile or "basic")
+            typer.echo("")
+        run_plugin_steps(plugin_plan, "pytest", context)
+
+        if docker:
+            typer.echo("--- Step 6: Container Configuration ---")
+            with metrics.step("docker"):
+                create_docker_config(project_path_obj)
+            typer.echo("")
+        run_plugin_steps(plugin_plan, "docker", context)
+
+    if pre_commit:
+        typer.echo("--- Step 7: Pre-commit Hooks ---")
+        with metrics.step("hooks"):
+            setup_pre_commit(
+                project_path_obj, language, cached_tree is None, bool(offline)
+            )
+        typer.echo("")
+    if cached_tree is None:
+        run_plugin_steps(plugin_plan, "hooks", context)
 
-    typer.echo("--- Step 4: IDE Configuration ---")
-    create_ide_config(project_path_obj)
-    typer.echo("")
+    if git in ("new", "existing"):
+        typer.echo("--- Step 8: Git Commit ---")
+        if pre_commit and dedup_mode == "hardlink":
+            # The hooks' fixers edit files in place, which would write
+            # through a hardlink into the store.
+            detached = dedup.detach_tree(project_path_obj)
+            typer.echo(f"Detached {detached} hardlinked files before the hooks")
+        with metrics.step("commit"):
+            git_add_and_commit(project_path_obj)
+        typer.echo("")
+    run_plugin_steps(plugin_plan, "commit", context)
 
-    if use_pytest:
-        typer.echo("--- Step 5: Testing Setup ---")
-        setup_pytest(project_path_obj)
+    if precompile_bytecode and language == "python":
+        # Started after the commit so no __pycache__ can be added to it.
+        from project_setup import precompile
+
+        job = precompile.start(project_path_obj, include_venv=False)
+        if job is not None:
+            precompile_jobs.append(job)
+
+    if create_remote and git == "new":
+        typer.echo("--- Step 9: Remote Repository ---")
+        from project_setup import remote
+
+        with metrics.step("remote"):
+            try:
+                repo = remote.publish(
+                    project_path_obj, project_path_obj.name, is_private, description
+                )
+            except remote.RemoteError as e:
+                typer.echo(f"Error: {e}", err=True)
+                raise typer.Exit(code=1)
+        typer.echo(f"Pushed to: {repo.get('html_url') or repo['clone_url']}\n")
+    run_plugin_steps(plugin_plan, "remote", context)
+
+    if cache_key and cached_tree is None:
+        from project_setup import result_cache
+
+        if result_cache.store(cache_key, project_path_obj, project_path_obj.name):
+            typer.echo("Stored project tree in the result cache\n")
+
+    for job in precompile_jobs:
+        typer.echo(job.wait().describe())
+    if precompile_jobs:
         typer.echo("")
 
-    if git in ("new", "existing"):
-        typer.echo("--- Step 6: Git Commit ---")
-        git_add_and_commit(project_path_obj)
+    if run_verify:
+        from project_setup import verify
+
+        typer.echo("--- Verification ---")
+        with metrics.step("verify"):
+            verify_project(
+                project_path_obj,
+                verify.project_checks(
+                    create_venv=create_venv,
+                    git_repo=git in ("new", "existing"),
+                    use_pytest=use_pytest,
+                ),
+            )
         typer.echo("")
 
     typer.echo("=== Project Initialization Complete! ===\n")
     typer.echo(f"Project: {project_path}")
 
+    if dedup_log:
+        summary = dedup.summarize_log(dedup_log)
+        typer.echo(
+            f"Dedup: {summary['files']} files from store "
+            f"({summary['reflink']} reflinked, {summary['hardlink']} hardlinked, "
+            f"{summary['copy']} copied), {summary['bytes_saved']} bytes and "
+            f"{summary['inodes_saved']} inodes saved"
+        )
+
     if create_venv:
         venv_path = project_path_obj / ".venv"
         if venv_path.exists():
@@ -0,0 +1,171 @@
+"""pytest scaffolding profiles.
+
+``basic`` is a ``pytest.ini`` and one example test. ``perf`` adds the
+tooling performance work needs:
+
+- parallel runs with pytest-xdist (``-n auto --dist loadgroup``, so tests
+  marked ``xdist_group`` share a worker)
+- ``--durations`` reporting of slow tests
+- a ``benchmarks/`` tree for pytest-benchmark, kept out of ``testpaths``,
+  with a saved-baseline workflow
+- a ``profile`` marker that runs a test under cProfile
+
+and adds pytest, pytest-xdist and pytest-benchmark to the project's dev
+dependencies.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+from project_setup import dedup
+
+PROFILES = ("basic", "perf")
+DEV_DEPENDENCIES = ("pytest>=8", "pytest-xdist>=3.5", "pytest-benchmark>=4")
+# The files dev_dependency_files may write.
+DEV_SPECS = {"pyproject.toml", "requirements-dev.txt"}
+
+BASIC_INI = """[pytest]
+testpaths = tests
+python_files = test_*.py
+python_classes = Test*
+python_functions = test_*
+"""
+
+PERF_INI = """[pytest]
+testpaths = tests
+python_files = test_*.py
+python_classes = Test*
+python_functions = test_*
+addopts = -n auto --dist loadgroup --durations=10 --durations-min=0.05
+markers =
+    profile: run the test under cProfile, writing .profiles/<test>.prof
+"""
+
+CONFTEST = '''"""Shared pytest hooks.
+
+Tests marked ``@pytest.mark.profile`` run under cProfile; the stats are
+written to ``.profiles/<test id>.prof`` (view with ``python -m pstats``).
+"""
+
+import cProfile
+import re
+from pathlib import Path
+
+import pytest
+
+PROFILE_DIR = Path(__file__).parent / ".profiles"
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    if item.get_closest_marker("profile") is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        PROFILE_DIR.mkdir(exist_ok=True)
+        (PROFILE_DIR / ".gitignore").write_text("*\\n")
+        name = re.sub(r"[^\\w.-]+", "_", item.nodeid)
+        profiler.dump_stats(PROFILE_DIR / f"{name}.prof")
+'''
+
+BENCH_CONFTEST = '''"""Fixtures for benchmarks.
+
+Benchmark inputs are built once per session and are deterministic, so runs
+are comparable with a saved baseline.
+"""
+
+import random
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_data():
+    rng = random.Random(0)
+    return [rng.random() for _ in range(10_000)]
+'''
+
+BENCH_EXAMPLE = '''"""Example benchmark."""
+
+
+def test_sort(benchmark, sample_data):
+    result = benchmark(sorted, sample_data)
+    assert result[0] <= result[-1]
+'''
+
+BENCH_README = """# Benchmarks
+
+Benchmarks use pytest-benchmark and run serially (`-n 0`), outside the
+parallel test suite.
+
+```bash
+# Save a baseline (stored under .benchmarks/)
+pytest benchmarks -n 0 --benchmark-only --benchmark-autosave
+
+# Compare against the latest baseline; fail on a 10% slower mean
+pytest benchmarks -n 0 --benchmark-only --benchmark-compare \\
+    --benchmark-compare-fail=mean:10%
+```
+"""
+
+_GROUPS_HEADER = re.compile(r"^\[dependency-groups\][ \t]*$", re.MULTILINE)
+_DEV_GROUP = re.compile(r"^dev\s*=", re.MULTILINE)
+
+
+def pytest_ini(profile: str) -> str:
+    return PERF_INI if profile == "perf" else BASIC_INI
+
+
+def _dev_group() -> str:
+    items = "".join(f'    "{dep}",\n' for dep in DEV_DEPENDENCIES)
+    return f"dev = [\n{items}]\n"
+
+
+def dev_dependency_files(pyproject: Optional[str]) -> Dict[str, str]:
+    """Return the spec files that add the perf dev dependencies.
+
+    Given the project's ``pyproject.toml`` text, that is ``pyproject.toml``
+    with a ``dev`` dependency group (PEP 735); projects without one get
+    ``requirements-dev.txt``. Empty when ``pyproject.toml`` already has a
+    ``dev`` group.
+    """
+    if pyproject is None:
+        return {"requirements-dev.txt": "\n".join(DEV_DEPENDENCIES) + "\n"}
+
+    header = _GROUPS_HEADER.search(pyproject)
+    if header is None:
+        text = pyproject.rstrip("\n") + "\n\n[dependency-groups]\n" + _dev_group()
+    else:
+        following = re.search(r"^\[", pyproject[header.end() :], re.MULTILINE)
+        end = header.end() + following.start() if following else len(pyproject)
+        if _DEV_GROUP.search(pyproject, header.end(), end):
+            return {}
+        text = (
+            pyproject[: header.end()]
+            + "\n"
+            + _dev_group()
+            + pyproject[header.end() + 1 :]
+        )
+    return {"pyproject.toml": text}
+
+
+def read_pyproject(project_path: Path) -> Optional[str]:
+    """Return the project's ``pyproject.toml`` text, or None without one."""
+    pyproject = project_path / "pyproject.toml"
+    return pyproject.read_text() if pyproject.is_file() else None
+
+
+def perf_files() -> Dict[str, str]:
+    """Return the conftest and benchmarks tree of the ``perf`` profile."""
+    return {
+        "conftest.py": CONFTEST,
+        "benchmarks/conftest.py": BENCH_CONFTEST,
+        "benchmarks/test_sort_benchmark.py": BENCH_EXAMPLE,
+        "benchmarks/README.md": BENCH_README,
+    }
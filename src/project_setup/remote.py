@@ -0,0 +1,335 @@
+"""Remote repository creation on a GitHub-compatible hosting API.
+
+Repositories are created with ``POST /user/repos`` and the local history is
+pushed to the returned ``clone_url``. All requests of a run share one
+client, which keeps a small pool of keep-alive connections, so batch runs
+pay for TLS and TCP setup once per connection rather than once per repo.
+Rate-limited responses (``429``, or ``403`` with ``Retry-After`` or an
+exhausted ``X-RateLimit-Remaining``) and transient server errors are
+retried after the delay the server asks for, or with exponential backoff.
+A gateway error (``502``, ``504``) may follow a request the server acted
+on, so it is retried only for idempotent methods; a ``POST`` is retried
+only on ``429`` and on ``503`` with ``Retry-After``, which mean the
+request was not processed.
+
+A pooled connection the server has already closed is dropped before use.
+If a reused connection still fails, only idempotent methods are resent once
+the request may have reached the server; a ``POST`` is resent only when
+writing it failed, so a repository is never created twice.
+
+Configuration comes from the environment:
+
+- ``PROJECT_SETUP_API_URL``: API base URL (default: https://api.github.com)
+- ``GITHUB_TOKEN`` or ``GH_TOKEN``: token used for the API and for pushing
+"""
+
+import base64
+import http.client
+import json
+import os
+import random
+import select
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from project_setup import runner
+
+API_URL_ENV = "PROJECT_SETUP_API_URL"
+TOKEN_ENVS = ("GITHUB_TOKEN", "GH_TOKEN")
+DEFAULT_API_URL = "https://api.github.com"
+
+RETRY_STATUSES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+# Raised while writing a request that the server therefore never received.
+NOT_SENT_ERRORS = (ConnectionRefusedError, ConnectionResetError, BrokenPipeError)
+
+
+class RemoteError(Exception):
+    """Raised when a remote repository cannot be created or pushed."""
+
+
+class RepoSpec(NamedTuple):
+    name: str
+    private: bool = True
+    description: str = ""
+
+
+def api_url() -> str:
+    return os.environ.get(API_URL_ENV) or DEFAULT_API_URL
+
+
+def api_token() -> Optional[str]:
+    for name in TOKEN_ENVS:
+        if os.environ.get(name):
+            return os.environ[name]
+    return None
+
+
+class HostingClient:
+    """Client for the hosting API with a pool of keep-alive connections.
+
+    Safe to share between threads; at most ``pool_size`` connections are
+    kept open for reuse.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token: Optional[str] = None,
+        pool_size: int = 4,
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        max_wait: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        parts = urlsplit(base_url or api_url())
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise RemoteError(f"Invalid API URL: {base_url or api_url()}")
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self.token = token if token is not None else api_token()
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self._sleep = sleep
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    self.connections_opened += 1
+                    break
+                conn = self._idle.pop()
+            if not _closed_by_peer(conn):
+                return conn, True
+            conn.close()
+        if self._https:
+            conn = http.client.HTTPSConnection(
+                self._host, self._port, timeout=self.timeout
+            )
+        else:
+            conn = http.client.HTTPConnection(
+                self._host, self._port, timeout=self.timeout
+            )
+        return conn, False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def __enter__(self) -> "HostingClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+            "User-Agent": "project-setup",
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    def _retry_delay(
+        self, status: int, headers, attempt: int, idempotent: bool = True
+    ) -> Optional[float]:
+        """Return how long to wait before retrying, or None to not retry."""
+        retry_after = headers.get("Retry-After")
+        if status in (403, 429, 503) and retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), self.max_wait)
+            except ValueError:
+                pass
+        if status in (403, 429) and headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset = float(headers.get("X-RateLimit-Reset", ""))
+            except ValueError:
+                reset = time.time()
+            return min(max(reset - time.time(), 0.0) + 1.0, self.max_wait)
+        if status == 429 or (idempotent and status in RETRY_STATUSES):
+            backoff = min(0.5 * 2 ** attempt, self.max_wait)
+            return backoff * (0.5 + random.random() / 2)
+        return None
+
+    def request(
+        self, method: str, path: str, payload: Optional[dict] = None
+    ) -> Tuple[int, Dict[str, str], object]:
+        """Send a request; return (status, headers, decoded JSON body)."""
+        body = json.dumps(payload).encode() if payload is not None else None
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        for attempt in range(self.max_retries + 1):
+            conn, reused = self._acquire()
+            sent = False
+            try:
+                conn.request(
+                    method, self._prefix + path, body=body, headers=self._headers()
+                )
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                # A pooled connection may have been closed by the server
+                # while idle. Resend only what is safe to repeat: the server
+                # may have acted on a request whose response was lost.
+                unsent = not sent and isinstance(e, NOT_SENT_ERRORS)
+                if reused and (idempotent or unsent):
+                    continue
+                raise RemoteError(f"Could not reach {self._host}: {e}") from e
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+
+            headers = dict(response.getheaders())
+            delay = self._retry_delay(
+                response.status, response.headers, attempt, idempotent
+            )
+            if delay is None or attempt == self.max_retries:
+                try:
+                    decoded = json.loads(data) if data else None
+                except ValueError:
+                    decoded = data.decode(errors="replace")
+                return response.status, headers, decoded
+            self._sleep(delay)
+        raise RemoteError(f"Could not reach {self._host}: too many retries")
+
+    def create_repository(self, spec: RepoSpec) -> dict:
+        """Create a repository for the authenticated user."""
+        status, _, data = self.request(
+            "POST",
+            "/user/repos",
+            {
+                "name": spec.name,
+                "private": spec.private,
+                "description": spec.description or "",
+                "auto_init": False,
+            },
+        )
+        if status == 201 and isinstance(data, dict):
+            return data
+        raise RemoteError(
+            f"Could not create repository '{spec.name}' "
+            f"(HTTP {status}): {_error_message(data)}"
+        )
+
+
+def _closed_by_peer(conn: http.client.HTTPConnection) -> bool:
+    """Return whether an idle connection was closed (or written to) by the server."""
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _error_message(data: object) -> str:
+    if not isinstance(data, dict):
+        return str(data or "no details")
+    message = str(data.get("message", "no details"))
+    details = [
+        str(e.get("message", "")) for e in data.get("errors", []) if isinstance(e, dict)
+    ]
+    details = [d for d in details if d]
+    return f"{message} ({'; '.join(details)})" if details else message
+
+
+def create_repositories(
+    client: HostingClient, specs: List[RepoSpec], workers: int = 4
+) -> List[Union[dict, RemoteError]]:
+    """Create several repositories concurrently over the client's pool.
+
+    Returns one result per spec, in order: the API response, or the
+    RemoteError for that repository.
+    """
+
+    def create(spec: RepoSpec) -> Union[dict, RemoteError]:
+        try:
+            return client.create_repository(spec)
+        except RemoteError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(create, specs))
+
+
+def _push_env(clone_url: str, token: Optional[str]) -> Dict[str, str]:
+    env = dict(os.environ)
+    if token and clone_url.startswith("https://"):
+        # Passed through the environment so the token never shows up in argv.
+        credentials = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+        count = int(env.get("GIT_CONFIG_COUNT", "0"))
+        env["GIT_CONFIG_COUNT"] = str(count + 1)
+        env[f"GIT_CONFIG_KEY_{count}"] = "http.extraHeader"
+        env[f"GIT_CONFIG_VALUE_{count}"] = f"Authorization: Basic {credentials}"
+    return env
+
+
+def push(project_path: Path, clone_url: str, token: Optional[str] = None) -> None:
+    """Add ``clone_url`` as ``origin`` and push the current branch to it."""
+    try:
+        runner.run(
+            ["git", "remote", "add", "origin", clone_url],
+            cwd=project_path,
+            capture_output=True,
+            check=True,
+        )
+        runner.run(
+            ["git", "push", "-u", "origin", "HEAD"],
+            cwd=project_path,
+            capture_output=True,
+            check=True,
+            env=_push_env(clone_url, token),
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode(errors="replace") if e.stderr else str(e)
+        raise RemoteError(f"Could not push to {clone_url}: {stderr.strip()}") from e
+
+
+def publish(
+    project_path: Path,
+    name: str,
+    private: bool,
+    description: Optional[str] = None,
+    client: Optional[HostingClient] = None,
+) -> dict:
+    """Create the remote repository for a project and push its history."""
+    own_client = client is None
+    client = client or HostingClient()
+    if not client.token:
+        raise RemoteError(
+            f"No API token: set {' or '.join(TOKEN_ENVS)} to create repositories"
+        )
+    try:
+        repo = client.create_repository(RepoSpec(name, private, description or ""))
+    finally:
+        if own_client:
+            client.close()
+    push(Path(project_path), repo["clone_url"], client.token)
+    return repo
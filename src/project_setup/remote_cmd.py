@@ -0,0 +1,52 @@
+"""Batch remote repository creation CLI command."""
+
+from typing import List, Optional
+
+import typer
+
+from project_setup import remote
+
+
+def remote_create(
+    names: List[str] = typer.Argument(..., help="Repository names"),
+    public: bool = typer.Option(False, "--public", help="Create public repositories"),
+    description: Optional[str] = typer.Option(
+        None, "--description", help="Description for every repository"
+    ),
+    workers: int = typer.Option(
+        4, "--workers", help="Repositories created concurrently"
+    ),
+) -> None:
+    """Create several empty repositories on the hosting API."""
+    if isinstance(description, typer.models.OptionInfo):
+        description = None
+
+    try:
+        client = remote.HostingClient(pool_size=workers)
+    except remote.RemoteError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    if not client.token:
+        typer.echo(
+            f"Error: set {' or '.join(remote.TOKEN_ENVS)} to create repositories",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    specs = [remote.RepoSpec(name, not public, description or "") for name in names]
+    with client:
+        results = remote.create_repositories(client, specs, workers=workers)
+
+    failed = 0
+    for result in results:
+        if isinstance(result, remote.RemoteError):
+            failed += 1
+            typer.echo(f"Error: {result}", err=True)
+        else:
+            typer.echo(f"Created: {result.get('html_url') or result['clone_url']}")
+    typer.echo(
+        f"{len(specs) - failed} created, {failed} failed "
+        f"({client.connections_opened} connections)"
+    )
+    if failed:
+        raise typer.Exit(code=1)
@@ -0,0 +1,198 @@
+"""Whole-project result cache for project-init.
+
+Runs with the same effective options produce the same tree except for a
+few name-dependent parts. The first run for a spec is built by the normal
+pipeline and snapshotted (without ``.git`` and ``.venv``), with the
+project and package names where generated files hold them (the README
+title, the ``package.json``, ``Cargo.toml``, ``go.mod``, ``pyproject.toml``
+and devcontainer names) and any absolute project paths replaced by
+placeholders. Later runs for the same spec copy the snapshot, fill in the
+placeholders and start a fresh git history instead of re-running every
+step.
+
+The key also covers the package version and a digest of the bundled
+resources (the gitignore catalog and the template bundles), so upgrading
+either one never serves a tree the new code would not generate.
+
+Snapshots are entries in the ``results`` namespace of the cache store.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from project_setup import __version__, cache_store, dedup
+from project_setup.templates import package_name_for
+
+# Bumped when generated file contents change, e.g. the gitignore catalog.
+FORMAT_VERSION = 11
+NAME_TOKEN = "@@PROJECT_SETUP_NAME@@"
+PACKAGE_TOKEN = "@@PROJECT_SETUP_PACKAGE@@"
+PATH_TOKEN = "@@PROJECT_SETUP_PATH@@"
+TOKENS = (NAME_TOKEN, PACKAGE_TOKEN, PATH_TOKEN)
+# Where generated files hold the project's {name} or its {package} name.
+NAME_FIELDS = {
+    "README.md": "# {name}\n",
+    "pyproject.toml": 'name = "{name}"',
+    "package.json": '"name": "{package}"',
+    "Cargo.toml": 'name = "{package}"',
+    "go.mod": "module {package}\n",
+    ".devcontainer/devcontainer.json": '"name": "{name}"',
+}
+EXCLUDED = {".git", ".venv"}
+
+
+NAMESPACE = "results"
+
+
+def results_store() -> cache_store.CacheStore:
+    return cache_store.CacheStore(NAMESPACE)
+
+
+@functools.lru_cache(maxsize=None)
+def catalog_digest() -> str:
+    """Hash the bundled resources under ``data``, also inside the zipapp."""
+    from importlib import resources
+
+    digest = hashlib.sha256()
+    pending = [("data", resources.files(__package__).joinpath("data"))]
+    while pending:
+        name, entry = pending.pop()
+        if entry.is_dir():
+            children = sorted(entry.iterdir(), key=lambda c: c.name, reverse=True)
+            pending.extend((f"{name}/{child.name}", child) for child in children)
+            continue
+        data = entry.read_bytes()
+        digest.update(f"{name}\0{len(data)}\0".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def normalize_spec(
+    git: str,
+    include_gitignore: bool,
+    template: Optional[str],
+    include_readme: bool,
+    description: Optional[str],
+    create_venv: bool,
+    cli: Optional[str],
+    server: Optional[str],
+    workflow: Optional[str],
+    include_handoff: bool,
+    use_pytest: bool,
+    pytest_profile: str = "basic",
+    language: str = "python",
+    offline: bool = False,
+    docker: bool = False,
+    pre_commit: bool = False,
+    plugins: Iterable[str] = (),
+) -> Dict[str, object]:
+    """Return the effective options that determine the generated tree."""
+    cli = cli or "both"
+    new_repo = git == "new"
+    return {
+        "format": FORMAT_VERSION,
+        "version": __version__,
+        "catalog": catalog_digest(),
+        "platform": sys.platform,
+        "git": git,
+        "gitignore": (template or "Python") if new_repo and include_gitignore else None,
+        "readme": new_repo and bool(include_readme),
+        "description": (description or "") if new_repo and include_readme else "",
+        "venv": bool(create_venv),
+        "cli": cli,
+        "server": (server or "local") if cli in ("opencode", "both") else None,
+        "workflow": workflow or "assisted",
+        "handoff": bool(include_handoff) and cli == "both",
+        "pytest": bool(use_pytest),
+        "pytest_profile": pytest_profile if use_pytest else None,
+        "language": language,
+        "offline": bool(offline),
+        "docker": bool(docker),
+        "pre_commit": bool(pre_commit) and git != "none",
+        "plugins": sorted(plugins),
+    }
+
+
+def spec_key(spec: Dict[str, object]) -> str:
+    encoded = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()[:32]
+
+
+def lookup(key: str) -> Optional[Path]:
+    """Return the cached reference tree for ``key``, if any."""
+    entry = results_store().get(key)
+    return entry / "tree" if entry is not None else None
+
+
+def _walk_files(root: Path):
+    for dirpath, dirnames, filenames in os.walk(root):
+        if Path(dirpath) == root:
+            dirnames[:] = [d for d in dirnames if d not in EXCLUDED]
+        # Bytecode may be written concurrently by precompilation.
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for filename in filenames:
+            yield Path(dirpath) / filename
+
+
+def store(key: str, project_path: Path, project_name: str) -> bool:
+    """Snapshot a freshly built project as the reference tree for ``key``."""
+    project_path = Path(project_path)
+    package = package_name_for(project_name)
+
+    def build(staging: Path) -> None:
+        tree = staging / "tree"
+        for src in _walk_files(project_path):
+            rel = src.relative_to(project_path)
+            dest = tree / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            data = src.read_bytes()
+            try:
+                text = data.decode("utf-8")
+            except UnicodeDecodeError:
+                dest.write_bytes(data)
+                continue
+            field = NAME_FIELDS.get(rel.as_posix())
+            if field is not None:
+                text = text.replace(
+                    field.format(name=project_name, package=package),
+                    field.format(name=NAME_TOKEN, package=PACKAGE_TOKEN),
+                    1,
+                )
+            text = text.replace(str(project_path), PATH_TOKEN)
+            dest.write_bytes(text.encode("utf-8"))
+
+    try:
+        return results_store().publish(key, build)
+    except OSError:
+        return False
+
+
+def materialize(key: str, project_path: Path, project_name: str) -> Path:
+    """Create ``project_path`` from the cached tree for ``key``."""
+    with results_store().reading(key) as entry:
+        if entry is None:
+            raise FileNotFoundError(f"No cached project for {key}")
+        project_path = Path(project_path)
+        project_path.mkdir(parents=True)
+        _copy_tree(entry / "tree", project_path, project_name)
+    return project_path
+
+
+def _copy_tree(tree: Path, project_path: Path, project_name: str) -> None:
+    for src in _walk_files(tree):
+        rel = src.relative_to(tree)
+        dest = project_path / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        data = src.read_bytes()
+        if any(token.encode() in data for token in TOKENS):
+            text = data.decode("utf-8")
+            text = text.replace(NAME_TOKEN, project_name)
+            text = text.replace(PACKAGE_TOKEN, package_name_for(project_name))
+            text = text.replace(PATH_TOKEN, str(project_path))
+            data = text.encode("utf-8")
+        dedup.write_bytes(dest, data)
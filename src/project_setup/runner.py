@@ -0,0 +1,77 @@
+"""Execution of external tools (git, uv, python)."""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, List, Sequence
+
+from project_setup import cache_store, metrics
+
+
+def self_command() -> List[str]:
+    """Return the argv prefix that re-runs this tool, also from a zipapp."""
+    archive = Path(__file__).parent.parent
+    if archive.is_file():
+        return [sys.executable, str(archive)]
+    return [sys.executable, "-m", "project_setup"]
+
+
+def tool_name(cmd: Sequence[str]) -> str:
+    """Return the tool a command runs, e.g. ``git`` or ``python``."""
+    program = str(cmd[0])
+    if program == sys.executable:
+        return "python"
+    name = os.path.basename(program).lower()
+    if name.endswith(".exe"):
+        name = name[:-4]
+    return "python" if name.startswith("python") else name
+
+
+def run(cmd: Sequence[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """Run ``cmd`` like ``subprocess.run``, counting the spawn."""
+    metrics.record_spawn(tool_name(cmd))
+    return subprocess.run(cmd, **kwargs)
+
+
+def start(cmd: Sequence[str], **kwargs: Any) -> subprocess.Popen:
+    """Start ``cmd`` in the background like ``subprocess.Popen``."""
+    metrics.record_spawn(tool_name(cmd))
+    return subprocess.Popen(cmd, **kwargs)
+
+
+def probe(cmd: List[str]) -> bool:
+    """Run a ``--version`` style probe, cached per tool binary.
+
+    The result is keyed by the binary's path, size and mtime, so it is
+    reused until the tool is upgraded or replaced.
+    """
+    try:
+        stat = os.stat(cmd[0])
+    except OSError:
+        return False
+    key = cache_store.key_for(
+        "\0".join([*cmd, str(stat.st_size), str(stat.st_mtime_ns)])
+    )
+    store = cache_store.CacheStore("probes")
+    cached = store.get_json(key)
+    if cached is not None:
+        return bool(cached.get("ok"))
+
+    try:
+        run(cmd, capture_output=True, check=True)
+        ok = True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        ok = False
+    try:
+        store.put_json(key, {"ok": ok})
+    except OSError:
+        pass
+    return ok
+
+
+def probe_tool(name: str) -> bool:
+    """Return whether ``name`` is on PATH and answers ``--version``."""
+    path = shutil.which(name)
+    return path is not None and probe([path, "--version"])
@@ -0,0 +1,124 @@
+"""Speculative background work for interactive ``project-init``.
+
+While the user answers the prompts, work that is safe to throw away is
+started in the background: the tool probes at launch (which fill the probe
+cache used by the child commands) and, as soon as the project name is
+known, a virtual environment in a hidden staging directory next to the
+project. Later answers adopt the staged venv, moving it into the project
+and rewriting its absolute paths, or discard it.
+"""
+
+import atexit
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from project_setup import runner, venv_backends
+
+STAGING_PREFIX = ".project-setup-venv-"
+
+
+def create_venv(venv_path: Path) -> str:
+    """Create a venv with the backend venv-setup would choose.
+
+    Returns the backend used.
+    """
+    candidates = venv_backends.available() or ["python"]
+    return venv_backends.create(venv_path, candidates).backend
+
+
+def relocate_venv(venv_path: Path, old_path: Path) -> None:
+    """Rewrite absolute paths left in a venv that was moved from ``old_path``.
+
+    Scripts (shebangs, activate scripts) and ``pyvenv.cfg`` embed the path
+    the venv was created at; the interpreter and site-packages do not.
+    """
+    old, new = str(old_path).encode(), str(venv_path).encode()
+    scripts = venv_path / ("Scripts" if sys.platform == "win32" else "bin")
+    candidates = [venv_path / "pyvenv.cfg"]
+    if scripts.is_dir():
+        candidates.extend(scripts.iterdir())
+    for path in candidates:
+        if path.is_symlink() or not path.is_file():
+            continue
+        data = path.read_bytes()
+        if old not in data or b"\0" in data:
+            continue
+        mode = path.stat().st_mode
+        path.write_bytes(data.replace(old, new))
+        os.chmod(path, mode)
+
+
+class StagedVenv:
+    """A venv being created in the background for a future project."""
+
+    def __init__(self, pool: ThreadPoolExecutor, parent: Path) -> None:
+        self.staging = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=parent))
+        self.venv_path = self.staging / ".venv"
+        self.future: Future = pool.submit(create_venv, self.venv_path)
+
+    def adopt(self, project_path: Path) -> Optional[str]:
+        """Move the venv into ``project_path``; return its backend or None."""
+        try:
+            backend = self.future.result()
+            target = project_path / ".venv"
+            if target.exists():
+                return None
+            shutil.move(str(self.venv_path), str(target))
+            relocate_venv(target, self.venv_path)
+            return backend
+        except (subprocess.CalledProcessError, OSError):
+            return None
+        finally:
+            self.discard()
+
+    def discard(self) -> None:
+        if not self.future.cancel():
+            try:
+                self.future.result()
+            except Exception:
+                pass
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+
+class Speculation:
+    """Background work started during the interactive prompts."""
+
+    def __init__(self) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="speculate")
+        self._venv: Optional[StagedVenv] = None
+        atexit.register(self.close)
+
+    def probe_tools(self) -> None:
+        for name in ("git", "uv"):
+            self._pool.submit(runner.probe_tool, name)
+        self._pool.submit(runner.probe, [sys.executable, "--version"])
+
+    def start_venv(self, project_path: Path) -> None:
+        """Start creating the venv for ``project_path`` (not yet created)."""
+        self.cancel_venv()
+        if project_path.exists() or not project_path.parent.is_dir():
+            return
+        try:
+            self._venv = StagedVenv(self._pool, project_path.parent)
+        except OSError:
+            self._venv = None
+
+    def cancel_venv(self) -> None:
+        if self._venv is not None:
+            self._venv.discard()
+            self._venv = None
+
+    def take_venv(self, project_path: Path) -> Optional[str]:
+        """Adopt the staged venv into ``project_path``; return its backend."""
+        venv, self._venv = self._venv, None
+        return venv.adopt(project_path) if venv is not None else None
+
+    def close(self) -> None:
+        self.cancel_venv()
+        self._pool.shutdown(wait=True)
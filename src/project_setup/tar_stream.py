@@ -0,0 +1,178 @@
+"""A generated project as a tar stream, with its git repository in memory.
+
+``project-init --emit-tar`` renders every file into memory and writes
+them as a tar archive to a stream, so no project directory is created.
+For git projects, the repository's objects are built here too: each
+commit's blobs, trees and commit object are written as loose objects,
+along with ``HEAD``, the branch ref, a minimal ``config`` and an index
+matching the last commit. The index has no stat data, so git re-hashes
+each file once on the first ``git status`` after extraction and then
+records the real stat data.
+"""
+
+import hashlib
+import io
+import struct
+import tarfile
+import time
+import zlib
+from typing import BinaryIO, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from project_setup import runner
+
+FILE_MODE = 0o100644
+TREE_MODE = 0o40000
+GIT_CONFIG = b"""[core]
+\trepositoryformatversion = 0
+\tfilemode = true
+\tbare = false
+\tlogallrefupdates = true
+"""
+# Directories git init creates that hold no files yet.
+GIT_DIRS = (".git/objects/info", ".git/objects/pack", ".git/refs/tags")
+
+
+class EmitError(Exception):
+    """Raised when the project cannot be rendered into a tar stream."""
+
+
+class Commit(NamedTuple):
+    message: str
+    files: Dict[str, bytes]
+
+
+def _git_var(name: str) -> str:
+    result = runner.run(["git", "var", name], capture_output=True, text=True)
+    if result.returncode:
+        raise EmitError(result.stderr.strip() or f"git var {name} failed")
+    return result.stdout.strip()
+
+
+def identities() -> Tuple[str, str]:
+    """Return git's author and committer identity lines, as ``git commit``."""
+    return _git_var("GIT_AUTHOR_IDENT"), _git_var("GIT_COMMITTER_IDENT")
+
+
+def default_branch() -> str:
+    result = runner.run(
+        ["git", "config", "--get", "init.defaultBranch"],
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() or "master"
+
+
+def _object(kind: str, data: bytes, objects: Dict[str, bytes]) -> bytes:
+    raw = f"{kind} {len(data)}\0".encode() + data
+    digest = hashlib.sha1(raw).digest()
+    hexdigest = digest.hex()
+    objects[f".git/objects/{hexdigest[:2]}/{hexdigest[2:]}"] = zlib.compress(raw)
+    return digest
+
+
+def _tree(files: Dict[str, bytes], objects: Dict[str, bytes]) -> bytes:
+    entries: List[Tuple[bytes, bytes]] = []
+    subtrees: Dict[str, Dict[str, bytes]] = {}
+    for path, data in files.items():
+        name, sep, rest = path.partition("/")
+        if sep:
+            subtrees.setdefault(name, {})[rest] = data
+        else:
+            digest = _object("blob", data, objects)
+            entries.append(
+                (name.encode(), b"%o %s\0" % (FILE_MODE, name.encode()) + digest)
+            )
+    for name, children in subtrees.items():
+        digest = _tree(children, objects)
+        # Git orders a subtree as if its name ended with "/".
+        entries.append(
+            (name.encode() + b"/", b"%o %s\0" % (TREE_MODE, name.encode()) + digest)
+        )
+    entries.sort(key=lambda entry: entry[0])
+    return _object("tree", b"".join(entry for _, entry in entries), objects)
+
+
+def index(files: Dict[str, bytes]) -> bytes:
+    """Return a version 2 index of ``files``, without stat data."""
+    body = b""
+    for path in sorted(files, key=lambda p: p.encode()):
+        name = path.encode()
+        digest = hashlib.sha1(
+            f"blob {len(files[path])}\0".encode() + files[path]
+        ).digest()
+        entry = struct.pack(
+            ">10I20sH",
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            FILE_MODE,
+            0,
+            0,
+            len(files[path]),
+            digest,
+            min(len(name), 0xFFF),
+        )
+        entry += name
+        # NUL-terminated and padded to a multiple of 8 bytes.
+        entry += b"\0" * (8 - len(entry) % 8)
+        body += entry
+    data = b"DIRC" + struct.pack(">II", 2, len(files)) + body
+    return data + hashlib.sha1(data).digest()
+
+
+def git_repository(
+    commits: Iterable[Commit],
+    branch: str,
+    author: str,
+    committer: str,
+) -> Dict[str, bytes]:
+    """Return the ``.git`` directory holding ``commits``, by relative path."""
+    objects: Dict[str, bytes] = {}
+    parent: Optional[str] = None
+    files: Dict[str, bytes] = {}
+    for commit in commits:
+        files = commit.files
+        lines = [f"tree {_tree(files, objects).hex()}"]
+        if parent:
+            lines.append(f"parent {parent}")
+        lines += [f"author {author}", f"committer {committer}", "", commit.message]
+        parent = _object("commit", ("\n".join(lines) + "\n").encode(), objects).hex()
+    if parent is None:
+        raise EmitError("no commits to write")
+    return {
+        ".git/HEAD": f"ref: refs/heads/{branch}\n".encode(),
+        ".git/config": GIT_CONFIG,
+        f".git/refs/heads/{branch}": f"{parent}\n".encode(),
+        ".git/index": index(files),
+        **objects,
+    }
+
+
+def write_tar(
+    stream: BinaryIO,
+    files: Dict[str, bytes],
+    directories: Iterable[str] = (),
+    mtime: Optional[float] = None,
+) -> None:
+    """Write ``files`` (and their parent directories) to ``stream`` as a tar."""
+    mtime = time.time() if mtime is None else mtime
+    dirs = set(directories)
+    for path in files:
+        parts = path.split("/")[:-1]
+        dirs.update("/".join(parts[: i + 1]) for i in range(len(parts)))
+    with tarfile.open(fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+        for path in sorted(dirs):
+            info = tarfile.TarInfo(path)
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            info.mtime = mtime
+            tar.addfile(info)
+        for path in sorted(files):
+            info = tarfile.TarInfo(path)
+            info.size = len(files[path])
+            info.mode = 0o644
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(files[path]))
@@ -0,0 +1,205 @@
+"""Registry of installed project templates.
+
+Template directories are scanned once and summarized in a manifest index
+stored in the cache directory. Later lookups read only the index; a
+directory is rescanned when its mtime changes, and within it only the
+bundles whose size or mtime changed are reopened. Bundles themselves are
+opened lazily, when a template is selected. In the zipapp, the built-in
+directory is inside the archive, whose mtime stands for its members'.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from project_setup import paths
+from project_setup.templates import (
+    ARCHIVE,
+    BUILTIN_TEMPLATE_DIR,
+    TEMPLATE_SUFFIX,
+    TemplateBundle,
+    TemplateError,
+    archive_member,
+    builtin_bundles,
+    pack_template,
+)
+
+INDEX_VERSION = 1
+
+
+def user_template_dir() -> Path:
+    return paths.data_dir() / "templates"
+
+
+def template_dirs() -> List[Path]:
+    """Return template directories in precedence order (user first)."""
+    dirs = [user_template_dir()]
+    dirs.extend(d / "templates" for d in paths.system_data_dirs())
+    dirs.append(BUILTIN_TEMPLATE_DIR)
+    return dirs
+
+
+def index_path() -> Path:
+    return paths.cache_dir() / "templates-index.json"
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        data = archive_member(path)
+        if data is None:
+            raise
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _archived(directory: Path) -> bool:
+    return directory == BUILTIN_TEMPLATE_DIR and ARCHIVE.is_file()
+
+
+def _bundle_stats(directory: Path) -> List[Tuple[Path, int, int]]:
+    """Return the (path, mtime_ns, size) of the bundles in ``directory``."""
+    if _archived(directory):
+        mtime_ns = ARCHIVE.stat().st_mtime_ns
+        return [(path, mtime_ns, 0) for path in builtin_bundles()]
+    stats = []
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.name.endswith(TEMPLATE_SUFFIX) and entry.is_file():
+                st = entry.stat()
+                stats.append((Path(entry.path), st.st_mtime_ns, st.st_size))
+    return stats
+
+
+def _describe_bundle(path: Path, mtime_ns: int, size: int) -> Optional[dict]:
+    try:
+        with TemplateBundle(path) as bundle:
+            return {
+                "name": bundle.name,
+                "path": str(path),
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "sha256": _file_sha256(path),
+                "description": bundle.manifest.get("description", ""),
+                "variables": bundle.variables,
+                "files": bundle.checksums(),
+            }
+    except TemplateError:
+        return None
+
+
+class TemplateRegistry:
+    """Cached index of the templates found in ``dirs``."""
+
+    def __init__(
+        self, dirs: Optional[List[Path]] = None, index: Optional[Path] = None
+    ):
+        self.dirs = [Path(d) for d in (dirs if dirs is not None else template_dirs())]
+        self.index = Path(index) if index is not None else index_path()
+        self._data: Optional[dict] = None
+
+    def _read_index(self) -> dict:
+        try:
+            data = json.loads(self.index.read_text())
+            if data.get("version") == INDEX_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"version": INDEX_VERSION, "dirs": {}}
+
+    def _write_index(self, data: dict) -> None:
+        self.index.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.index.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.index)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def _scan_dir(self, directory: Path, previous: dict) -> List[dict]:
+        known = {t["path"]: t for t in previous.get("templates", [])}
+        templates = []
+        for path, mtime_ns, size in _bundle_stats(directory):
+            old = known.get(str(path))
+            if old and old["mtime_ns"] == mtime_ns and old["size"] == size:
+                templates.append(old)
+                continue
+            described = _describe_bundle(path, mtime_ns, size)
+            if described:
+                templates.append(described)
+        return templates
+
+    def refresh(self) -> dict:
+        """Bring the index up to date and return it."""
+        data = self._read_index()
+        old_dirs = data.get("dirs", {})
+        new_dirs = {}
+        changed = set(old_dirs) != {str(d) for d in self.dirs}
+        for directory in self.dirs:
+            key = str(directory)
+            previous = old_dirs.get(key, {})
+            try:
+                stat_path = ARCHIVE if _archived(directory) else directory
+                mtime_ns = stat_path.stat().st_mtime_ns
+            except OSError:
+                new_dirs[key] = {"mtime_ns": None, "templates": []}
+                changed = changed or bool(previous.get("templates"))
+                continue
+            if previous.get("mtime_ns") == mtime_ns:
+                new_dirs[key] = previous
+                continue
+            new_dirs[key] = {
+                "mtime_ns": mtime_ns,
+                "templates": self._scan_dir(directory, previous),
+            }
+            changed = True
+        data = {"version": INDEX_VERSION, "dirs": new_dirs}
+        if changed:
+            self._write_index(data)
+        self._data = data
+        return data
+
+    def templates(self) -> Dict[str, dict]:
+        """Return index entries by name; earlier directories take precedence."""
+        data = self._data if self._data is not None else self.refresh()
+        found: Dict[str, dict] = {}
+        for directory in self.dirs:
+            for entry in data["dirs"].get(str(directory), {}).get("templates", []):
+                found.setdefault(entry["name"], entry)
+        return dict(sorted(found.items()))
+
+    def names(self) -> List[str]:
+        return list(self.templates())
+
+    def resolve(self, name: str) -> Path:
+        """Return the bundle path for a template name or bundle file."""
+        path = Path(name)
+        if path.suffix == TEMPLATE_SUFFIX and path.is_file():
+            return path
+        entry = self.templates().get(name)
+        if entry is None:
+            raise TemplateError(f"Unknown template '{name}'")
+        return Path(entry["path"])
+
+    def load(self, name: str) -> TemplateBundle:
+        """Open the selected template's bundle."""
+        return TemplateBundle(self.resolve(name))
+
+    def add(self, src_dir: Path) -> Path:
+        """Pack a template source directory into the user template directory."""
+        manifest = json.loads((Path(src_dir) / "template.json").read_text())
+        name = manifest.get("name") or Path(src_dir).name
+        dest = pack_template(src_dir, self.dirs[0] / f"{name}{TEMPLATE_SUFFIX}")
+        self._data = None
+        return dest
@@ -0,0 +1,291 @@
+"""Project skeleton templates.
+
+A template is a single zip bundle: a ``template.json`` manifest plus the
+project files. Paths and file contents may reference ``${variable}``
+placeholders, which are substituted when the template is materialized.
+In ``.toml``, ``.json`` and ``.py`` files the values are escaped as string
+contents, which is where templates place them (``description = "${description}"``).
+Bundles are memory-mapped and rendered in one pass over the zip index. In
+the zipapp the built-in bundles are members of the archive itself; they are
+read through the package's loader instead.
+"""
+
+import io
+import json
+import mmap
+import os
+import re
+import zipfile
+from pathlib import Path
+from string import Template
+from typing import Dict, List, Optional, Union
+
+from project_setup import dedup, metrics
+
+MANIFEST_NAME = "template.json"
+TEMPLATE_SUFFIX = ".zip"
+# Files whose placeholders sit inside double-quoted strings.
+QUOTED_SUFFIXES = (".toml", ".json", ".py")
+BUILTIN_TEMPLATE_DIR = Path(__file__).parent / "data" / "templates"
+# The zipapp, when running from one: __file__ is then a path inside it.
+ARCHIVE = Path(__file__).parent.parent
+
+
+class TemplateError(Exception):
+    """Raised when a template bundle is missing, malformed or unsafe."""
+
+
+def package_name_for(project_name: str) -> str:
+    """Return an importable package name for a project name."""
+    name = re.sub(r"[^0-9a-zA-Z_]+", "_", project_name).strip("_").lower()
+    if not name:
+        return "package"
+    if name[0].isdigit():
+        name = f"_{name}"
+    return name
+
+
+def default_variables(project_name: str, description: str = "") -> Dict[str, str]:
+    """Return the standard variables available to every template."""
+    return {
+        "project_name": project_name,
+        "package_name": package_name_for(project_name),
+        "description": description,
+        # One-line summary for docstrings: no dangling " - " without a description.
+        "summary": f"{project_name} - {description}" if description else project_name,
+    }
+
+
+def _quote(value: str) -> str:
+    """Escape ``value`` for a double-quoted TOML, JSON or Python string."""
+    # JSON's escapes are a subset of TOML's basic strings and Python's.
+    return json.dumps(value, ensure_ascii=False)[1:-1]
+
+
+class _MappedFile:
+    """Seekable file view over an mmap (``mmap.seekable`` is 3.13+)."""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._map = mapped
+        self.read = mapped.read
+        self.seek = mapped.seek
+        self.tell = mapped.tell
+
+    def seekable(self) -> bool:
+        return True
+
+
+def archive_member(path: Path) -> Optional[bytes]:
+    """Return the content of ``path`` if it is a member of the zipapp."""
+    if not ARCHIVE.is_file():
+        return None
+    try:
+        return __loader__.get_data(str(path))
+    except OSError:
+        return None
+
+
+class TemplateBundle:
+    """A memory-mapped template bundle."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = self._map = None
+        try:
+            self._file = open(self.path, "rb")
+        except OSError as e:
+            data = archive_member(self.path)
+            if data is None:
+                raise TemplateError(
+                    f"Cannot open template '{self.path}': {e}"
+                ) from e
+        try:
+            if self._file is None:
+                self._zip = zipfile.ZipFile(io.BytesIO(data))
+            else:
+                self._map = mmap.mmap(
+                    self._file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self._zip = zipfile.ZipFile(_MappedFile(self._map))
+        except (ValueError, zipfile.BadZipFile) as e:
+            self.close()
+            raise TemplateError(f"Invalid template bundle '{self.path}': {e}") from e
+        self._manifest: Optional[dict] = None
+
+    def __enter__(self) -> "TemplateBundle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for resource in (getattr(self, "_zip", None), self._map, self._file):
+            if resource is not None:
+                resource.close()
+
+    @property
+    def manifest(self) -> dict:
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads(self._zip.read(MANIFEST_NAME))
+            except KeyError:
+                raise TemplateError(
+                    f"Template '{self.path}' has no {MANIFEST_NAME}"
+                ) from None
+        return self._manifest
+
+    @property
+    def name(self) -> str:
+        return self.manifest.get("name", self.path.name[: -len(TEMPLATE_SUFFIX)])
+
+    @property
+    def variables(self) -> Dict[str, Optional[str]]:
+        return self.manifest.get("variables", {})
+
+    def files(self) -> List[str]:
+        """Return the (unrendered) paths of the files in the template."""
+        return [
+            info.filename
+            for info in self._zip.infolist()
+            if not info.is_dir() and info.filename != MANIFEST_NAME
+        ]
+
+    def checksums(self) -> Dict[str, str]:
+        """Return the CRC-32 of each file, read from the zip index."""
+        return {
+            info.filename: f"{info.CRC:08x}"
+            for info in self._zip.infolist()
+            if not info.is_dir() and info.filename != MANIFEST_NAME
+        }
+
+    def render(self, dest: Path, variables: Dict[str, str]) -> List[Path]:
+        """Materialize the template into ``dest`` and return the files written."""
+        values = {k: v for k, v in self.variables.items() if v is not None}
+        values.update(variables)
+        missing = [k for k in self.variables if k not in values]
+        if missing:
+            raise TemplateError(
+                f"Template '{self.name}' needs variables: {', '.join(missing)}"
+            )
+
+        dest = Path(dest)
+        root = os.path.realpath(dest)
+        members = []
+        for info in self._zip.infolist():
+            if info.is_dir() or info.filename == MANIFEST_NAME:
+                continue
+            rel = Template(info.filename).safe_substitute(values)
+            target = os.path.realpath(os.path.join(root, rel))
+            if os.path.commonpath([root, target]) != root:
+                raise TemplateError(f"Template path escapes project: {info.filename}")
+            members.append((info, target))
+
+        for directory in sorted({os.path.dirname(t) for _, t in members}):
+            os.makedirs(directory, exist_ok=True)
+
+        verbatim = set(self.manifest.get("verbatim", []))
+        quoted = {k: _quote(v) for k, v in values.items()}
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        written = []
+        for info, target in members:
+            data = self._zip.read(info)
+            if data and info.filename not in verbatim:
+                try:
+                    text = data.decode("utf-8")
+                except UnicodeDecodeError:
+                    pass
+                else:
+                    substitutes = (
+                        quoted if target.endswith(QUOTED_SUFFIXES) else values
+                    )
+                    data = Template(text).safe_substitute(substitutes).encode("utf-8")
+            mode = (info.external_attr >> 16) & 0o777 or 0o644
+            dedup.unshare(target)
+            fd = os.open(target, flags, mode)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            metrics.record_write(len(data))
+            written.append(Path(target))
+        return written
+
+
+def _add_member(bundle: zipfile.ZipFile, path: Path, arcname: str) -> None:
+    # Fixed timestamps keep rebuilt bundles byte-identical.
+    info = zipfile.ZipInfo(arcname, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = (0o100000 | (path.stat().st_mode & 0o777)) << 16
+    bundle.writestr(info, path.read_bytes())
+
+
+def pack_template(src_dir: Union[str, Path], dest: Union[str, Path]) -> Path:
+    """Pack a template source directory into a bundle."""
+    src_dir = Path(src_dir)
+    dest = Path(dest)
+    if not (src_dir / MANIFEST_NAME).is_file():
+        raise TemplateError(f"'{src_dir}' has no {MANIFEST_NAME}")
+
+    files = sorted(
+        p for p in src_dir.rglob("*") if p.is_file() and "__pycache__" not in p.parts
+    )
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(dest.name + ".tmp")
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        _add_member(bundle, src_dir / MANIFEST_NAME, MANIFEST_NAME)
+        for path in files:
+            rel = path.relative_to(src_dir).as_posix()
+            if rel != MANIFEST_NAME:
+                _add_member(bundle, path, rel)
+    os.replace(tmp, dest)
+    return dest
+
+
+def builtin_bundles() -> List[Path]:
+    """Return the paths of the built-in bundles, also inside the zipapp."""
+    if BUILTIN_TEMPLATE_DIR.is_dir():
+        names = [p.name for p in BUILTIN_TEMPLATE_DIR.glob(f"*{TEMPLATE_SUFFIX}")]
+    elif ARCHIVE.is_file():
+        from importlib import resources
+
+        directory = resources.files(__package__).joinpath("data", "templates")
+        names = [entry.name for entry in directory.iterdir()]
+    else:
+        names = []
+    return [
+        BUILTIN_TEMPLATE_DIR / name
+        for name in sorted(names)
+        if name.endswith(TEMPLATE_SUFFIX)
+    ]
+
+
+def find_template(name: str) -> Path:
+    """Resolve a template name or bundle path to a bundle file."""
+    path = Path(name)
+    builtin = builtin_bundles()
+    if path.suffix == TEMPLATE_SUFFIX and (path.is_file() or path in builtin):
+        return path
+    bundle = BUILTIN_TEMPLATE_DIR / f"{name}{TEMPLATE_SUFFIX}"
+    if bundle in builtin:
+        return bundle
+    raise TemplateError(f"Unknown template '{name}'")
+
+
+def list_templates() -> List[str]:
+    """Return the names of the built-in templates."""
+    return [p.name[: -len(TEMPLATE_SUFFIX)] for p in builtin_bundles()]
+
+
+def materialize(
+    name: str,
+    dest: Union[str, Path],
+    project_name: str,
+    description: str = "",
+    extra: Optional[Dict[str, str]] = None,
+) -> List[Path]:
+    """Render the named template into ``dest``."""
+    variables = default_variables(project_name, description)
+    if extra:
+        variables.update(extra)
+    with TemplateBundle(find_template(name)) as bundle:
+        return bundle.render(Path(dest), variables)
@@ -0,0 +1,176 @@
+"""Venv backend selection from timings recorded on this host.
+
+The backends are ``uv venv`` in each of uv's link modes and ``python -m
+venv``. Every venv created through ``create`` records how long its backend
+took, keyed by the host and the filesystem (mount point) the venv is on,
+in the ``probes`` namespace of the cache store. The next venv on the same
+filesystem uses the backend with the fastest median of the recent runs;
+one run in ``RESAMPLE_EVERY`` uses the least-sampled other backend
+instead, so the choice follows changes in the tools and the filesystem.
+Without timings, backends are tried in the default order: uv in its
+platform's default link mode first.
+"""
+
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from project_setup import cache_store, runner
+
+# uv's default link mode comes first: clone (reflink) on macOS, else hardlink.
+LINK_MODES = (
+    ("clone", "hardlink", "copy")
+    if sys.platform == "darwin"
+    else ("hardlink", "clone", "copy")
+)
+UV_BACKENDS = tuple(f"uv-{mode}" for mode in LINK_MODES)
+BACKENDS = (*UV_BACKENDS, "python")
+# Timings kept per backend; the median of these decides.
+HISTORY = 10
+# One venv in this many re-samples another backend; 0 never does.
+RESAMPLE_EVERY = 10
+
+
+class Choice(NamedTuple):
+    backend: str
+    reason: str
+
+
+def command(backend: str, venv_path: Path) -> List[str]:
+    """Return the command that creates ``venv_path`` with ``backend``."""
+    if backend == "python":
+        return [sys.executable, "-m", "venv", str(venv_path)]
+    mode = backend.split("-", 1)[1]
+    return ["uv", "venv", "--link-mode", mode, str(venv_path)]
+
+
+def available() -> List[str]:
+    """Return the backends whose tool is installed, in the default order."""
+    backends = list(UV_BACKENDS) if runner.probe_tool("uv") else []
+    if runner.probe([sys.executable, "--version"]):
+        backends.append("python")
+    return backends
+
+
+def filesystem(path: Path) -> Path:
+    """Return the mount point of the filesystem holding ``path``."""
+    path = path.resolve()
+    while not path.exists():
+        path = path.parent
+    device = path.stat().st_dev
+    while path.parent != path and path.parent.stat().st_dev == device:
+        path = path.parent
+    return path
+
+
+def _key(location: Path) -> str:
+    return cache_store.key_for(
+        f"venv-timings\0{socket.gethostname()}\0{filesystem(location)}"
+    )
+
+
+def load(location: Path) -> Dict[str, List[float]]:
+    """Return the recorded seconds per backend for venvs at ``location``."""
+    value = cache_store.CacheStore("probes").get_json(_key(location))
+    return value if isinstance(value, dict) else {}
+
+
+def record(location: Path, backend: str, seconds: float) -> None:
+    """Add one timing of ``backend`` for venvs at ``location``."""
+    timings = load(location)
+    timings[backend] = (timings.get(backend, []) + [round(seconds, 4)])[-HISTORY:]
+    try:
+        cache_store.CacheStore("probes").put_json(
+            _key(location), timings, replace=True
+        )
+    except OSError:
+        # Timings only inform the next choice.
+        pass
+
+
+def choose(
+    candidates: List[str],
+    timings: Dict[str, List[float]],
+    resample: bool = False,
+) -> Choice:
+    """Pick the backend for the next venv from ``candidates``."""
+    timed = [b for b in candidates if timings.get(b)]
+    if not timed:
+        return Choice(candidates[0], "no timings yet; default order")
+    best = min(timed, key=lambda b: statistics.median(timings[b]))
+    others = [b for b in candidates if b != best]
+    if resample and others:
+        backend = min(others, key=lambda b: len(timings.get(b, [])))
+        return Choice(backend, "re-sampling instead of the fastest, " + best)
+    median = statistics.median(timings[best])
+    return Choice(
+        best, f"fastest median, {median:.3f}s over {len(timings[best])} runs"
+    )
+
+
+def create(
+    venv_path: Path, candidates: List[str], cwd: Optional[Path] = None
+) -> Choice:
+    """Create ``venv_path`` with the chosen backend, recording its time.
+
+    A failing backend's venv is removed and the remaining candidates are
+    tried in the default order; the last error is raised if all of them fail.
+    """
+    location = venv_path.parent
+    resample = RESAMPLE_EVERY > 0 and random.randrange(RESAMPLE_EVERY) == 0
+    choice = choose(candidates, load(location), resample)
+    order = [choice.backend] + [b for b in candidates if b != choice.backend]
+    for backend in order:
+        start = time.perf_counter()
+        try:
+            runner.run(
+                command(backend, venv_path),
+                cwd=cwd,
+                capture_output=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            shutil.rmtree(venv_path, ignore_errors=True)
+            if backend == order[-1]:
+                raise
+            continue
+        record(location, backend, time.perf_counter() - start)
+        if backend == choice.backend:
+            return choice
+        return Choice(backend, f"{choice.backend} failed")
+    raise ValueError("no venv backend to try")
+
+
+def explain(location: Path, candidates: List[str]) -> List[str]:
+    """Describe the timings at ``location`` and the choice they lead to."""
+    timings = load(location)
+    lines = [
+        f"Venv backend timings on {socket.gethostname()}, "
+        f"filesystem {filesystem(location)}:",
+        f"  {'backend':<12} {'runs':>4} {'median':>8} {'best':>8} {'last':>8}",
+    ]
+    for backend in BACKENDS:
+        runs = timings.get(backend, [])
+        if runs:
+            stats = [statistics.median(runs), min(runs), runs[-1]]
+            cells = " ".join(f"{s:>7.3f}s" for s in stats)
+        else:
+            cells = " ".join(f"{'-':>8}" for _ in range(3))
+        note = "" if backend in candidates else "  (not installed)"
+        lines.append(f"  {backend:<12} {len(runs):>4} {cells}{note}")
+    if candidates:
+        choice = choose(candidates, timings)
+        lines.append(f"Choice: {choice.backend} ({choice.reason})")
+        if RESAMPLE_EVERY:
+            lines.append(
+                f"One venv in {RESAMPLE_EVERY} uses the least-sampled other backend."
+            )
+    else:
+        lines.append("Choice: none; neither uv nor python is available")
+    return lines
@@ -8,29 +8,7 @@ from typing import Optional
 
 import typer
 
-
-def check_uv_installed() -> bool:
-    try:
-        subprocess.run(
-            ["uv", "--version"],
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
-
-
-def check_python_installed() -> bool:
-    try:
-        subprocess.run(
-            [sys.executable, "--version"],
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+from project_setup import dedup, layered_venv, metrics, precompile, venv_backends
 
 
 def get_activation_command(venv_path: Path) -> str:
@@ -42,17 +20,31 @@ def get_activation_command(venv_path: Path) -> str:
 
 def update_gitignore(project_path: Path) -> None:
     gitignore_path = project_path / ".gitignore"
-    if not gitignore_path.exists():
-        gitignore_path.write_text("")
+    content = gitignore_path.read_text() if gitignore_path.exists() else ""
 
-    content = gitignore_path.read_text()
     if ".venv/" not in content and ".venv\\" not in content:
-        with open(gitignore_path, "a") as f:
-            if content and not content.endswith("\n"):
-                f.write("\n")
-            f.write(".venv/\n")
+        if content and not content.endswith("\n"):
+            content += "\n"
+        # Rewrite rather than append: the file may be shared from the dedup store.
+        dedup.write_text(gitignore_path, content + ".venv/\n")
+
+
+def layer_on_base(venv_path: Path, requirements: Path) -> None:
+    """Link the venv to the shared base for ``requirements``, building it once."""
+    try:
+        base = layered_venv.ensure_base(precompile.venv_python(venv_path), requirements)
+        scripts = layered_venv.link(venv_path, base)
+    except (OSError, layered_venv.BaseError) as e:
+        typer.echo(f"Error layering venv on base: {e}", err=True)
+        raise typer.Exit(code=1)
+    state = "built" if base.built else "reused"
+    typer.echo(f"Base layer {state}: {base.site_packages}")
+    if scripts:
+        names = ", ".join(path.name for path in scripts)
+        typer.echo(f"Base commands in the venv: {names}")
 
 
+@metrics.instrument("venv-setup")
 def venv_setup(
     project_dir: Optional[str] = typer.Argument(None, help="Project directory path"),
     yes: bool = typer.Option(False, "--yes", help="Skip prompt, create venv"),
@@ -62,6 +54,22 @@ def venv_setup(
     use_python: Optional[bool] = typer.Option(
         None, "--use-python", help="Use python -m venv"
     ),
+    precompile_bytecode: Optional[bool] = typer.Option(
+        None,
+        "--precompile",
+        help="Compile site-packages to bytecode using all cores",
+    ),
+    base_requirements: Optional[str] = typer.Option(
+        None,
+        "--base-requirements",
+        help="Layer the venv on a shared read-only base built from this file",
+    ),
+    explain: Optional[bool] = typer.Option(
+        None,
+        "--explain",
+        help="Show the recorded backend timings and the choice they lead to, "
+        "without creating a venv",
+    ),
 ) -> None:
     is_interactive = project_dir is None or isinstance(
         project_dir, (typer.models.ArgumentInfo, typer.models.OptionInfo)
@@ -74,6 +82,18 @@ def venv_setup(
             use_uv = None
         if isinstance(use_python, typer.models.OptionInfo):
             use_python = None
+        if isinstance(precompile_bytecode, typer.models.OptionInfo):
+            precompile_bytecode = None
+        if isinstance(base_requirements, typer.models.OptionInfo):
+            base_requirements = None
+    if isinstance(explain, typer.models.OptionInfo):
+        explain = None
+
+    if explain:
+        location = Path(project_dir if not is_interactive else ".").resolve()
+        for line in venv_backends.explain(location, venv_backends.available()):
+            typer.echo(line)
+        return
 
     if is_interactive:
         project_dir = typer.prompt("Project directory", default=".")
@@ -87,6 +107,10 @@ def venv_setup(
         typer.echo(f"Error: Directory '{project_path}' does not exist", err=True)
         raise typer.Exit(code=1)
 
+    if base_requirements and not Path(base_requirements).is_file():
+        typer.echo(f"Error: '{base_requirements}' is not a file", err=True)
+        raise typer.Exit(code=1)
+
     venv_path = project_path / ".venv"
     venv_exists = venv_path.exists()
 
@@ -119,90 +143,53 @@ def venv_setup(
             typer.echo("Skipping venv creation")
             return
 
+    candidates = venv_backends.available()
     if use_uv:
-        if not check_uv_installed():
+        candidates = [b for b in candidates if b in venv_backends.UV_BACKENDS]
+        if not candidates:
             typer.echo("Error: uv is not installed or not in PATH", err=True)
             raise typer.Exit(code=1)
-        try:
-            subprocess.run(
-                ["uv", "venv", str(venv_path)],
-                cwd=project_path,
-                capture_output=True,
-                check=True,
-            )
-        except subprocess.CalledProcessError as e:
-            typer.echo(
-                f"Error creating venv with uv: {e.stderr.decode() if e.stderr else e}",
-                err=True,
-            )
-            raise typer.Exit(code=1)
     elif use_python:
-        if not check_python_installed():
+        if "python" not in candidates:
             typer.echo("Error: Python is not installed or not in PATH", err=True)
             raise typer.Exit(code=1)
-        try:
-            subprocess.run(
-                [sys.executable, "-m", "venv", str(venv_path)],
-                cwd=project_path,
-                capture_output=True,
-                check=True,
-            )
-        except subprocess.CalledProcessError as e:
-            typer.echo(
-                f"Error creating venv with python: {e.stderr.decode() if e.stderr else e}",
-                err=True,
-            )
-            raise typer.Exit(code=1)
-    else:
-        if check_uv_installed():
-            try:
-                subprocess.run(
-                    ["uv", "venv", str(venv_path)],
-                    cwd=project_path,
-                    capture_output=True,
-                    check=True,
-                )
-            except subprocess.CalledProcessError:
-                if not check_python_installed():
-                    typer.echo("Error: Neither uv nor python is available", err=True)
-                    raise typer.Exit(code=1)
-                try:
-                    subprocess.run(
-                        [sys.executable, "-m", "venv", str(venv_path)],
-                        cwd=project_path,
-                        capture_output=True,
-                        check=True,
-                    )
-                except subprocess.CalledProcessError as e:
-                    typer.echo(
-                        f"Error creating venv: {e.stderr.decode() if e.stderr else e}",
-                        err=True,
-                    )
-                    raise typer.Exit(code=1)
-        else:
-            if not check_python_installed():
-                typer.echo("Error: Python is not installed or not in PATH", err=True)
-                raise typer.Exit(code=1)
-            try:
-                subprocess.run(
-                    [sys.executable, "-m", "venv", str(venv_path)],
-                    cwd=project_path,
-                    capture_output=True,
-                    check=True,
-                )
-            except subprocess.CalledProcessError as e:
-                typer.echo(
-                    f"Error creating venv: {e.stderr.decode() if e.stderr else e}",
-                    err=True,
-                )
-                raise typer.Exit(code=1)
+        candidates = ["python"]
+    elif not candidates:
+        typer.echo("Error: Neither uv nor python is available", err=True)
+        raise typer.Exit(code=1)
 
+    try:
+        choice = venv_backends.create(venv_path, candidates, cwd=project_path)
+    except subprocess.CalledProcessError as e:
+        typer.echo(
+            f"Error creating venv: {e.stderr.decode() if e.stderr else e}",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    metrics.record_venv_backend(choice.backend)
     update_gitignore(project_path)
 
+    if base_requirements:
+        layer_on_base(venv_path, Path(base_requirements).resolve())
+
+    job = None
+    if precompile_bytecode:
+        job = precompile.start(project_path, include_sources=False)
+
     activation_cmd = get_activation_command(venv_path)
 
     typer.echo(f"Virtual environment created at: {venv_path}")
+    typer.echo(f"Backend: {choice.backend} ({choice.reason})")
     if sys.platform == "win32":
         typer.echo(f"Activate with: {activation_cmd}")
     else:
         typer.echo(f"Activate with: source {activation_cmd}")
+
+    if job is not None:
+        typer.echo(job.wait().describe())
+
+
+def main() -> None:
+    """Entry point for the venv-setup CLI command."""
+    typer.run(venv_setup)
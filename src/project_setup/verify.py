@@ -0,0 +1,203 @@
+"""Post-init checks that the generated project works.
+
+The checks are independent and mostly wait on child processes, so they run
+concurrently in a thread pool; the report gives each check's own time and
+the wall time of the whole stage. Checks that run tools in the project keep
+it unchanged (no bytecode or pytest cache), so ``git-clean`` is not
+affected by the checks running beside it.
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from project_setup import runner
+
+# The JSON files the steps write; a clone's own may be JSONC.
+GENERATED_JSON = (
+    ".vscode/settings.json",
+    "pyrightconfig.json",
+    ".opencode/settings.json",
+    ".claude/settings.json",
+    ".devcontainer/devcontainer.json",
+)
+
+Check = Tuple[str, Callable[[Path], str]]
+
+
+class CheckFailed(Exception):
+    """Raised by a check whose subject is broken."""
+
+
+class CheckSkipped(Exception):
+    """Raised by a check that cannot run in this project."""
+
+
+class Result(NamedTuple):
+    name: str
+    status: str
+    detail: str
+    seconds: float
+
+    def describe(self) -> str:
+        return (
+            f"  {self.name:<14} {self.status:<7} {self.seconds:6.2f} s  {self.detail}"
+        )
+
+
+def _venv_python(project_path: Path) -> Path:
+    venv_path = project_path / ".venv"
+    if sys.platform == "win32":
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def _quiet_env() -> dict:
+    # Keep tools from writing __pycache__ into the project under test.
+    return {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+
+def expected_venv_version(project_path: Path) -> Optional[str]:
+    """Return the Python version recorded in the venv's ``pyvenv.cfg``."""
+    try:
+        lines = (project_path / ".venv" / "pyvenv.cfg").read_text().splitlines()
+    except OSError:
+        return None
+    values = {}
+    for line in lines:
+        key, sep, value = line.partition("=")
+        if sep:
+            values[key.strip()] = value.strip()
+    # python -m venv writes "version", uv writes "version_info".
+    return values.get("version") or values.get("version_info")
+
+
+def check_venv_python(project_path: Path) -> str:
+    python = _venv_python(project_path)
+    if not python.exists():
+        raise CheckFailed(f"{python} does not exist")
+    result = runner.run(
+        [str(python), "-c", "import sys; print('%d.%d.%d' % sys.version_info[:3])"],
+        capture_output=True,
+        text=True,
+        env=_quiet_env(),
+    )
+    if result.returncode != 0:
+        raise CheckFailed(result.stderr.strip() or f"exit code {result.returncode}")
+    version = result.stdout.strip()
+    expected = expected_venv_version(project_path)
+    if expected and not expected.startswith(version):
+        raise CheckFailed(f"Python {version}, pyvenv.cfg expects {expected}")
+    return f"Python {version}"
+
+
+def check_json(project_path: Path) -> str:
+    count = 0
+    for name in GENERATED_JSON:
+        path = project_path / name
+        if not path.is_file():
+            continue
+        try:
+            json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            raise CheckFailed(f"{name}: {e}")
+        count += 1
+    if not count:
+        raise CheckSkipped("no generated JSON files")
+    return f"{count} files parse"
+
+
+def check_git_clean(project_path: Path) -> str:
+    result = runner.run(
+        ["git", "status", "--porcelain"],
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise CheckFailed(result.stderr.strip() or "git status failed")
+    changes = result.stdout.splitlines()
+    if changes:
+        raise CheckFailed(f"{len(changes)} uncommitted: {', '.join(changes[:3])}")
+    return "working tree clean"
+
+
+def pytest_command(project_path: Path) -> Optional[List[str]]:
+    """Return how to run pytest for the project: venv, PATH, or this Python."""
+    python = _venv_python(project_path)
+    if python.exists() and any(
+        (project_path / ".venv").glob("lib*/python*/site-packages/pytest")
+    ):
+        return [str(python), "-m", "pytest"]
+    executable = shutil.which("pytest")
+    if executable:
+        return [executable]
+    if importlib.util.find_spec("pytest") is not None:
+        return [sys.executable, "-m", "pytest"]
+    return None
+
+
+def check_pytest_collect(project_path: Path) -> str:
+    command = pytest_command(project_path)
+    if command is None:
+        raise CheckSkipped("pytest is not installed")
+    result = runner.run(
+        # addopts may need plugins (xdist...) that collection does not.
+        [*command, "--collect-only", "-q", "-p", "no:cacheprovider", "-o", "addopts="],
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+        env=_quiet_env(),
+    )
+    # Exit code 5 means no tests were collected, which is still a valid setup.
+    if result.returncode not in (0, 5):
+        output = (result.stdout + result.stderr).strip().splitlines()
+        raise CheckFailed(output[-1] if output else f"exit code {result.returncode}")
+    lines = result.stdout.strip().splitlines()
+    return lines[-1] if lines else "collected"
+
+
+def project_checks(
+    create_venv: bool, git_repo: bool, use_pytest: bool
+) -> List[Check]:
+    """Return the checks that apply to a project built with these options."""
+    checks: List[Check] = [("json", check_json)]
+    if create_venv:
+        checks.append(("venv-python", check_venv_python))
+    if git_repo:
+        checks.append(("git-clean", check_git_clean))
+    if use_pytest:
+        checks.append(("pytest-collect", check_pytest_collect))
+    return checks
+
+
+def _run_one(project_path: Path, check: Check) -> Result:
+    name, func = check
+    start = time.perf_counter()
+    try:
+        detail = func(project_path)
+        status = "ok"
+    except CheckSkipped as e:
+        status, detail = "skipped", str(e)
+    except CheckFailed as e:
+        status, detail = "failed", str(e)
+    except (OSError, subprocess.SubprocessError) as e:
+        status, detail = "failed", str(e)
+    return Result(name, status, detail, time.perf_counter() - start)
+
+
+def run_checks(
+    project_path: Path, checks: List[Check], workers: Optional[int] = None
+) -> Tuple[List[Result], float]:
+    """Run ``checks`` concurrently; return their results and the wall time."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or len(checks) or 1) as pool:
+        results = list(pool.map(lambda check: _run_one(project_path, check), checks))
+    return results, time.perf_counter() - start
@@ -0,0 +1,232 @@
+"""In-process harness for command tests.
+
+Commands run through typer's ``CliRunner``, and ``runner.run`` is replaced
+by a ``FakeToolchain``: a child command (``python -m project_setup
+git-setup ...``, as project-init runs them) is invoked in-process through
+``CliRunner`` as well, and git, uv and python invocations are recorded and
+answered by fakes that create only what the commands look for afterwards
+(``.git``, a venv's ``pyvenv.cfg``). Each test gets its own working
+directory, cache and environment, so test files can run in parallel
+(``pytest -n auto``).
+
+``CommandTestCase.fake_tools = False`` runs the same tests against the real
+tools; those integration tests are skipped unless ``PROJECT_SETUP_INTEGRATION``
+is set.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from unittest.mock import patch
+
+from click.testing import Result
+from typer.testing import CliRunner
+
+from project_setup import (
+    cli,
+    dedup,
+    languages,
+    metrics,
+    plugins,
+    runner,
+    venv_backends,
+)
+
+INTEGRATION_ENV = "PROJECT_SETUP_INTEGRATION"
+SELF_COMMAND = [sys.executable, "-m", "project_setup"]
+
+integration = unittest.skipUnless(
+    os.environ.get(INTEGRATION_ENV),
+    f"set {INTEGRATION_ENV}=1 to run with the real git, uv and python",
+)
+
+
+def _make_venv(path: Path) -> None:
+    (path / "bin").mkdir(parents=True, exist_ok=True)
+    (path / "pyvenv.cfg").write_text(f"home = {Path(sys.executable).parent}\n")
+    (path / "bin" / "python").touch(mode=0o755)
+
+
+class FakeToolchain:
+    """A stand-in for ``runner.run`` that records each command it is given.
+
+    ``tools`` names the tools ``runner.probe_tool`` reports as installed.
+    Commands fail, as ``subprocess.run`` would, once ``fail`` has registered
+    a prefix of their arguments. ``git clone`` checks out ``remote_files``,
+    relative paths mapped to their content. Background commands given to
+    ``start`` are only recorded, in ``started``.
+    """
+
+    def __init__(self, tools: Iterable[str] = ("git", "uv", "python")) -> None:
+        self.tools = set(tools)
+        self.remote_files: Dict[str, str] = {}
+        self.calls: List[Tuple[str, List[str], Path]] = []
+        self.started: List[List[str]] = []
+        self._failures: Dict[Tuple[str, ...], Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+
+    def fail(
+        self, tool: str, *args: str, returncode: int = 1, stderr: str = ""
+    ) -> None:
+        """Fail later runs of ``tool`` whose arguments start with ``args``."""
+        self._failures[(tool, *args)] = (returncode, stderr or f"{tool} failed")
+
+    def commands(self, tool: str) -> List[List[str]]:
+        """Return the arguments of each run of ``tool``, in order."""
+        return [args for name, args, _ in self.calls if name == tool]
+
+    def probe_tool(self, name: str) -> bool:
+        return name in self.tools
+
+    def run(
+        self,
+        cmd: Sequence[str],
+        cwd: Optional[Any] = None,
+        check: bool = False,
+        **kwargs: Any,
+    ) -> subprocess.CompletedProcess:
+        cmd = [str(part) for part in cmd]
+        directory = Path(cwd) if cwd is not None else Path.cwd()
+        metrics.record_spawn(runner.tool_name(cmd))
+        if cmd[:3] == SELF_COMMAND:
+            returncode, stdout, stderr = self._command(cmd[3:], cwd, kwargs)
+        else:
+            tool, args = runner.tool_name(cmd), cmd[1:]
+            with self._lock:
+                self.calls.append((tool, args, directory))
+            returncode, stderr = next(
+                (
+                    failure
+                    for prefix, failure in self._failures.items()
+                    if prefix[0] == tool
+                    and args[: len(prefix) - 1] == list(prefix[1:])
+                ),
+                (0, ""),
+            )
+            stdout = self._answer(tool, args, directory) if not returncode else ""
+
+        text = kwargs.get("text") or kwargs.get("universal_newlines")
+        if not text:
+            stdout, stderr = stdout.encode(), stderr.encode()
+        if not kwargs.get("capture_output"):
+            stdout = stderr = None
+        if check and returncode:
+            raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+        return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+    def start(self, cmd: Sequence[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        cmd = [str(part) for part in cmd]
+        metrics.record_spawn(runner.tool_name(cmd))
+        with self._lock:
+            self.started.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    def _command(
+        self, args: List[str], cwd: Optional[Any], kwargs: Dict[str, Any]
+    ) -> Tuple[int, str, str]:
+        previous = os.getcwd()
+        if cwd is not None:
+            os.chdir(cwd)
+        try:
+            result = invoke(
+                *args, input=kwargs.get("input") or "", env=kwargs.get("env")
+            )
+        finally:
+            os.chdir(previous)
+        return result.exit_code, result.stdout, result.stderr
+
+    def _answer(self, tool: str, args: List[str], cwd: Path) -> str:
+        """Create what a successful run leaves behind; return its stdout."""
+        if tool == "git":
+            if args[:1] == ["-C"]:
+                cwd, args = cwd / args[1], args[2:]
+            if args[:1] == ["init"]:
+                target = cwd / args[-1] if args[1:] and args[-1][0] != "-" else cwd
+                (target / ".git" / "hooks").mkdir(parents=True, exist_ok=True)
+            elif args[:1] == ["clone"]:
+                (cwd / args[-1] / ".git").mkdir(parents=True, exist_ok=True)
+                for name, content in self.remote_files.items():
+                    path = cwd / args[-1] / name
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(content)
+            elif args[:1] == ["version"]:
+                return "git version 2.39.5\n"
+            elif args[:1] == ["var"]:
+                return "Test <test@example.com> 1700000000 +0000\n"
+        elif tool == "uv" and args[:1] == ["venv"]:
+            _make_venv(cwd / args[-1])
+        elif tool == "python":
+            if args[:2] == ["-m", "venv"]:
+                _make_venv(cwd / args[-1])
+            elif args[:1] == ["--version"]:
+                return f"Python {sys.version.split()[0]}\n"
+        return ""
+
+
+def invoke(
+    *args: str, input: Optional[str] = None, env: Optional[Dict[str, str]] = None
+) -> Result:
+    """Run ``project-setup <args>`` in-process; unexpected errors propagate.
+
+    ``env`` is set for the duration of the command, as a child's environment.
+    """
+    return CliRunner().invoke(
+        cli.app, list(args), input=input, env=env, catch_exceptions=False
+    )
+
+
+class CommandTestCase(unittest.TestCase):
+    """Runs each test in its own directory, with a fake toolchain by default."""
+
+    fake_tools = True
+    tools: Tuple[str, ...] = ("git", "uv", "python")
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name).resolve()
+        env = patch.dict(
+            os.environ,
+            {
+                "XDG_CACHE_HOME": str(self.tmp / ".cache"),
+                "PRE_COMMIT_HOME": str(self.tmp / ".cache" / "pre-commit"),
+                plugins.DISABLE_ENV: "1",
+                languages.STORE_ENV: str(self.tmp / ".cache" / "packages"),
+                "GIT_CONFIG_NOSYSTEM": "1",
+                "GIT_AUTHOR_NAME": "test",
+                "GIT_AUTHOR_EMAIL": "test@example.com",
+                "GIT_COMMITTER_NAME": "test",
+                "GIT_COMMITTER_EMAIL": "test@example.com",
+            },
+        )
+        env.start()
+        # Commands export these for their children; patch.dict restores them.
+        for name in (metrics.METRICS_ENV, dedup.DEDUP_ENV, dedup.LOG_ENV):
+            os.environ.pop(name, None)
+        self.addCleanup(env.stop)
+
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmp)
+
+        # Venv backends are chosen from timings alone, without re-sampling.
+        resample = patch.object(venv_backends, "RESAMPLE_EVERY", 0)
+        resample.start()
+        self.addCleanup(resample.stop)
+
+        self.toolchain = FakeToolchain(self.tools)
+        if self.fake_tools:
+            for name in ("run", "start", "probe_tool"):
+                fake = patch.object(runner, name, getattr(self.toolchain, name))
+                fake.start()
+                self.addCleanup(fake.stop)
+
+    def invoke(self, *args: str, input: Optional[str] = None) -> Result:
+        return invoke(*args, input=input)
+
+    def assertSucceeded(self, result: Result) -> None:
+        self.assertEqual(result.exit_code, 0, result.output)
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import cache_store
+
+
+def write_blob(size):
+    def build(staging: Path) -> None:
+        (staging / "blob").write_bytes(b"x" * size)
+
+    return build
+
+
+class TestCacheStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_publish_and_get(self):
+        store = cache_store.CacheStore("test", root=self.root)
+        self.assertIsNone(store.get("k1"))
+        self.assertTrue(store.publish("k1", write_blob(10)))
+        self.assertFalse(store.publish("k1", write_blob(20)))
+        entry = store.get("k1")
+        self.assertEqual((entry / "blob").read_bytes(), b"x" * 10)
+        self.assertEqual(store.entry("k1").size, 10)
+        # Staging directories do not outlive a publish.
+        self.assertEqual([p.name for p in store.path.glob(".tmp-*")], [])
+
+    def test_failed_build_publishes_nothing(self):
+        store = cache_store.CacheStore("test", root=self.root)
+
+        def build(staging: Path) -> None:
+            (staging / "partial").write_text("x")
+            raise OSError("boom")
+
+        with self.assertRaises(OSError):
+            store.publish("k1", build)
+        self.assertIsNone(store.get("k1"))
+        self.assertEqual(list(store.path.glob(".tmp-*")), [])
+
+    def test_lru_eviction_keeps_budget(self):
+        store = cache_store.CacheStore("test", budget=250, root=self.root)
+        store.publish("a", write_blob(100))
+        store.publish("b", write_blob(100))
+        meta = store.entry_path("a") / cache_store.ENTRY_META
+        os.utime(meta, (1, 1))
+        os.utime(store.entry_path("b") / cache_store.ENTRY_META, (2, 2))
+        store.get("a")
+        store.publish("c", write_blob(100))
+        self.assertEqual(sorted(e.key for e in store.entries()), ["a", "c"])
+
+    def test_prune(self):
+        store = cache_store.CacheStore("test", root=self.root)
+        store.publish("a", write_blob(100))
+        store.publish("b", write_blob(50))
+        self.assertEqual(store.prune(max_size=60), (1, 100))
+        self.assertEqual(store.stats()["entries"], 1)
+        self.assertEqual(store.prune(clear=True), (1, 50))
+        self.assertEqual(store.entries(), [])
+
+    def test_json_values(self):
+        store = cache_store.CacheStore("test", root=self.root)
+        self.assertIsNone(store.get_json("probe"))
+        store.put_json("probe", {"ok": True})
+        self.assertEqual(store.get_json("probe"), {"ok": True})
+
+    def test_rejects_path_like_names(self):
+        with self.assertRaises(ValueError):
+            cache_store.CacheStore("../escape", root=self.root)
+        store = cache_store.CacheStore("test", root=self.root)
+        with self.assertRaises(ValueError):
+            store.get("../other")
+
+    def test_budget_overrides(self):
+        with patch.dict(
+            os.environ, {cache_store.BUDGET_ENV: "mirrors=1G, results=10M,bad"}
+        ):
+            budgets = cache_store.budgets()
+        self.assertEqual(budgets["mirrors"], 1024 ** 3)
+        self.assertEqual(budgets["results"], 10 * 1024 ** 2)
+        self.assertEqual(cache_store.parse_size("64k"), 64 * 1024)
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import dedup, pytest_profiles
+from project_setup.templates import materialize
+
+
+class TestDedup(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.log = self.tmp / "dedup.log"
+        self.env = patch.dict(
+            os.environ,
+            {
+                dedup.STORE_ENV: str(self.tmp / "store"),
+                dedup.LOG_ENV: str(self.log),
+            },
+        )
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def test_hardlink_shares_inode(self):
+        a, b = self.tmp / "a.ini", self.tmp / "b.ini"
+        with patch.dict(os.environ, {dedup.DEDUP_ENV: "hardlink"}):
+            dedup.write_text(a, "[pytest]\n")
+            dedup.write_text(b, "[pytest]\n")
+        self.assertEqual(a.stat().st_ino, b.stat().st_ino)
+        self.assertEqual(b.read_text(), "[pytest]\n")
+
+        summary = dedup.summarize_log(self.log)
+        self.assertEqual(summary["hardlink"], 2)
+        self.assertEqual(summary["inodes_saved"], 2)
+        self.assertEqual(summary["bytes_saved"], 18)
+
+    def test_reflink_falls_back_to_copy(self):
+        target = self.tmp / "settings.json"
+        with patch.dict(os.environ, {dedup.DEDUP_ENV: "reflink"}):
+            with patch.object(dedup, "_reflink", return_value=False):
+                dedup.write_text(target, "{}")
+        self.assertEqual(target.read_text(), "{}")
+        self.assertEqual(target.stat().st_nlink, 1)
+        self.assertEqual(dedup.summarize_log(self.log)["copy"], 1)
+
+    def test_plain_write_breaks_shared_link(self):
+        a, b = self.tmp / "a", self.tmp / "b"
+        with patch.dict(os.environ, {dedup.DEDUP_ENV: "hardlink"}):
+            dedup.write_text(a, "shared\n")
+            dedup.write_text(b, "shared\n")
+        dedup.write_text(b, "changed\n")
+        self.assertEqual(a.read_text(), "shared\n")
+        self.assertEqual(b.read_text(), "changed\n")
+
+    def test_disabled_by_default(self):
+        target = self.tmp / "plain.txt"
+        dedup.write_text(target, "x")
+        self.assertEqual(target.read_text(), "x")
+        self.assertFalse((self.tmp / "store").exists())
+
+    def test_edits_leave_the_store_intact(self):
+        project = self.tmp / "project"
+        project.mkdir()
+        pyproject = project / "pyproject.toml"
+        original = '[project]\nname = "app"\n'
+        with patch.dict(os.environ, {dedup.DEDUP_ENV: "hardlink"}):
+            dedup.write_text(pyproject, original)
+        obj = dedup.store_object(original.encode())
+        self.assertEqual(pyproject.stat().st_ino, obj.stat().st_ino)
+
+        # Writes made by the steps replace the shared file rather than edit it.
+        dedup.write_tree(
+            project,
+            pytest_profiles.dev_dependency_files(pyproject.read_text()),
+        )
+        self.assertIn("[dependency-groups]", pyproject.read_text())
+        self.assertEqual(obj.read_text(), original)
+
+        readme = project / "README.md"
+        with patch.dict(os.environ, {dedup.DEDUP_ENV: "hardlink"}):
+            dedup.write_text(readme, "# app\n")
+        materialize("library", project, "app")
+        self.assertEqual(dedup.store_object(b"# app\n").read_text(), "# app\n")
+
+    def test_detach_tree_and_repair(self):
+        a, b = self.tmp / "a", self.tmp / "b"
+        with patch.dict(os.environ, {dedup.DEDUP_ENV: "hardlink"}):
+            dedup.write_text(a, "shared\n")
+            dedup.write_text(b, "shared\n")
+        self.assertEqual(dedup.detach_tree(self.tmp), 2)
+        self.assertEqual(a.stat().st_nlink, 1)
+        with open(a, "r+") as f:
+            f.write("edited")
+        self.assertEqual(b.read_text(), "shared\n")
+
+        # An object edited in place through a link is replaced when next used.
+        obj = dedup.store_object(b"shared\n")
+        os.chmod(obj, 0o644)
+        with patch.dict(os.environ, {dedup.DEDUP_ENV: "hardlink"}):
+            dedup.write_text(b, "shared\n")
+        with open(b, "r+") as f:
+            f.write("broken")
+        self.assertEqual(dedup.store_object(b"shared\n").read_text(), "shared\n")
+
+    def test_enabled_is_scoped(self):
+        with dedup.enabled("reflink") as log:
+            self.assertEqual(dedup.dedup_mode(), "reflink")
+            self.assertEqual(
+                dedup.child_env(), {dedup.DEDUP_ENV: "reflink", dedup.LOG_ENV: log}
+            )
+            self.assertTrue(Path(log).is_file())
+        self.assertIsNone(dedup.dedup_mode())
+        self.assertEqual(dedup.child_env(), {})
+        self.assertFalse(Path(log).exists())
+        self.assertNotIn(dedup.DEDUP_ENV, os.environ)
@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import detect
+
+
+class TestDetect(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def make(self, *names, content=""):
+        for name in names:
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    def test_languages_and_layout(self):
+        self.make("pyproject.toml", "src/app/__init__.py", "src/app/cli.py")
+        self.make("web/package.json", "web/a.js", "web/b.js", "web/c.ts")
+        detection = detect.scan(self.root)
+        # The root manifest wins over the larger number of node sources.
+        self.assertEqual(detection.languages, ["python", "node"])
+        self.assertEqual(detection.language, "python")
+        self.assertTrue(detection.src_layout)
+        self.assertTrue(detection.complete)
+        self.assertEqual(detection.entries, 10)
+
+    def test_sources_rank_without_a_root_manifest(self):
+        self.make("tools/setup.py", "cmd/main.go", "pkg/a.go", "pkg/b.go")
+        detection = detect.scan(self.root)
+        self.assertEqual(detection.languages, ["go", "python"])
+        self.assertFalse(detection.src_layout)
+        self.assertIsNone(detect.scan(self.root / "cmd" / "missing").language)
+
+    def test_ignored_and_skipped_paths(self):
+        self.make(".gitignore", content="build/\n/vendor\n*.gen.go\n")
+        self.make("main.rs", "build/x.py", "sub/build/y.py", "vendor/z.js")
+        self.make("node_modules/dep/index.js", "api.gen.go", "sub/vendor/w.go")
+        detection = detect.scan(self.root)
+        # /vendor is anchored to the root, so sub/vendor is scanned; one
+        # source file each, and ties keep the MANIFESTS order.
+        self.assertEqual(detection.languages, ["rust", "go"])
+
+    def test_venvs_and_test_configs(self):
+        self.make(".gitignore", content=".venv/\n")
+        self.make(".venv/pyvenv.cfg", ".venv/lib/site.py", "tools/env/pyvenv.cfg")
+        self.make("conftest.py", "tox.ini")
+        self.make("setup.cfg", content="[metadata]\n\n[tool:pytest]\naddopts = -q\n")
+        detection = detect.scan(self.root)
+        self.assertEqual(detection.venvs, [".venv", "tools/env"])
+        # tox.ini has no [pytest] section.
+        self.assertEqual(detection.test_configs, ["conftest.py", "setup.cfg"])
+        self.assertIn("Virtual environments: .venv, tools/env", detection.describe())
+
+    def test_limits_stop_the_scan(self):
+        self.make("a/b/c/d.py", "x/y.rs")
+        with patch.object(detect, "MAX_DEPTH", 1):
+            detection = detect.scan(self.root)
+        self.assertEqual(detection.languages, ["rust"])
+        self.assertFalse(detection.complete)
+        self.assertIn("Scanned the top", detection.describe())
+
+        with patch.object(detect, "MAX_ENTRIES", 1):
+            detection = detect.scan(self.root)
+        self.assertEqual((detection.entries, detection.languages), (2, []))
+        self.assertFalse(detection.complete)
+
+    def test_stops_once_every_language_has_a_manifest(self):
+        self.make("setup.py", "package.json", "Cargo.toml", "go.mod", "deep/x.py")
+        detection = detect.scan(self.root)
+        self.assertEqual(detection.entries, 5)
+        self.assertFalse(detection.complete)
@@ -0,0 +1,104 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from project_setup import docker_config
+
+
+class TestDockerConfig(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name) / "demo"
+        (self.project / ".venv").mkdir(parents=True)
+        (self.project / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\ndependencies = ["typer", "rich>=13"]\n'
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_cfg(self, text: str) -> None:
+        (self.project / ".venv" / "pyvenv.cfg").write_text(text)
+
+    def test_uv_src_layout(self):
+        self.write_cfg("home = /usr/bin\nuv = 0.4.0\nversion_info = 3.12.3\n")
+        (self.project / "uv.lock").write_text("")
+        (self.project / "README.md").write_text("# demo\n")
+        (self.project / "src" / "demo").mkdir(parents=True)
+
+        written = docker_config.write_docker_config(self.project)
+        self.assertEqual(
+            [p.name for p in written],
+            ["Dockerfile", "devcontainer.json", ".dockerignore"],
+        )
+        dockerfile = (self.project / "Dockerfile").read_text()
+        self.assertIn("FROM python:3.12-slim", dockerfile)
+        self.assertIn("--mount=type=cache,target=/root/.cache/uv", dockerfile)
+        self.assertIn("uv sync --no-install-project --no-dev --frozen", dockerfile)
+        # Manifests are installed before any source is copied.
+        self.assertLess(
+            dockerfile.index("COPY pyproject.toml uv.lock ./"),
+            dockerfile.index("uv sync --no-install-project"),
+        )
+        self.assertLess(
+            dockerfile.index("uv sync --no-install-project"),
+            dockerfile.index("COPY src/ src/"),
+        )
+        self.assertNotIn("COPY . .", dockerfile)
+        self.assertIn(".venv\n", (self.project / ".dockerignore").read_text())
+
+    def test_pip_flat_layout(self):
+        self.write_cfg("home = /usr/bin\nversion = 3.10.12\n")
+        layout = docker_config.detect_layout(self.project)
+        self.assertEqual(
+            (layout.backend, layout.src, layout.python), ("venv", False, "3.10")
+        )
+
+        dockerfile = docker_config.render_dockerfile(layout)
+        self.assertIn("pip install tomli", dockerfile)
+        self.assertIn("--mount=type=cache,target=/root/.cache/pip", dockerfile)
+        self.assertLess(
+            dockerfile.index("pip install -r /tmp/requirements.txt"),
+            dockerfile.index("COPY . ."),
+        )
+        config = docker_config.render_devcontainer("demo", layout)
+        self.assertEqual(config["postCreateCommand"], "pip install -e .")
+
+    @unittest.skipIf(sys.version_info < (3, 11), "needs tomllib")
+    def test_dependency_script(self):
+        script = docker_config._PYPROJECT_DEPS.format(module="tomllib")
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=self.project,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.split(), ["typer", "rich>=13"])
+
+    def test_requirement_files(self):
+        (self.project / "pyproject.toml").unlink()
+        for name in ("requirements-dev.txt", "requirements.txt", "notes.txt"):
+            (self.project / name).write_text("")
+        layout = docker_config.detect_layout(self.project, backend="uv")
+        self.assertEqual(layout.manifests, ["requirements.txt", "requirements-dev.txt"])
+        # Development requirements stay out of the image.
+        dockerfile = docker_config.render_dockerfile(layout)
+        self.assertIn("COPY requirements.txt ./", dockerfile)
+        self.assertIn("uv pip install -r requirements.txt\n", dockerfile)
+        self.assertNotIn("requirements-dev", dockerfile)
+        config = docker_config.render_devcontainer("demo", layout)
+        self.assertEqual(
+            config["postCreateCommand"],
+            "uv pip install -r requirements.txt -r requirements-dev.txt",
+        )
+
+        (self.project / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+        layout = docker_config.detect_layout(self.project, backend="venv")
+        self.assertNotIn("requirements-dev", docker_config.render_dockerfile(layout))
+        config = docker_config.render_devcontainer("demo", layout)
+        self.assertEqual(
+            config["postCreateCommand"], "pip install -e . -r requirements-dev.txt"
+        )
@@ -0,0 +1,68 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import git_perf
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+class TestGitPerf(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        # maintenance register writes to the global config.
+        self.env = patch.dict(
+            os.environ,
+            {
+                "HOME": str(self.tmp),
+                "GIT_CONFIG_GLOBAL": str(self.tmp / ".gitconfig"),
+                "GIT_CONFIG_NOSYSTEM": "1",
+                "GIT_AUTHOR_NAME": "test",
+                "GIT_AUTHOR_EMAIL": "test@example.com",
+                "GIT_COMMITTER_NAME": "test",
+                "GIT_COMMITTER_EMAIL": "test@example.com",
+            },
+        )
+        self.env.start()
+        self.repo = self.tmp / "repo"
+        self.repo.mkdir()
+        git(self.repo, "init", "-q")
+        (self.repo / "README.md").write_text("# repo\n")
+        git(self.repo, "add", ".")
+        git(self.repo, "commit", "-q", "-m", "init")
+        git(self.repo, "gc", "-q")
+
+    def tearDown(self):
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def test_apply(self):
+        report = git_perf.apply(self.repo)
+
+        for key, value, _ in git_perf.SETTINGS:
+            self.assertEqual(git(self.repo, "config", key), value)
+        objects = self.repo / ".git" / "objects"
+        self.assertTrue((objects / "info" / "commit-graph").exists())
+        self.assertTrue((objects / "pack" / "multi-pack-index").exists())
+        registered = git(
+            self.tmp, "config", "--global", "--get-all", "maintenance.repo"
+        )
+        self.assertIn(str(self.repo), registered)
+        self.assertIn("commit-graph", report.applied)
+        self.assertGreater(report.status_before, 0)
+        self.assertIn("git status:", report.describe())
+        self.assertIn("git maintenance start", report.describe())
+
+    def test_old_git_skips_settings(self):
+        report = git_perf.apply(self.repo, version=(2, 20))
+        self.assertNotIn("feature.manyFiles", report.applied)
+        self.assertIn("core.untrackedCache", report.applied)
+        self.assertTrue(any("fsmonitor" in s for s in report.skipped))
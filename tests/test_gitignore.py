@@ -0,0 +1,50 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from project_setup import gitignore
+
+RESOURCES = Path(__file__).resolve().parent.parent / "resources" / "gitignore"
+
+
+class TestGitignore(unittest.TestCase):
+    def test_catalog_is_built_from_resources(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            built = gitignore.build_catalog(RESOURCES, Path(tmp) / "gitignore.zip")
+            self.assertEqual(
+                built.read_bytes(),
+                gitignore.CATALOG.read_bytes(),
+                "run scripts/build_resources.py",
+            )
+
+    def test_lookup(self):
+        self.assertGreater(len(gitignore.names()), 150)
+        self.assertEqual(
+            gitignore.resolve("python+VSCode+osx"),
+            ["Python", "VisualStudioCode", "macOS"],
+        )
+        self.assertIn(".venv/", gitignore.render("Python"))
+
+    def test_combination(self):
+        content = gitignore.render("Python+Django+JetBrains")
+        self.assertTrue(content.startswith("### Python ###\n"))
+        self.assertIn("\n### Django ###\n", content)
+        self.assertIn(".idea/**/workspace.xml", content)
+        # __pycache__/ is in both Python and Django; it is listed once.
+        self.assertEqual(content.count("\n__pycache__/\n"), 1)
+
+    def test_unknown_name(self):
+        with self.assertRaisesRegex(gitignore.GitignoreError, "did you mean Python"):
+            gitignore.render("Python+Pythn")
+
+    def test_patterns(self):
+        text = "# comment\n/dist/\n*.log\nbuild/**\ndocs/_build/\n!keep.log\n*\n"
+        self.assertEqual(
+            gitignore.patterns(text),
+            [
+                gitignore.Pattern("dist", True),
+                gitignore.Pattern("**/*.log", False),
+                gitignore.Pattern("build", True),
+                gitignore.Pattern("docs/_build", True),
+            ],
+        )
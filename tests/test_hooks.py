@@ -0,0 +1,215 @@
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import hooks, project_init, runner
+
+from tests.harness import CommandTestCase, FakeToolchain
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+class TestHooks(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.env = patch.dict(
+            os.environ,
+            {
+                "PRE_COMMIT_HOME": str(self.tmp / "pre-commit"),
+                "GIT_CONFIG_NOSYSTEM": "1",
+                "GIT_AUTHOR_NAME": "test",
+                "GIT_AUTHOR_EMAIL": "test@example.com",
+                "GIT_COMMITTER_NAME": "test",
+                "GIT_COMMITTER_EMAIL": "test@example.com",
+            },
+        )
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def fake_cache(self, config: str) -> None:
+        home = hooks.hook_home()
+        home.mkdir()
+        with sqlite3.connect(home / "db.db") as db:
+            db.execute("CREATE TABLE repos (repo TEXT, ref TEXT, path TEXT)")
+            for index, (repo, rev) in enumerate(hooks.config_repos(config)):
+                path = home / f"repo{index}"
+                (path / "py_env-python3").mkdir(parents=True)
+                (path / "py_env-python3" / ".install_state_v1").write_text("{}")
+                db.execute("INSERT INTO repos VALUES (?, ?, ?)", (repo, rev, str(path)))
+
+    def test_render_config(self):
+        python = hooks.render_config("python")
+        self.assertIn("id: ruff", python)
+        self.assertEqual(len(hooks.config_repos(python)), 2)
+
+        rust = hooks.render_config("rust")
+        self.assertIn("entry: cargo fmt --", rust)
+        self.assertIn("pass_filenames: false", rust)
+        self.assertEqual(
+            hooks.config_repos(rust),
+            [(repo, rev) for repo, rev, _ in hooks.COMMON_REPOS],
+        )
+
+    def test_hook_home(self):
+        self.assertEqual(hooks.hook_home(), self.tmp / "pre-commit")
+        with patch.dict(
+            os.environ, {"PRE_COMMIT_HOME": "", "XDG_CACHE_HOME": str(self.tmp)}
+        ):
+            self.assertEqual(hooks.hook_home(), self.tmp / "pre-commit")
+
+    def test_is_warm(self):
+        config = hooks.render_config("python")
+        self.assertFalse(hooks.is_warm(config))
+        self.fake_cache(hooks.render_config("go"))
+        self.assertFalse(hooks.is_warm(config))
+        self.assertTrue(hooks.is_warm(hooks.render_config("go")))
+
+    def test_install_skips(self):
+        project = self.tmp / "project"
+        project.mkdir()
+        self.assertEqual(hooks.install(project).detail, f"no {hooks.CONFIG_NAME}")
+
+        hooks.write_config(project)
+        self.assertIsNone(hooks.write_config(project, "go"))
+        with patch.object(hooks, "pre_commit_command", return_value=None):
+            self.assertIn("not installed", hooks.install(project).detail)
+        with patch.object(hooks, "pre_commit_command", return_value=["false"]):
+            report = hooks.install(project, offline=True)
+        self.assertFalse(report.installed)
+        self.assertIn("warm-hooks", report.describe())
+
+    def test_no_git_hook_without_the_environments(self):
+        project = self.tmp / "project"
+        project.mkdir()
+        hooks.write_config(project)
+        toolchain = FakeToolchain()
+        toolchain.fail("pre-commit", "install-hooks", stderr="network is down")
+        with patch.object(
+            hooks, "pre_commit_command", return_value=["pre-commit"]
+        ), patch.object(runner, "run", toolchain.run):
+            report = hooks.install(project)
+        self.assertFalse(report.installed)
+        self.assertEqual(report.detail, "network is down")
+        self.assertEqual(toolchain.commands("pre-commit"), [["install-hooks"]])
+
+    def test_failed_commit_is_not_retried(self):
+        project = self.tmp / "project"
+        project.mkdir()
+        git(project, "init", "-q")
+        (project / "notes.txt").write_text("trailing   \n")
+        hook = project / ".git" / "hooks" / "pre-commit"
+        hook.write_text(
+            "#!/bin/sh\n"
+            "echo run >> ../hook-runs\n"
+            "grep -q ' $' notes.txt || exit 0\n"
+            "sed -i 's/ *$//' notes.txt\n"
+            "echo 'trailing-whitespace: Failed'\n"
+            "exit 1\n"
+        )
+        hook.chmod(0o755)
+
+        with patch("typer.echo") as echo:
+            project_init.git_add_and_commit(project)
+        self.assertIn("trailing-whitespace: Failed", echo.call_args.args[0])
+        self.assertEqual((self.tmp / "hook-runs").read_text(), "run\n")
+        with self.assertRaises(subprocess.CalledProcessError):
+            git(project, "rev-parse", "HEAD")
+
+
+# Fails, like pre-commit-hooks' fixers and checkers, on any staged file they
+# would change or reject.
+CHECK_HOOK = """\
+#!{python}
+import json, subprocess, sys
+names = subprocess.run(
+    ["git", "diff", "--cached", "--name-only", "-z"],
+    capture_output=True, text=True, check=True,
+).stdout.split("\\0")
+failed = []
+for name in filter(None, names):
+    text = open(name, encoding="utf-8").read()
+    lines = text.splitlines()
+    if text and (not text.endswith("\\n") or text.endswith("\\n\\n")):
+        failed.append(f"end-of-file-fixer: {{name}}")
+    if any(line != line.rstrip() for line in lines):
+        failed.append(f"trailing-whitespace: {{name}}")
+    if any(line.startswith(("<<<<<<< ", ">>>>>>> ")) for line in lines):
+        failed.append(f"check-merge-conflict: {{name}}")
+    if name.endswith(".json"):
+        try:
+            json.loads(text)
+        except ValueError:
+            failed.append(f"check-json: {{name}}")
+    if name.endswith(".toml") and sys.version_info >= (3, 11):
+        import tomllib
+        try:
+            tomllib.loads(text)
+        except ValueError:
+            failed.append(f"check-toml: {{name}}")
+print("\\n".join(failed))
+sys.exit(1 if failed else 0)
+"""
+
+
+class TestGeneratedFilesPassHooks(CommandTestCase):
+    def commit(self, project: Path) -> subprocess.CompletedProcess:
+        git(project, "init", "-q")
+        hook = project / ".git" / "hooks" / "pre-commit"
+        hook.write_text(CHECK_HOOK.format(python=sys.executable))
+        hook.chmod(0o755)
+        git(project, "add", ".")
+        return subprocess.run(
+            ["git", "commit", "-q", "-m", "Initial project setup"],
+            cwd=project,
+            capture_output=True,
+            text=True,
+        )
+
+    def test_initial_commit_passes_on_the_first_attempt(self):
+        runs = {
+            "python": ("--pytest", "--pytest-profile", "perf", "--docker"),
+            "node": (),
+            "rust": (),
+            "go": (),
+        }
+        for language, options in runs.items():
+            with self.subTest(language=language):
+                result = self.invoke(
+                    "project-init", "--git", "new", "--name", language,
+                    "--language", language, "--no-venv", *options,
+                )
+                self.assertSucceeded(result)
+                project = self.tmp / language
+                hooks.write_config(project, language)
+                committed = self.commit(project)
+                self.assertEqual(committed.returncode, 0, committed.stdout)
+
+    @unittest.skipUnless(shutil.which("ruff"), "needs ruff")
+    def test_python_files_pass_ruff_format(self):
+        # The ruff-format hook of the python config would rewrite them.
+        result = self.invoke(
+            "project-init", "--git", "new", "--name", "demo", "--no-venv",
+            "--pytest", "--pytest-profile", "perf",
+        )
+        self.assertSucceeded(result)
+        checked = subprocess.run(
+            ["ruff", "format", "--check", "--diff", "--no-cache", "."],
+            cwd=self.tmp / "demo",
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(checked.returncode, 0, checked.stdout + checked.stderr)
@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import languages
+
+
+class TestLanguages(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.store = self.tmp / "packages"
+        self.env = patch.dict(
+            os.environ,
+            {
+                languages.STORE_ENV: str(self.store),
+                "CARGO_HOME": str(self.tmp / "cargo"),
+            },
+        )
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def test_node_scaffold_uses_shared_store(self):
+        project = self.tmp / "my-app"
+        languages.scaffold("node", project, "my-app", "Demo")
+        manifest = json.loads((project / "package.json").read_text())
+        self.assertEqual(manifest["name"], "my_app")
+        self.assertEqual(manifest["description"], "Demo")
+        npmrc = (project / ".npmrc").read_text()
+        self.assertIn(f"store-dir={self.store / 'pnpm'}", npmrc)
+        self.assertIn("offline=false", npmrc)
+
+    def test_rust_and_go_scaffolds(self):
+        languages.scaffold("rust", self.tmp / "r", "r")
+        self.assertIn('name = "r"', (self.tmp / "r" / "Cargo.toml").read_text())
+        config = (self.tmp / "r" / ".cargo" / "config.toml").read_text()
+        self.assertIn("offline = false", config)
+
+        languages.scaffold("go", self.tmp / "g", "g")
+        self.assertTrue((self.tmp / "g" / "go.mod").read_text().startswith("module g"))
+        envrc = (self.tmp / "g" / ".envrc").read_text()
+        self.assertIn(f'GOMODCACHE="{self.store / "go"}"', envrc)
+        self.assertIn("file://", envrc)
+
+    def test_store_config_is_not_committed(self):
+        project = self.tmp / "g"
+        project.mkdir()
+        (project / ".gitignore").write_text("bin/")
+        languages.scaffold("go", project, "g")
+        languages.ignore_local_config("go", project)
+        self.assertEqual(
+            (project / ".gitignore").read_text(),
+            "bin/\n\n# project-setup: paths to this machine's package stores\n"
+            "/.envrc\n",
+        )
+        languages.scaffold("rust", self.tmp / "r", "r")
+        ignored = (self.tmp / "r" / ".gitignore").read_text().splitlines()
+        self.assertEqual(ignored[-1], "/.cargo/config.toml")
+
+    def test_offline(self):
+        self.assertFalse(languages.store_populated("go"))
+        download = self.store / "go" / "cache" / "download"
+        download.mkdir(parents=True)
+        (download / "example.com").mkdir()
+        self.assertTrue(languages.store_populated("go"))
+
+        languages.scaffold("go", self.tmp / "g", "g", offline=True)
+        self.assertIn('GOPROXY="off"', (self.tmp / "g" / ".envrc").read_text())
+
+    def test_python_has_no_scaffold(self):
+        self.assertEqual(languages.scaffold("python", self.tmp / "p", "p"), [])
+        self.assertFalse(languages.store_populated("python"))
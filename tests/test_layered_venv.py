@@ -0,0 +1,134 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import cache_store, layered_venv, precompile
+
+
+def build_wheel(directory: Path) -> Path:
+    wheel = directory / "demo_base-1.0-py3-none-any.whl"
+    info = "demo_base-1.0.dist-info"
+    with zipfile.ZipFile(wheel, "w") as archive:
+        archive.writestr(
+            "demo_base/__init__.py", "VALUE = 42\n\ndef main():\n    print(VALUE)\n"
+        )
+        archive.writestr(
+            f"{info}/METADATA", "Metadata-Version: 2.1\nName: demo-base\nVersion: 1.0\n"
+        )
+        archive.writestr(
+            f"{info}/WHEEL",
+            "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\n"
+            "Tag: py3-none-any\n",
+        )
+        archive.writestr(
+            f"{info}/entry_points.txt",
+            "[console_scripts]\ndemo-base = demo_base:main\n",
+        )
+        archive.writestr(f"{info}/RECORD", "")
+    return wheel
+
+
+class TestLayeredVenv(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.env = patch.dict(
+            os.environ,
+            {
+                "XDG_CACHE_HOME": str(self.tmp / "cache"),
+                "PIP_NO_INDEX": "1",
+                "UV_OFFLINE": "1",
+            },
+        )
+        self.env.start()
+        self.requirements = self.tmp / "base.txt"
+        self.requirements.write_text(
+            f"# shared dependencies\n{build_wheel(self.tmp)}\n"
+        )
+
+    def tearDown(self):
+        self.env.stop()
+        cache_store.CacheStore(layered_venv.NAMESPACE).prune(clear=True)
+        self._tmp.cleanup()
+
+    def make_venv(self, name: str) -> Path:
+        venv = self.tmp / name / ".venv"
+        subprocess.run(
+            [sys.executable, "-m", "venv", "--without-pip", str(venv)], check=True
+        )
+        return venv
+
+    def test_requirements_normalization(self):
+        self.assertEqual(
+            layered_venv.base_key(["Requests >= 2", "attrs"], "tag"),
+            layered_venv.base_key(["attrs", "requests>=2"], "tag"),
+        )
+        self.assertNotEqual(
+            layered_venv.base_key(["attrs"], "cpython-311"),
+            layered_venv.base_key(["attrs"], "cpython-312"),
+        )
+
+    def test_layered_venvs_share_base(self):
+        python = Path(sys.executable)
+        first = layered_venv.ensure_base(python, self.requirements)
+        second = layered_venv.ensure_base(python, self.requirements)
+        self.assertTrue(first.built)
+        self.assertFalse(second.built)
+        self.assertEqual(first.site_packages, second.site_packages)
+
+        module = first.site_packages / "demo_base" / "__init__.py"
+        self.assertFalse(module.stat().st_mode & 0o222)
+        self.assertTrue(list(module.parent.glob("__pycache__/*.pyc")))
+
+        for name in ("one", "two"):
+            venv = self.make_venv(name)
+            layered_venv.link(venv, first)
+            result = subprocess.run(
+                [
+                    str(precompile.venv_python(venv)),
+                    "-c",
+                    "import demo_base; print(demo_base.VALUE)",
+                ],
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(result.stdout.strip(), "42", result.stderr)
+
+    def test_pinned_base_survives_eviction(self):
+        base = layered_venv.ensure_base(Path(sys.executable), self.requirements)
+        venv = self.make_venv("project")
+        layered_venv.link(venv, base)
+
+        store = cache_store.CacheStore(layered_venv.NAMESPACE)
+        self.assertEqual(store.prune(max_size=0), (0, 0))
+        self.assertTrue(base.site_packages.is_dir())
+
+        shutil.rmtree(venv)
+        self.assertEqual(store.prune(max_size=0)[0], 1)
+        self.assertFalse(base.site_packages.exists())
+
+    def test_base_commands_run_from_the_venv(self):
+        base = layered_venv.ensure_base(Path(sys.executable), self.requirements)
+        venv = self.make_venv("project")
+        scripts = layered_venv.link(venv, base)
+        command = precompile.venv_python(venv).parent / "demo-base"
+        self.assertEqual(scripts, [command])
+        result = subprocess.run([str(command)], capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), "42", result.stderr)
+
+        # Commands the venv has already are kept.
+        command.write_text("#!/bin/sh\necho own\n")
+        self.assertEqual(layered_venv.write_scripts(venv, base), [])
+        self.assertIn("own", command.read_text())
+
+    def test_long_shebang(self):
+        python = Path("/opt/" + "x" * 130 + "/bin/python")
+        shebang = layered_venv._shebang(python)
+        self.assertTrue(shebang.startswith("#!/bin/sh\n"))
+        self.assertIn(f'"{python}"', shebang)
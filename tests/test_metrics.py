@@ -0,0 +1,94 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import typer
+
+from project_setup import metrics
+from project_setup.runner import tool_name
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "project_setup.prom"
+        self.env = patch.dict(os.environ, {metrics.METRICS_ENV: str(self.path)})
+        self.env.start()
+        metrics._samples.clear()
+
+    def tearDown(self):
+        metrics._samples.clear()
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def _value(self, series: str) -> float:
+        for line in self.path.read_text().splitlines():
+            if line.startswith(series + " "):
+                return float(line.split()[-1])
+        self.fail(f"{series} not found")
+
+    def test_flush_merges_runs(self):
+        for _ in range(2):
+            metrics.record_spawn("git")
+            metrics.record_write(100)
+            metrics.flush()
+        self.assertEqual(
+            self._value('project_setup_subprocess_spawns_total{tool="git"}'), 2
+        )
+        self.assertEqual(self._value("project_setup_bytes_written_total"), 200)
+        self.assertIn(
+            "# TYPE project_setup_files_written_total counter", self.path.read_text()
+        )
+
+    def test_step_histogram_and_failures(self):
+        with metrics.step("ide"):
+            pass
+        with self.assertRaises(typer.Exit):
+            with metrics.step("git"):
+                raise typer.Exit(code=1)
+        with self.assertRaises(typer.Exit):
+            with metrics.step("venv"):
+                raise typer.Exit()
+        metrics.flush()
+
+        self.assertEqual(
+            self._value('project_setup_step_duration_seconds_count{step="ide"}'), 1
+        )
+        self.assertEqual(
+            self._value(
+                'project_setup_step_duration_seconds_bucket{le="+Inf",step="ide"}'
+            ),
+            1,
+        )
+        self.assertEqual(
+            self._value('project_setup_step_failures_total{step="git"}'), 1
+        )
+        self.assertNotIn('failures_total{step="venv"}', self.path.read_text())
+
+    def test_disabled_without_env(self):
+        with patch.dict(os.environ, {metrics.METRICS_ENV: ""}):
+            metrics.record_spawn("git")
+        self.assertEqual(metrics._samples, {})
+
+    def test_exporting_is_scoped(self):
+        other = self.path.with_name("scoped.prom")
+        with patch.dict(os.environ, {metrics.METRICS_ENV: ""}):
+            with metrics.exporting(str(other)):
+                self.assertEqual(
+                    metrics.child_env(), {metrics.METRICS_ENV: str(other)}
+                )
+                metrics.record_spawn("uv")
+            # Flushed on exit, and off again afterwards.
+            self.assertIn('tool="uv"} 1', other.read_text())
+            self.assertEqual(metrics.child_env(), {})
+            metrics.record_spawn("uv")
+        self.assertEqual(metrics._samples, {})
+        self.assertEqual(os.environ[metrics.METRICS_ENV], str(self.path))
+
+    def test_tool_name(self):
+        self.assertEqual(tool_name([sys.executable, "-m", "venv"]), "python")
+        self.assertEqual(tool_name(["/usr/bin/git", "init"]), "git")
+        self.assertEqual(tool_name(["uv.exe", "venv"]), "uv")
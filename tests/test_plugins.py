@@ -0,0 +1,106 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import plugins
+from project_setup.plugins import PluginError, PluginStep, StepContext
+
+PLUGIN_MODULE = "project_setup_test_plugin"
+
+
+def step(name, *requires):
+    return PluginStep(name, PLUGIN_MODULE, name, requires, "acme")
+
+
+class TestPlugins(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.site = self.tmp / "site"
+        self.site.mkdir()
+        self.env = patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.tmp / "cache")})
+        self.env.start()
+        os.environ.pop(plugins.DISABLE_ENV, None)
+        sys.path.insert(0, str(self.site))
+
+    def tearDown(self):
+        sys.path.remove(str(self.site))
+        sys.modules.pop(PLUGIN_MODULE, None)
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def _install(self, dist: str, entry_points: str) -> None:
+        info = self.site / f"{dist}-1.0.dist-info"
+        info.mkdir()
+        (info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {dist}\n")
+        (info / "entry_points.txt").write_text(
+            f"[{plugins.GROUP}]\n{entry_points}\n"
+        )
+
+    def test_discover_reads_entry_points(self):
+        self._install("acme", f"docs = {PLUGIN_MODULE}:docs [venv]")
+        (found,) = plugins.discover()
+        self.assertEqual(found.name, "docs")
+        self.assertEqual(found.value, f"{PLUGIN_MODULE}:docs")
+        self.assertEqual(found.requires, ("venv",))
+        self.assertEqual(found.distribution, "acme")
+        self.assertNotIn(PLUGIN_MODULE, sys.modules)
+
+    def test_index_is_cached_until_environment_changes(self):
+        self._install("acme", f"docs = {PLUGIN_MODULE}:docs")
+        first = plugins.discover()
+        with patch.object(plugins, "scan", side_effect=AssertionError):
+            self.assertEqual(plugins.discover(), first)
+
+        self._install("other", f"lint = {PLUGIN_MODULE}:lint")
+        os.utime(self.site, ns=(0, os.stat(self.site).st_mtime_ns + 10**9))
+        self.assertEqual(
+            [s.name for s in plugins.discover()], ["docs", "lint"]
+        )
+
+    def test_disabled(self):
+        self._install("acme", f"docs = {PLUGIN_MODULE}:docs")
+        with patch.dict(os.environ, {plugins.DISABLE_ENV: "1"}):
+            self.assertEqual(plugins.discover(), [])
+
+    def test_schedule(self):
+        plan = plugins.schedule(
+            [step("report", "lint", "commit"), step("lint"), step("env", "venv")]
+        )
+        self.assertEqual(
+            {after: [s.name for s in steps] for after, steps in plan.items()},
+            {"venv": ["env"], "pytest": ["lint"], "commit": ["report"]},
+        )
+        plan = plugins.schedule([step("b", "a"), step("a", "venv")])
+        self.assertEqual([s.name for s in plan["venv"]], ["a", "b"])
+
+    def test_schedule_errors(self):
+        for steps in (
+            [step("a", "b"), step("b", "a")],
+            [step("a", "missing")],
+            [step("venv")],
+            [step("a"), step("a")],
+        ):
+            with self.subTest(steps=steps), self.assertRaises(PluginError):
+                plugins.schedule(steps)
+
+    def test_run_imports_plugin(self):
+        (self.site / f"{PLUGIN_MODULE}.py").write_text(
+            "def docs(context):\n"
+            "    (context.project_path / 'docs').mkdir()\n"
+            "def broken(context):\n"
+            "    raise RuntimeError('boom')\n"
+        )
+        project = self.tmp / "project"
+        project.mkdir()
+        context = StepContext(project, "project", "python", "new", False)
+
+        plugins.run(step("docs"), context)
+        self.assertTrue((project / "docs").is_dir())
+        with self.assertRaisesRegex(PluginError, "boom"):
+            plugins.run(step("broken"), context)
+        with self.assertRaises(PluginError):
+            plugins.run(step("absent"), context)
@@ -0,0 +1,41 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from project_setup import precompile
+
+
+class TestPrecompile(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_compiles_sources(self):
+        (self.project / "src" / "pkg").mkdir(parents=True)
+        (self.project / "tests").mkdir()
+        (self.project / "src" / "pkg" / "__init__.py").write_text("")
+        (self.project / "src" / "pkg" / "core.py").write_text("VALUE = 1\n")
+        (self.project / "tests" / "test_core.py").write_text("def test(): pass\n")
+
+        job = precompile.start(self.project, include_venv=False)
+        self.assertIsNotNone(job)
+        report = job.wait()
+
+        self.assertTrue(report.ok)
+        self.assertEqual(report.files, 3)
+        self.assertIn("Bytecode for 3 modules", report.describe())
+        for directory in (self.project / "src" / "pkg", self.project / "tests"):
+            self.assertTrue(list((directory / "__pycache__").glob("*.pyc")))
+
+    def test_reports_failures(self):
+        (self.project / "src").mkdir()
+        (self.project / "src" / "broken.py").write_text("def broken(:\n")
+        report = precompile.start(self.project, include_venv=False).wait()
+        self.assertFalse(report.ok)
+        self.assertIn("failed", report.describe())
+
+    def test_nothing_to_compile(self):
+        self.assertIsNone(precompile.start(self.project))
@@ -0,0 +1,11 @@
+from tests.harness import CommandTestCase
+
+
+class TestProjSetup(CommandTestCase):
+    def test_language_template_ignores_store_config(self):
+        result = self.invoke("proj-setup", "demo", "--template", "go")
+        self.assertSucceeded(result)
+        project = self.tmp / "demo"
+        envrc = (project / ".envrc").read_text()
+        self.assertIn('export GOMODCACHE="', envrc)
+        self.assertIn("/.envrc", (project / ".gitignore").read_text().splitlines())
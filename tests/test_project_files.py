@@ -0,0 +1,50 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from project_setup import gitignore, project_files, project_init
+
+
+class TestIdeFiles(unittest.TestCase):
+    def test_excludes_follow_gitignore(self):
+        files = project_files.ide_files("python", gitignore.render("Python"))
+        settings = json.loads(files[".vscode/settings.json"])
+        self.assertIn("**/.venv/**", settings["files.watcherExclude"])
+        self.assertIn("**/.pytest_cache/**", settings["files.watcherExclude"])
+        self.assertIn("**/*.so", settings["search.exclude"])
+        self.assertIn("**/__pycache__", settings["files.exclude"])
+        # Build output is ignored but stays visible in the explorer.
+        self.assertNotIn("**/build", settings["files.exclude"])
+
+        pyright = json.loads(files["pyrightconfig.json"])
+        self.assertEqual(pyright["include"], ["."])
+        self.assertIn("**/build", pyright["exclude"])
+        self.assertIn("**/.*", pyright["exclude"])
+        self.assertFalse(any("[" in glob for glob in pyright["exclude"]))
+        self.assertNotIn("venv", pyright)
+
+    def test_layout_and_venv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            (project / "src").mkdir()
+            (project / "venv").mkdir()
+            (project / "venv" / "pyvenv.cfg").write_text("home = /usr/bin\n")
+            (project / ".gitignore").write_text("/out/\n")
+            project_init.create_ide_config(project)
+
+            settings = json.loads((project / ".vscode" / "settings.json").read_text())
+            pyright = json.loads((project / "pyrightconfig.json").read_text())
+        self.assertTrue(settings["python.defaultInterpreterPath"].startswith("venv/"))
+        self.assertEqual(
+            set(settings["files.watcherExclude"]), {"out/**", "venv/**"}
+        )
+        self.assertEqual(pyright["include"], ["src", "tests"])
+        self.assertEqual(pyright["extraPaths"], ["src"])
+        self.assertEqual((pyright["venvPath"], pyright["venv"]), (".", "venv"))
+
+    def test_other_languages(self):
+        files = project_files.ide_files("node", "node_modules/\n")
+        self.assertNotIn("pyrightconfig.json", files)
+        settings = json.loads(files[".vscode/settings.json"])
+        self.assertEqual(settings["files.watcherExclude"], {"**/node_modules/**": True})
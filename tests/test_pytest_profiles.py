@@ -0,0 +1,90 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from project_setup import dedup, pytest_profiles
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None
+
+
+class TestPytestProfiles(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def add_dev_dependencies(self):
+        files = pytest_profiles.dev_dependency_files(
+            pytest_profiles.read_pyproject(self.project)
+        )
+        dedup.write_tree(self.project, files)
+        return files
+
+    def dev_group(self):
+        if tomllib is None:
+            self.skipTest("needs tomllib")
+        data = tomllib.loads((self.project / "pyproject.toml").read_text())
+        return data["dependency-groups"]["dev"]
+
+    def test_requirements_without_pyproject(self):
+        self.assertEqual(list(self.add_dev_dependencies()), ["requirements-dev.txt"])
+        self.assertEqual(
+            (self.project / "requirements-dev.txt").read_text().split(),
+            list(pytest_profiles.DEV_DEPENDENCIES),
+        )
+
+    def test_adds_dependency_group(self):
+        (self.project / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\ndependencies = []\n'
+        )
+        self.add_dev_dependencies()
+        self.assertEqual(self.dev_group(), list(pytest_profiles.DEV_DEPENDENCIES))
+
+    def test_existing_groups(self):
+        pyproject = self.project / "pyproject.toml"
+        pyproject.write_text(
+            '[dependency-groups]\nlint = ["ruff"]\n\n[tool.x]\ny = 1\n'
+        )
+        self.add_dev_dependencies()
+        self.assertEqual(self.dev_group(), list(pytest_profiles.DEV_DEPENDENCIES))
+        self.assertIn('lint = ["ruff"]', pyproject.read_text())
+
+        before = pyproject.read_text()
+        self.assertEqual(self.add_dev_dependencies(), {})
+        self.assertEqual(pyproject.read_text(), before)
+
+    def test_profile_marker(self):
+        dedup.write_tree(self.project, pytest_profiles.perf_files())
+        (self.project / "pytest.ini").write_text(pytest_profiles.pytest_ini("perf"))
+        (self.project / "tests").mkdir()
+        (self.project / "tests" / "test_slow.py").write_text(
+            "import pytest\n\n"
+            "@pytest.mark.profile\n"
+            "def test_slow():\n"
+            "    sum(range(1000))\n"
+        )
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "-q",
+                "-o",
+                "addopts=",
+                "-p",
+                "no:cacheprovider",
+                "tests",
+            ],
+            cwd=self.project,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertTrue(list((self.project / ".profiles").glob("*test_slow.prof")))
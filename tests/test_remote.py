@@ -0,0 +1,161 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from project_setup import remote
+from project_setup.mock_remote import MockHostingServer
+
+TOKEN = "test-token"
+
+
+def git(*args, cwd):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout
+
+
+class TestRemote(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.server = MockHostingServer(self.tmp / "remote", token=TOKEN).start()
+        self.sleeps = []
+        self.client = remote.HostingClient(
+            self.server.url, token=TOKEN, sleep=self.sleeps.append
+        )
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self._tmp.cleanup()
+
+    def test_create_and_push(self):
+        project = self.tmp / "demo"
+        project.mkdir()
+        git("init", "-q", cwd=project)
+        (project / "README.md").write_text("# demo\n")
+        git("add", ".", cwd=project)
+        git(
+            "-c", "user.name=t", "-c", "user.email=t@example.com",
+            "commit", "-q", "-m", "init", cwd=project,
+        )
+
+        repo = remote.publish(project, "demo", True, "A demo", client=self.client)
+        self.assertTrue(repo["private"])
+        self.assertEqual(repo["description"], "A demo")
+        head = git("rev-parse", "HEAD", cwd=project)
+        self.assertEqual(git("rev-parse", "HEAD", cwd=repo["clone_url"]), head)
+
+    def test_connections_are_reused(self):
+        for i in range(5):
+            self.client.create_repository(remote.RepoSpec(f"r{i}"))
+        self.assertEqual(self.server.requests, 5)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.client.connections_opened, 1)
+
+    def test_concurrent_batch(self):
+        self.server.latency = 0.1
+        specs = [remote.RepoSpec(f"r{i}") for i in range(8)]
+        start = time.perf_counter()
+        results = remote.create_repositories(self.client, specs, workers=8)
+        elapsed = time.perf_counter() - start
+        self.assertEqual([r["name"] for r in results], [s.name for s in specs])
+        # Serially this would take at least 0.8 s.
+        self.assertLess(elapsed, 0.6)
+        self.assertLessEqual(self.client.connections_opened, 8)
+
+    def test_retry_after(self):
+        self.server.throttle(2, retry_after=3)
+        repo = self.client.create_repository(remote.RepoSpec("limited"))
+        self.assertEqual(repo["name"], "limited")
+        self.assertEqual(self.sleeps, [3.0, 3.0])
+
+    def test_rate_limit_reset(self):
+        self.server.throttle(1, retry_after=None)
+        self.client.create_repository(remote.RepoSpec("limited"))
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertLessEqual(self.sleeps[0], 1.0)
+
+    def test_lost_responses(self):
+        self.client.create_repository(remote.RepoSpec("first"))
+        # The server may have created the repository; a resend would fail.
+        self.server.drop(1)
+        with self.assertRaisesRegex(remote.RemoteError, "Could not reach"):
+            self.client.create_repository(remote.RepoSpec("lost"))
+        self.assertIn("lost", self.server.repos)
+        self.assertEqual(self.server.requests, 2)
+
+        # Reads are resent on a new connection.
+        self.client.create_repository(remote.RepoSpec("again"))
+        self.server.drop(1)
+        status, _, repo = self.client.request("GET", "/repos/mock/lost")
+        self.assertEqual((status, repo["name"]), (200, "lost"))
+        self.assertEqual(self.server.requests, 5)
+
+    def test_gateway_errors(self):
+        # The repository was created behind the gateway; a resend would fail.
+        self.server.gateway_error(504)
+        with self.assertRaisesRegex(remote.RemoteError, "HTTP 504"):
+            self.client.create_repository(remote.RepoSpec("slow"))
+        self.assertIn("slow", self.server.repos)
+        self.assertEqual((self.server.requests, self.sleeps), (1, []))
+
+        self.server.gateway_error(502)
+        status, _, repo = self.client.request("GET", "/repos/mock/slow")
+        self.assertEqual((status, repo["name"]), (200, "slow"))
+        self.assertEqual(len(self.sleeps), 1)
+
+        self.server.throttle(1, retry_after=2, status=503)
+        self.client.create_repository(remote.RepoSpec("busy"))
+        self.assertEqual(self.sleeps[1:], [2.0])
+
+    def test_idle_connections_closed_by_the_server(self):
+        self.client.create_repository(remote.RepoSpec("first"))
+        self.server.close_idle()
+        time.sleep(0.05)
+        repo = self.client.create_repository(remote.RepoSpec("second"))
+        self.assertEqual(repo["name"], "second")
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual(self.client.connections_opened, 2)
+
+    def test_errors(self):
+        self.client.create_repository(remote.RepoSpec("dup"))
+        with self.assertRaisesRegex(remote.RemoteError, "already exists"):
+            self.client.create_repository(remote.RepoSpec("dup"))
+        results = remote.create_repositories(
+            self.client, [remote.RepoSpec("dup"), remote.RepoSpec("new")]
+        )
+        self.assertIsInstance(results[0], remote.RemoteError)
+        self.assertEqual(results[1]["name"], "new")
+
+        bad = remote.HostingClient(self.server.url, token="wrong")
+        with self.assertRaisesRegex(remote.RemoteError, "HTTP 401"):
+            bad.create_repository(remote.RepoSpec("x"))
+        bad.close()
+
+    def test_git_setup_create_remote(self):
+        env = dict(os.environ, PROJECT_SETUP_API_URL=self.server.url)
+        env["GITHUB_TOKEN"] = TOKEN
+        env["GIT_AUTHOR_NAME"] = env["GIT_COMMITTER_NAME"] = "t"
+        env["GIT_AUTHOR_EMAIL"] = env["GIT_COMMITTER_EMAIL"] = "t@example.com"
+        env["XDG_CACHE_HOME"] = str(self.tmp / "cache")
+        result = subprocess.run(
+            [
+                sys.executable, "-m", "project_setup", "git-setup", "cli-demo",
+                "--mode", "new", "--include-readme", "--create-remote",
+            ],
+            cwd=self.tmp,
+            env=env,
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), str(self.tmp / "cli-demo"))
+        self.assertIn("cli-demo", self.server.repos)
+        bare = self.server.repos["cli-demo"]["clone_url"]
+        self.assertIn("Initial commit", git("log", "--oneline", cwd=bare))
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import result_cache
+
+
+def spec(**overrides):
+    options = dict(
+        git="new",
+        include_gitignore=True,
+        template="Python",
+        include_readme=True,
+        description=None,
+        create_venv=False,
+        cli="both",
+        server=None,
+        workflow="agentic",
+        include_handoff=False,
+        use_pytest=True,
+    )
+    options.update(overrides)
+    return result_cache.normalize_spec(**options)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.env = patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.tmp / "cache")})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def test_spec_normalization(self):
+        self.assertEqual(
+            result_cache.spec_key(spec(server=None)),
+            result_cache.spec_key(spec(server="local")),
+        )
+        self.assertNotEqual(
+            result_cache.spec_key(spec()),
+            result_cache.spec_key(spec(use_pytest=False)),
+        )
+
+    def test_key_covers_version_and_catalog(self):
+        key = result_cache.spec_key(spec())
+        with patch.object(result_cache, "__version__", "99.0"):
+            self.assertNotEqual(result_cache.spec_key(spec()), key)
+        result_cache.catalog_digest.cache_clear()
+        self.addCleanup(result_cache.catalog_digest.cache_clear)
+        with patch("importlib.resources.files", return_value=self.tmp):
+            (self.tmp / "data").mkdir()
+            (self.tmp / "data" / "gitignore.zip").write_bytes(b"other")
+            self.assertNotEqual(result_cache.spec_key(spec()), key)
+
+    def test_store_and_materialize(self):
+        source = self.tmp / "alpha"
+        (source / ".git").mkdir(parents=True)
+        (source / ".venv").mkdir()
+        (source / ".vscode").mkdir()
+        (source / "README.md").write_text("# alpha\n\nalpha docs\n")
+        (source / ".vscode" / "settings.json").write_text(f'{{"root": "{source}"}}')
+        key = result_cache.spec_key(spec())
+
+        self.assertIsNone(result_cache.lookup(key))
+        self.assertTrue(result_cache.store(key, source, "alpha"))
+        self.assertFalse(result_cache.store(key, source, "alpha"))
+
+        target = self.tmp / "beta"
+        result_cache.materialize(key, target, "beta")
+        self.assertEqual((target / "README.md").read_text(), "# beta\n\nalpha docs\n")
+        self.assertEqual(
+            (target / ".vscode" / "settings.json").read_text(),
+            f'{{"root": "{target}"}}',
+        )
+        self.assertFalse((target / ".git").exists())
+        self.assertFalse((target / ".venv").exists())
+
+    def test_materialize_refuses_existing_directory(self):
+        source = self.tmp / "alpha"
+        source.mkdir()
+        (source / "pytest.ini").write_text("[pytest]\n")
+        key = result_cache.spec_key(spec())
+        result_cache.store(key, source, "alpha")
+        with self.assertRaises(FileExistsError):
+            result_cache.materialize(key, source, "alpha")
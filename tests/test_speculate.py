@@ -0,0 +1,65 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import speculate
+
+
+def fake_create_venv(venv_path: Path) -> str:
+    bin_dir = venv_path / "bin"
+    bin_dir.mkdir(parents=True)
+    (bin_dir / "pip").write_text(f"#!{venv_path}/bin/python\n")
+    (bin_dir / "activate").write_text(f'VIRTUAL_ENV="{venv_path}"\n')
+    (venv_path / "pyvenv.cfg").write_text(f"command = python -m venv {venv_path}\n")
+    return "python"
+
+
+class TestSpeculation(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def staged(self):
+        prefix = speculate.STAGING_PREFIX
+        return [p for p in self.tmp.iterdir() if p.name.startswith(prefix)]
+
+    @patch("project_setup.speculate.create_venv", fake_create_venv)
+    def test_adopt_moves_and_relocates(self):
+        speculation = speculate.Speculation()
+        project = self.tmp / "demo"
+        speculation.start_venv(project)
+        project.mkdir()
+        self.assertEqual(speculation.take_venv(project), "python")
+        speculation.close()
+
+        venv = project / ".venv"
+        self.assertEqual((venv / "bin" / "pip").read_text(), f"#!{venv}/bin/python\n")
+        self.assertIn(str(venv), (venv / "pyvenv.cfg").read_text())
+        self.assertEqual(self.staged(), [])
+
+    @patch("project_setup.speculate.create_venv", fake_create_venv)
+    def test_cancel_discards_staging(self):
+        speculation = speculate.Speculation()
+        speculation.start_venv(self.tmp / "demo")
+        speculation.cancel_venv()
+        self.assertIsNone(speculation.take_venv(self.tmp / "demo"))
+        speculation.close()
+        self.assertEqual(self.staged(), [])
+
+    def test_failed_creation_falls_back(self):
+        def fail(venv_path):
+            raise OSError("no python")
+
+        with patch("project_setup.speculate.create_venv", fail):
+            speculation = speculate.Speculation()
+            project = self.tmp / "demo"
+            speculation.start_venv(project)
+            project.mkdir()
+            self.assertIsNone(speculation.take_venv(project))
+            speculation.close()
+        self.assertFalse((project / ".venv").exists())
+        self.assertEqual(self.staged(), [])
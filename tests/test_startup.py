@@ -0,0 +1,89 @@
+"""Startup benchmark: import cost of ``--help`` and each subcommand.
+
+Budgets are total import time in milliseconds as reported by
+``python -X importtime``. Scale them on slow machines with
+``PROJECT_SETUP_STARTUP_BUDGET_SCALE``.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from project_setup.cli import COMMANDS
+
+BUDGET_SCALE = float(os.environ.get("PROJECT_SETUP_STARTUP_BUDGET_SCALE", "1"))
+HELP_BUDGET_MS = 150
+COMMAND_BUDGET_MS = 200
+PROJECT_INIT_BUDGET_MS = 150
+
+COMMAND_MODULES = {spec.module for spec in COMMANDS.values()}
+# Imported by the project-init steps that use them, not by project-init itself.
+STEP_MODULES = {
+    f"project_setup.{name}"
+    for name in (
+        "detect",
+        "docker_config",
+        "git_perf",
+        "hooks",
+        "layered_venv",
+        "precompile",
+        "remote",
+        "result_cache",
+        "speculate",
+        "tar_stream",
+        "verify",
+    )
+}
+
+
+def import_profile(*args: str) -> dict:
+    """Run the CLI under -X importtime; return {module: self time in us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "project_setup", *args],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        profile[name.strip()] = int(self_us)
+    return profile
+
+
+def total_ms(profile: dict) -> float:
+    return sum(profile.values()) / 1000
+
+
+class TestStartup(unittest.TestCase):
+    def test_help_imports_no_commands(self):
+        profile = import_profile("--help")
+        self.assertFalse(COMMAND_MODULES & set(profile))
+        self.assertNotIn("rich", profile)
+        self.assertLess(total_ms(profile), HELP_BUDGET_MS * BUDGET_SCALE)
+
+    def test_subcommands_import_only_their_module(self):
+        for name, spec in COMMANDS.items():
+            with self.subTest(command=name):
+                profile = import_profile(name, "--help")
+                self.assertIn(spec.module, profile)
+                self.assertFalse((COMMAND_MODULES - {spec.module}) & set(profile))
+                self.assertNotIn("rich", profile)
+                self.assertLess(
+                    total_ms(profile), COMMAND_BUDGET_MS * BUDGET_SCALE
+                )
+
+    def test_git_setup_imports_no_step_modules(self):
+        profile = import_profile("git-setup", "--help")
+        self.assertFalse(
+            {f"project_setup.{name}" for name in ("git_perf", "mirrors", "remote")}
+            & set(profile)
+        )
+
+    def test_project_init_imports_no_step_modules(self):
+        profile = import_profile("project-init", "--help")
+        self.assertFalse(STEP_MODULES & set(profile))
+        self.assertLess(total_ms(profile), PROJECT_INIT_BUDGET_MS * BUDGET_SCALE)
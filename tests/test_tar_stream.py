@@ -0,0 +1,89 @@
+import io
+import os
+import subprocess
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import tar_stream
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+class TestTarStream(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.env = patch.dict(
+            os.environ,
+            {
+                "GIT_CONFIG_NOSYSTEM": "1",
+                "GIT_AUTHOR_NAME": "test",
+                "GIT_AUTHOR_EMAIL": "test@example.com",
+                "GIT_COMMITTER_NAME": "test",
+                "GIT_COMMITTER_EMAIL": "test@example.com",
+            },
+        )
+        self.env.start()
+        self.initial = {"README.md": b"# demo\n"}
+        self.files = {
+            **self.initial,
+            "a-b.txt": b"dash\n",
+            "a/b.txt": b"nested\n",
+            "tests/__init__.py": b"",
+        }
+
+    def tearDown(self):
+        self.env.stop()
+        self._tmp.cleanup()
+
+    def extract(self, files, directories=()) -> Path:
+        stream = io.BytesIO()
+        tar_stream.write_tar(stream, files, directories)
+        stream.seek(0)
+        target = self.tmp / "out"
+        with tarfile.open(fileobj=stream) as tar:
+            tar.extractall(target)
+        return target
+
+    def test_repository_matches_git(self):
+        author, committer = tar_stream.identities()
+        repo = tar_stream.git_repository(
+            [
+                tar_stream.Commit("Initial commit", self.initial),
+                tar_stream.Commit("Initial project setup", self.files),
+            ],
+            "main",
+            author,
+            committer,
+        )
+        project = self.extract({**self.files, **repo}, tar_stream.GIT_DIRS)
+
+        git(project, "fsck", "--strict")
+        self.assertEqual(git(project, "status", "--porcelain"), "")
+        self.assertEqual(git(project, "rev-parse", "--abbrev-ref", "HEAD"), "main")
+        self.assertEqual(
+            git(project, "log", "--format=%s"), "Initial project setup\nInitial commit"
+        )
+
+        reference = self.tmp / "reference"
+        reference.mkdir()
+        git(reference, "init", "-q")
+        for path, data in self.files.items():
+            (reference / path).parent.mkdir(parents=True, exist_ok=True)
+            (reference / path).write_bytes(data)
+        git(reference, "add", ".")
+        self.assertEqual(
+            git(project, "rev-parse", "HEAD^{tree}"), git(reference, "write-tree")
+        )
+
+    def test_parent_directories(self):
+        project = self.extract(self.files)
+        self.assertEqual((project / "a" / "b.txt").read_bytes(), b"nested\n")
+        self.assertTrue((project / "tests").is_dir())
@@ -0,0 +1,70 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from project_setup import template_registry
+from project_setup.template_registry import TemplateRegistry
+from project_setup.templates import BUILTIN_TEMPLATE_DIR, TemplateError
+
+
+class TestTemplateRegistry(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.user_dir = self.tmp / "user"
+        self.index = self.tmp / "index.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _registry(self) -> TemplateRegistry:
+        return TemplateRegistry([self.user_dir, BUILTIN_TEMPLATE_DIR], self.index)
+
+    def _source(self, name: str, description: str) -> Path:
+        src = self.tmp / "sources" / name
+        src.mkdir(parents=True)
+        (src / "template.json").write_text(
+            json.dumps({"name": name, "description": description})
+        )
+        (src / "README.md").write_text("# ${project_name}\n")
+        return src
+
+    def test_index_built_and_persisted(self):
+        names = self._registry().names()
+        self.assertEqual(names, ["cli", "fastapi", "go", "library", "node", "rust"])
+        data = json.loads(self.index.read_text())
+        entry = data["dirs"][str(BUILTIN_TEMPLATE_DIR)]["templates"][0]
+        self.assertIn("sha256", entry)
+        self.assertIn("pyproject.toml", entry["files"])
+
+    def test_listing_uses_index_only(self):
+        self._registry().names()
+        with patch.object(template_registry, "_describe_bundle") as describe:
+            self.assertEqual(len(self._registry().names()), 6)
+        describe.assert_not_called()
+
+    def test_incremental_refresh(self):
+        self._registry().names()
+        registry = self._registry()
+        registry.add(self._source("service", "My service"))
+        with patch.object(
+            template_registry,
+            "_describe_bundle",
+            wraps=template_registry._describe_bundle,
+        ) as describe:
+            templates = self._registry().templates()
+        self.assertEqual(describe.call_count, 1)
+        self.assertEqual(templates["service"]["description"], "My service")
+
+    def test_user_template_overrides_builtin(self):
+        self._registry().add(self._source("cli", "Custom CLI"))
+        registry = self._registry()
+        self.assertEqual(registry.templates()["cli"]["description"], "Custom CLI")
+        with registry.load("cli") as bundle:
+            self.assertEqual(bundle.files(), ["README.md"])
+
+    def test_unknown_template(self):
+        with self.assertRaises(TemplateError):
+            self._registry().resolve("missing")
@@ -0,0 +1,112 @@
+import ast
+import json
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from project_setup.templates import (
+    TemplateBundle,
+    TemplateError,
+    list_templates,
+    materialize,
+    pack_template,
+    package_name_for,
+)
+
+
+class TestTemplates(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _make_source(self) -> Path:
+        src = self.tmp / "source"
+        (src / "src" / "${package_name}").mkdir(parents=True)
+        (src / "template.json").write_text(
+            json.dumps({"name": "demo", "variables": {"project_name": None}})
+        )
+        (src / "README.md").write_text("# ${project_name}\n")
+        (src / "src" / "${package_name}" / "__init__.py").write_text("")
+        (src / "logo.bin").write_bytes(b"\xff\xfe$project_name")
+        return src
+
+    def test_package_name(self):
+        self.assertEqual(package_name_for("My-Project"), "my_project")
+        self.assertEqual(package_name_for("3d tools"), "_3d_tools")
+
+    def test_pack_and_render(self):
+        bundle_path = pack_template(self._make_source(), self.tmp / "demo.zip")
+        dest = self.tmp / "out"
+        with TemplateBundle(bundle_path) as bundle:
+            self.assertEqual(bundle.name, "demo")
+            self.assertIn("src/${package_name}/__init__.py", bundle.files())
+            bundle.render(dest, {"project_name": "my-app", "package_name": "my_app"})
+
+        self.assertEqual((dest / "README.md").read_text(), "# my-app\n")
+        self.assertTrue((dest / "src" / "my_app" / "__init__.py").is_file())
+        self.assertEqual((dest / "logo.bin").read_bytes(), b"\xff\xfe$project_name")
+
+    def test_pack_is_reproducible(self):
+        src = self._make_source()
+        first = pack_template(src, self.tmp / "a.zip").read_bytes()
+        second = pack_template(src, self.tmp / "b.zip").read_bytes()
+        self.assertEqual(first, second)
+
+    def test_missing_variable(self):
+        bundle_path = pack_template(self._make_source(), self.tmp / "demo.zip")
+        with TemplateBundle(bundle_path) as bundle:
+            with self.assertRaises(TemplateError):
+                bundle.render(self.tmp / "out", {})
+
+    def test_path_escape_rejected(self):
+        bundle_path = self.tmp / "evil.zip"
+        with zipfile.ZipFile(bundle_path, "w") as bundle:
+            bundle.writestr("template.json", "{}")
+            bundle.writestr("../escape.txt", "x")
+        with TemplateBundle(bundle_path) as bundle:
+            with self.assertRaises(TemplateError):
+                bundle.render(self.tmp / "out", {})
+        self.assertFalse((self.tmp / "escape.txt").exists())
+
+    def test_builtin_templates(self):
+        self.assertEqual(
+            list_templates(), ["cli", "fastapi", "go", "library", "node", "rust"]
+        )
+        # The language templates are covered by test_languages.
+        for name in ("cli", "fastapi", "library"):
+            dest = self.tmp / name
+            materialize(name, dest, "sample-project")
+            self.assertTrue((dest / "pyproject.toml").is_file())
+            self.assertIn(
+                'name = "sample-project"', (dest / "pyproject.toml").read_text()
+            )
+            self.assertTrue((dest / "src" / "sample_project" / "__init__.py").is_file())
+
+    @unittest.skipIf(sys.version_info < (3, 11), "tomllib is new in 3.11")
+    def test_values_are_escaped_in_quoted_strings(self):
+        import tomllib
+
+        description = 'A "quoted" C:\\path'
+        dest = self.tmp / "library"
+        materialize("library", dest, "sample-project", description)
+        pyproject = tomllib.loads((dest / "pyproject.toml").read_text())
+        self.assertEqual(pyproject["project"]["description"], description)
+        init = (dest / "src" / "sample_project" / "__init__.py").read_text()
+        self.assertEqual(
+            ast.get_docstring(ast.parse(init)), f"sample-project - {description}"
+        )
+        # Markdown takes the value as it is.
+        self.assertIn(description, (dest / "README.md").read_text())
+
+    def test_docstring_without_description(self):
+        for name in ("library", "cli", "fastapi"):
+            with self.subTest(name):
+                dest = self.tmp / name
+                materialize(name, dest, "demo-app")
+                init = (dest / "src" / "demo_app" / "__init__.py").read_text()
+                self.assertEqual(init.splitlines()[0], '"""demo-app"""')
@@ -0,0 +1,45 @@
+from project_setup import venv_backends
+from tests.harness import CommandTestCase
+
+CANDIDATES = ["uv-hardlink", "uv-clone", "uv-copy", "python"]
+
+
+class TestVenvBackends(CommandTestCase):
+    def test_choose(self):
+        choice = venv_backends.choose(CANDIDATES, {})
+        self.assertEqual(choice, ("uv-hardlink", "no timings yet; default order"))
+
+        timings = {"uv-hardlink": [0.9, 1.2, 0.8], "uv-copy": [0.2], "python": [3.0]}
+        choice = venv_backends.choose(CANDIDATES, timings)
+        self.assertEqual(choice.backend, "uv-copy")
+        self.assertIn("0.200s over 1 runs", choice.reason)
+        # Re-sampling takes the least-sampled other backend.
+        self.assertEqual(
+            venv_backends.choose(CANDIDATES, timings, resample=True).backend,
+            "uv-clone",
+        )
+        # Timings of backends that are not installed do not count.
+        self.assertEqual(
+            venv_backends.choose(["uv-hardlink", "python"], timings).backend,
+            "uv-hardlink",
+        )
+
+    def test_create_follows_recorded_timings(self):
+        for _ in range(venv_backends.HISTORY + 2):
+            venv_backends.record(self.tmp, "uv-hardlink", 2.0)
+        venv_backends.record(self.tmp, "python", 0.5)
+        timings = venv_backends.load(self.tmp / "elsewhere" / "on" / "the" / "fs")
+        self.assertEqual(len(timings["uv-hardlink"]), venv_backends.HISTORY)
+
+        venv = self.tmp / "demo" / ".venv"
+        choice = venv_backends.create(venv, CANDIDATES)
+        self.assertEqual(choice.backend, "python")
+        self.assertEqual(self.toolchain.commands("python"), [["-m", "venv", str(venv)]])
+        self.assertEqual(len(venv_backends.load(self.tmp)["python"]), 2)
+
+    def test_create_falls_back(self):
+        self.toolchain.fail("uv", "venv", "--link-mode", "hardlink")
+        venv = self.tmp / ".venv"
+        choice = venv_backends.create(venv, CANDIDATES)
+        self.assertEqual(choice, ("uv-clone", "uv-hardlink failed"))
+        self.assertEqual(list(venv_backends.load(self.tmp)), ["uv-clone"])
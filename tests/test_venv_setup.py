@@ -1,34 +1,82 @@
-import unittest
-from unittest.mock import patch
+from project_setup import venv_backends, venv_setup
+from tests.harness import CommandTestCase
 
 
-class TestVenvSetup(unittest.TestCase):
+class TestVenvSetup(CommandTestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = self.tmp / "demo"
+        self.project.mkdir()
+        self.venv = self.project / ".venv"
+
     def test_uv_creation(self):
-        # Mocking a function that creates venv with uv (when available)
-        pass
+        result = self.invoke("venv-setup", "demo", "--yes")
+        self.assertSucceeded(result)
+        mode = venv_backends.LINK_MODES[0]
+        self.assertEqual(
+            self.toolchain.commands("uv"),
+            [["venv", "--link-mode", mode, str(self.venv)]],
+        )
+        self.assertIn(f"Backend: uv-{mode} (no timings yet", result.stdout)
+        self.assertTrue((self.venv / "pyvenv.cfg").is_file())
+        self.assertEqual((self.project / ".gitignore").read_text(), ".venv/\n")
 
-    @patch("subprocess.run")
-    def test_python_venv_creation(self, mock_run):
-        # Setup
-        mock_run.return_value = (0, None)
-        # Act - call the function being tested
-        # Assert - check the behavior
-        pass
+    def test_python_venv_creation(self):
+        self.toolchain.tools.discard("uv")
+        result = self.invoke("venv-setup", "demo", "--yes")
+        self.assertSucceeded(result)
+        self.assertEqual(self.toolchain.commands("uv"), [])
+        self.assertIn(["-m", "venv", str(self.venv)], self.toolchain.commands("python"))
 
-    def test_gitignore_update(self):
-        # Mocking file reading or writing for .gitignore update
-        pass
+    def test_falls_back_to_python_when_uv_fails(self):
+        self.toolchain.fail("uv", "venv")
+        self.assertSucceeded(self.invoke("venv-setup", "demo", "--yes"))
+        self.assertIn(["-m", "venv", str(self.venv)], self.toolchain.commands("python"))
 
-    def test_existing_venv_handling(self):
-        # Mocking existing venv directory handling
-        pass
+        self.toolchain.fail("python", "-m", "venv", stderr="ensurepip failed")
+        result = self.invoke("venv-setup", "demo", "--yes", "--use-python")
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("Error creating venv: ensurepip failed", result.stderr)
 
-    @patch("subprocess.run")
-    def test_python_venv_creation(self, mock_run):
-        pass
+    def test_explain(self):
+        self.assertSucceeded(self.invoke("venv-setup", "demo", "--yes"))
+        calls = len(self.toolchain.calls)
+        result = self.invoke("venv-setup", "demo", "--explain")
+        self.assertSucceeded(result)
+        self.assertEqual(len(self.toolchain.calls), calls)
+        backend = venv_backends.UV_BACKENDS[0]
+        lines = result.stdout.splitlines()
+        row = next(line for line in lines if line.split()[0] == backend)
+        self.assertEqual(row.split()[1], "1")
+        self.assertIn(f"Choice: {backend} (fastest median", result.stdout)
+
+    def test_requested_backend_missing(self):
+        self.toolchain.tools.discard("uv")
+        result = self.invoke("venv-setup", "demo", "--yes", "--use-uv")
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("uv is not installed", result.stderr)
 
     def test_gitignore_update(self):
-        pass
+        (self.project / ".gitignore").write_text("*.pyc")
+        venv_setup.update_gitignore(self.project)
+        venv_setup.update_gitignore(self.project)
+        self.assertEqual((self.project / ".gitignore").read_text(), "*.pyc\n.venv/\n")
 
     def test_existing_venv_handling(self):
-        pass
+        self.venv.mkdir()
+        result = self.invoke("venv-setup", "demo", input="no\n")
+        self.assertSucceeded(result)
+        self.assertIn("Skipping venv creation", result.stdout)
+        self.assertEqual(self.toolchain.calls, [])
+
+        # --yes recreates it.
+        (self.venv / "stale").touch()
+        self.assertSucceeded(self.invoke("venv-setup", "demo", "--yes"))
+        self.assertFalse((self.venv / "stale").exists())
+        self.assertTrue((self.venv / "pyvenv.cfg").is_file())
+
+    def test_missing_directory(self):
+        result = self.invoke("venv-setup", "missing", "--yes")
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("does not exist", result.stderr)
+        self.assertEqual(self.toolchain.calls, [])
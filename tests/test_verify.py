@@ -0,0 +1,96 @@
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from project_setup import verify
+
+
+def git(project: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=project, check=True, capture_output=True)
+
+
+class TestVerify(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        (self.project / ".vscode").mkdir()
+        (self.project / ".vscode" / "settings.json").write_text('{"a": 1}')
+        git(self.project, "init", "-q")
+        git(self.project, "add", ".")
+        git(
+            self.project,
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@example.com",
+            "commit",
+            "-q",
+            "-m",
+            "init",
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def run_checks(self, **options):
+        results, _ = verify.run_checks(
+            self.project, verify.project_checks(**options)
+        )
+        return {result.name: result for result in results}
+
+    def test_clean_project(self):
+        results = self.run_checks(create_venv=False, git_repo=True, use_pytest=False)
+        self.assertEqual(set(results), {"json", "git-clean"})
+        self.assertTrue(all(r.status == "ok" for r in results.values()))
+
+    def test_json_of_a_clone_is_not_checked(self):
+        # JSONC, as in many tsconfig.json files.
+        (self.project / "tsconfig.json").write_text('{\n  // strict\n}\n')
+        (self.project / ".vscode" / "launch.json").write_text("// none\n{}\n")
+        results = self.run_checks(create_venv=False, git_repo=False, use_pytest=False)
+        self.assertEqual(results["json"].status, "ok")
+        self.assertEqual(results["json"].detail, "1 files parse")
+
+    def test_broken_project(self):
+        (self.project / ".claude").mkdir()
+        (self.project / ".claude" / "settings.json").write_text("{not json")
+        results = self.run_checks(create_venv=True, git_repo=True, use_pytest=False)
+        self.assertEqual(results["json"].status, "failed")
+        self.assertIn(".claude/settings.json", results["json"].detail)
+        self.assertEqual(results["git-clean"].status, "failed")
+        self.assertEqual(results["venv-python"].status, "failed")
+
+    def test_expected_venv_version(self):
+        (self.project / ".venv").mkdir()
+        (self.project / ".venv" / "pyvenv.cfg").write_text(
+            "home = /usr/bin\nversion_info = 3.12.1\n"
+        )
+        self.assertEqual(verify.expected_venv_version(self.project), "3.12.1")
+
+    @unittest.skipIf(verify.pytest_command(Path(".")) is None, "needs pytest")
+    def test_pytest_collect_leaves_tree_unchanged(self):
+        (self.project / "tests").mkdir()
+        (self.project / "tests" / "test_x.py").write_text("def test_x(): pass\n")
+        results = self.run_checks(create_venv=False, git_repo=False, use_pytest=True)
+        self.assertEqual(results["pytest-collect"].status, "ok")
+        self.assertFalse((self.project / ".pytest_cache").exists())
+        self.assertFalse((self.project / "tests" / "__pycache__").exists())
+
+    def test_checks_run_concurrently(self):
+        def slow(project_path):
+            time.sleep(0.2)
+            return "slept"
+
+        def skipped(project_path):
+            raise verify.CheckSkipped("not here")
+
+        checks = [("a", slow), ("b", slow), ("c", slow), ("d", skipped)]
+        results, wall = verify.run_checks(self.project, checks)
+        self.assertEqual(
+            [r.status for r in results], ["ok", "ok", "ok", "skipped"]
+        )
+        self.assertLess(wall, 0.5)
+        self.assertIn("slept", results[0].describe())
+
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+BUILD_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "build_zipapp.py"
+
+
+class TestZipapp(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmp = Path(cls._tmp.name)
+        cls.archive = cls.tmp / "project-setup.pyz"
+        subprocess.run(
+            [sys.executable, str(BUILD_SCRIPT), "-o", str(cls.archive)],
+            check=True,
+            capture_output=True,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def run_archive(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(self.archive), *args],
+            cwd=self.tmp,
+            capture_output=True,
+            text=True,
+            env={
+                **os.environ,
+                "XDG_CACHE_HOME": str(self.tmp / "cache"),
+                "XDG_DATA_HOME": str(self.tmp / "data"),
+            },
+        )
+
+    def test_renders_builtin_templates(self):
+        result = self.run_archive("proj-setup", "demo", "--template", "cli")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        pyproject = (self.tmp / "demo" / "pyproject.toml").read_text()
+        self.assertIn('name = "demo"', pyproject)
+
+        result = self.run_archive("templates")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("fastapi", result.stdout)
+
+    def test_leaves_out_rich(self):
+        with zipfile.ZipFile(self.archive) as archive:
+            top = {name.split("/")[0] for name in archive.namelist()}
+        self.assertIn("project_setup", top)
+        self.assertFalse({"rich", "pygments"} & top)